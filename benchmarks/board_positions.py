@@ -0,0 +1,142 @@
+"""
+Benchmark of detecting units on the board, comparing the whole-frame contour loop get_board_positions used to run
+with the board-region pipeline it runs now.
+
+Run from the repository root: python -m benchmarks.board_positions [--frames DIRECTORY]
+Without recorded frames, synthetic 1600x900 frames with green health bars drawn on the board are used.
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+
+from tft_bot.helpers.capture_helpers import DirectoryCaptureBackend
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.screen_helpers import FIELD_SLOT_Y_POSITIONS
+from tft_bot.helpers.screen_helpers import get_board_positions
+from tft_bot.helpers.screen_helpers import LOWER_GREEN
+from tft_bot.helpers.screen_helpers import MINIMUM_Y_OFFSET
+from tft_bot.helpers.screen_helpers import UPPER_GREEN
+
+
+def get_board_positions_legacy(pixels: numpy.ndarray) -> list[tuple[int, int]]:
+    """
+    Detect units the way get_board_positions used to, over the whole frame.
+
+    Args:
+        pixels: The BGRA pixels of the game window.
+
+    Returns:
+        The x and y coordinates of every unit.
+    """
+    hsv_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
+
+    mask = cv2.inRange(hsv_pixels, LOWER_GREEN, UPPER_GREEN)
+    mask = cv2.erode(mask, None, iterations=2)
+    mask = cv2.dilate(mask, None, iterations=2)
+    mask = cv2.GaussianBlur(mask, (5, 5), 0)
+
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    positions = []
+    for contour in contours:
+        position_x, position_y, width, height = cv2.boundingRect(contour)
+
+        if position_y < int(275 * (10 / 12)) or position_y > int(672 * (10 / 12)):
+            continue
+
+        if (
+            width < int(55 * (10 / 12))
+            or width > int(80 * (10 / 12))
+            or height < int(5 * (10 / 12))
+            or height > int(20 * (10 / 12))
+        ):
+            continue
+
+        position_x = int(position_x + (width / 2))
+        position_y = int(position_y + (height / 2)) + MINIMUM_Y_OFFSET
+        potential_unit_y_positions = FIELD_SLOT_Y_POSITIONS[FIELD_SLOT_Y_POSITIONS > position_y]
+        if len(potential_unit_y_positions) == 0:
+            continue
+
+        positions.append((position_x, int(potential_unit_y_positions.min())))
+
+    return positions
+
+
+def create_synthetic_frame(seed: int) -> numpy.ndarray:
+    """
+    Create a frame with a noisy background and health bars of random sizes, some of them outside the board.
+
+    Args:
+        seed: The seed for the random generators, so runs are comparable.
+
+    Returns:
+        A 1600x900 BGR frame.
+    """
+    generator = numpy.random.default_rng(seed)
+    frame = cv2.GaussianBlur(generator.integers(0, 120, (900, 1600, 3), dtype=numpy.uint8), (9, 9), 0)
+    chooser = random.Random(seed)
+    for _ in range(chooser.randint(0, 12)):
+        position_x = chooser.randrange(0, 1500)
+        position_y = chooser.randrange(150, 700)
+        width = chooser.randint(35, 75)
+        height = chooser.randint(4, 20)
+        cv2.rectangle(frame, (position_x, position_y), (position_x + width, position_y + height), (40, 200, 60), -1)
+    return frame
+
+
+def main() -> None:
+    """
+    Parse the arguments, detect the units of every frame both ways and print the time per frame and agreement.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Board position benchmark")
+    arg_parser.add_argument("--frames", help="A directory of recorded PNG frames of the game.")
+    arg_parser.add_argument("--synthetic-frames", type=int, default=50, help="How many synthetic frames to use.")
+    parsed_args = arg_parser.parse_args()
+
+    if parsed_args.frames:
+        backend = DirectoryCaptureBackend(parsed_args.frames, loop=False)
+        frame_count = len(backend.paths)
+    else:
+        backend = SyntheticCaptureBackend()
+        frame_count = parsed_args.synthetic_frames
+    set_capture_backend(backend)
+
+    legacy_time = 0.0
+    current_time = 0.0
+    agreements = 0
+    for frame_index in range(frame_count):
+        if parsed_args.frames:
+            if frame_index > 0:
+                backend.advance()
+        else:
+            backend.set_frame(create_synthetic_frame(seed=frame_index))
+        pixels = backend.grab(backend.locate_window(""))
+
+        start = time.perf_counter()
+        legacy_positions = get_board_positions_legacy(pixels)
+        legacy_time += time.perf_counter() - start
+
+        # Capture outside of the timing, so only the detection itself is compared.
+        FRAME_SNAPSHOT.invalidate()
+        get_board_positions()
+        start = time.perf_counter()
+        positions = get_board_positions()
+        current_time += time.perf_counter() - start
+
+        agreements += sorted(legacy_positions) == sorted(
+            (position.position_x, position.position_y) for position in positions
+        )
+
+    print(f"whole frame contours: {legacy_time / frame_count * 1000:.2f}ms per frame")
+    print(f"board region arrays: {current_time / frame_count * 1000:.2f}ms per frame")
+    print(f"identical positions: {agreements / frame_count * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
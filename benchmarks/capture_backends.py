@@ -0,0 +1,83 @@
+"""
+Benchmark of the capture cost per grab, comparing a new mss instance per grab (how screen helpers used to capture)
+with the persistent backends in tft_bot.helpers.capture_helpers.
+
+Run from the repository root: python -m benchmarks.capture_backends [--frames DIRECTORY]
+"""
+import argparse
+import time
+
+import mss
+import numpy
+
+from tft_bot.helpers.capture_helpers import CaptureBackend
+from tft_bot.helpers.capture_helpers import DirectoryCaptureBackend
+from tft_bot.helpers.capture_helpers import MssCaptureBackend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+
+
+def _grab_with_new_instance(bounding_box: tuple[int, int, int, int]) -> numpy.ndarray:
+    """
+    Grab a region the way every screen helper used to, with its own short-lived mss instance.
+
+    Args:
+        bounding_box: The absolute region to grab.
+
+    Returns:
+        The pixels of the region as a BGRA array.
+    """
+    with mss.mss() as screenshot_taker:
+        return numpy.array(screenshot_taker.grab(bounding_box))
+
+
+def _time_grabs(grab, bounding_box: tuple[int, int, int, int], iterations: int) -> float:
+    """
+    Time a grab function.
+
+    Args:
+        grab: The function grabbing a bounding box.
+        bounding_box: The region to grab.
+        iterations: How often to grab.
+
+    Returns:
+        The average time per grab in milliseconds.
+    """
+    grab(bounding_box)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        grab(bounding_box)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main() -> None:
+    """
+    Parse the arguments and print the average time per grab of every available backend.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Capture backend benchmark")
+    arg_parser.add_argument("--frames", help="A directory of recorded PNG frames to benchmark the file backend with.")
+    arg_parser.add_argument("--iterations", type=int, default=200, help="How many grabs to time per backend.")
+    arg_parser.add_argument("--width", type=int, default=1920, help="The width of the region to grab.")
+    arg_parser.add_argument("--height", type=int, default=1080, help="The height of the region to grab.")
+    parsed_args = arg_parser.parse_args()
+
+    bounding_box = (0, 0, parsed_args.width, parsed_args.height)
+    backends: dict[str, CaptureBackend] = {
+        "synthetic": SyntheticCaptureBackend(numpy.zeros((parsed_args.height, parsed_args.width, 4), numpy.uint8))
+    }
+    if parsed_args.frames:
+        backends["directory"] = DirectoryCaptureBackend(parsed_args.frames)
+
+    try:
+        new_instance_time = _time_grabs(_grab_with_new_instance, bounding_box, parsed_args.iterations)
+        print(f"mss, new instance per grab: {new_instance_time:.2f}ms")
+        backends["mss, persistent"] = MssCaptureBackend()
+    except mss.exception.ScreenShotError as exc:
+        print(f"Skipping the mss backends, there is no screen to capture: {exc}")
+
+    for name, backend in backends.items():
+        print(f"{name}: {_time_grabs(backend.grab, bounding_box, parsed_args.iterations):.2f}ms")
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark of the memory churn per tick, comparing copying every screenshot into a new array and converting it
+into freshly allocated arrays (how detectors used to ingest frames) with the zero-copy capture and the buffer pool
+of tft_bot.helpers.capture_helpers.
+
+Run from the repository root: python -m benchmarks.frame_buffers [--backend mss] [--ticks 300]
+Every way is run in its own process, so their peak RSS does not influence each other.
+"""
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import cv2
+import mss
+import numpy
+import psutil
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import BUFFER_POOL
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.capture_helpers import MssCaptureBackend
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.screen_helpers import get_board_positions
+from tft_bot.helpers.screen_helpers import get_frame
+from tft_bot.helpers.screen_helpers import LOWER_GREEN
+from tft_bot.helpers.screen_helpers import UPPER_GREEN
+from tft_bot.helpers.viewport import get_viewport
+
+MODES = ("copying", "pooled")
+
+
+def run_copying_tick(backend, bounding_box: tuple[int, int, int, int]) -> None:
+    """
+    Ingest a frame the way detectors used to, copying the screenshot and allocating every converted array.
+
+    Args:
+        backend: The capture backend to grab with.
+        bounding_box: The absolute bounding box of the window.
+    """
+    pixels = numpy.array(backend.grab(bounding_box))
+    cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY)
+    hsv_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
+    mask = cv2.inRange(hsv_pixels, LOWER_GREEN, UPPER_GREEN)
+    mask = cv2.erode(mask, None, iterations=2)
+    mask = cv2.dilate(mask, None, iterations=2)
+    cv2.GaussianBlur(mask, (5, 5), 0)
+
+
+def run_pooled_tick() -> None:
+    """
+    Ingest a frame the way detectors do now, through the shared frame and the buffer pool.
+    """
+    frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+    frame.get_gray()
+    get_board_positions()
+
+
+def measure(mode: str, backend_name: str, ticks: int) -> None:
+    """
+    Run the ticks of one way and print the time, traced allocations and RSS per tick.
+
+    Args:
+        mode: The way to ingest frames, one of MODES.
+        backend_name: The capture backend to use, "mss" or "synthetic".
+        ticks: How many ticks to run.
+    """
+    if backend_name == "mss":
+        backend = MssCaptureBackend()
+        with mss.mss() as screenshot_taker:
+            monitor = screenshot_taker.monitors[1]
+        bounding_box = (monitor["left"], monitor["top"], monitor["left"] + 1920, monitor["top"] + 1080)
+        # Treat the top left 1920x1080 of the primary monitor as the game window.
+        backend.locate_window = lambda window_title: bounding_box
+    else:
+        backend = SyntheticCaptureBackend(
+            frame=numpy.random.default_rng(0).integers(0, 255, (1080, 1920, 3), dtype=numpy.uint8)
+        )
+        bounding_box = (0, 0, 1920, 1080)
+    set_capture_backend(backend)
+    get_viewport(window_title=CONSTANTS["window_titles"]["game"])
+
+    def run_tick():
+        if mode == "copying":
+            run_copying_tick(backend=backend, bounding_box=bounding_box)
+        else:
+            run_pooled_tick()
+
+    process = psutil.Process()
+    # Warm up until the pool holds every buffer it cycles through.
+    for _ in range(BUFFER_POOL.depth + 1):
+        FRAME_SNAPSHOT.invalidate()
+        run_tick()
+    start_rss = process.memory_info().rss
+    peak_rss = start_rss
+    tracemalloc.start()
+    traced_peaks = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        # Drop the frame of the previous tick first, so the next capture is not offset by releasing it.
+        FRAME_SNAPSHOT.invalidate()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run_tick()
+        traced_peaks.append(tracemalloc.get_traced_memory()[1] - traced_before)
+        peak_rss = max(peak_rss, process.memory_info().rss)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    print(
+        f"{mode}: {elapsed / ticks * 1000:.2f}ms per tick, "
+        f"{numpy.mean(traced_peaks) / 2**20:.1f}MiB allocated at most per tick, "
+        f"peak RSS {peak_rss / 2**20:.1f}MiB (+{(peak_rss - start_rss) / 2**20:.1f}MiB during the ticks)"
+    )
+    if mode == "pooled":
+        print(f"pooled: {BUFFER_POOL.allocations} buffers allocated, {BUFFER_POOL.reuses} re-used")
+
+
+def main() -> None:
+    """
+    Parse the arguments and measure every way in its own process, or only the given one.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Frame buffer benchmark")
+    arg_parser.add_argument("--backend", choices=("synthetic", "mss"), default="synthetic", help="What to capture.")
+    arg_parser.add_argument("--ticks", type=int, default=300, help="How many ticks to run per way.")
+    arg_parser.add_argument("--mode", choices=MODES, help="Only measure this way, in this process.")
+    parsed_args = arg_parser.parse_args()
+
+    if parsed_args.mode:
+        measure(mode=parsed_args.mode, backend_name=parsed_args.backend, ticks=parsed_args.ticks)
+        return
+
+    for mode in MODES:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.frame_buffers",
+                "--backend",
+                parsed_args.backend,
+                "--ticks",
+                str(parsed_args.ticks),
+                "--mode",
+                mode,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark of looking up noisy OCR results of champion names, comparing the linear SequenceMatcher scan
+valid_champion used to do with the fuzzy index of tft_bot.helpers.fuzzy_helpers.
+
+Run from the repository root: python -m benchmarks.fuzzy_matching [--samples 5000]
+"""
+import argparse
+from difflib import SequenceMatcher
+import random
+import string
+import time
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.fuzzy_helpers import get_fuzzy_index
+from tft_bot.helpers.screen_helpers import get_champion_names
+
+# Characters Tesseract commonly confuses with each other in the champion name font.
+CONFUSIONS = {"l": "i1", "i": "l1", "o": "0c", "n": "m", "m": "n", "e": "c", "r": "n", "t": "f"}
+
+
+def scan_linearly(champion: str, valid_champions: list[str]) -> str | None:
+    """
+    Look up an OCR result the way valid_champion used to.
+
+    Args:
+        champion: The OCR result.
+        valid_champions: The names to look up.
+
+    Returns:
+        The first matching name or None.
+    """
+    return next(
+        (
+            valid_name
+            for valid_name in valid_champions
+            if valid_name in champion or SequenceMatcher(a=valid_name, b=champion).ratio() >= 0.7
+        ),
+        None,
+    )
+
+
+def create_noisy_reading(chooser: random.Random, name: str) -> str:
+    """
+    Create an OCR result of a name, with confused, dropped and added characters or plain garbage.
+
+    Args:
+        chooser: The random generator to use.
+        name: The name that was shown.
+
+    Returns:
+        The noisy OCR result.
+    """
+    if chooser.random() < 0.15:
+        return "".join(chooser.choices(string.ascii_lowercase, k=chooser.randint(0, 12)))
+
+    characters = []
+    for character in name:
+        roll = chooser.random()
+        if roll < 0.1 and character in CONFUSIONS:
+            characters.append(chooser.choice(CONFUSIONS[character]))
+        elif roll < 0.15:
+            continue
+        else:
+            characters.append(character)
+        if chooser.random() < 0.05:
+            characters.append(chooser.choice(string.ascii_lowercase))
+    return "".join(characters)
+
+
+def main() -> None:
+    """
+    Parse the arguments, look up every noisy reading both ways and print the time per lookup and agreement.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Fuzzy matching benchmark")
+    arg_parser.add_argument("--samples", type=int, default=5000, help="How many noisy readings to look up.")
+    parsed_args = arg_parser.parse_args()
+
+    wanted_traits = tuple(CONSTANTS["game"]["champions"]["trait"])
+    valid_champions = list(get_champion_names(wanted_traits))
+    chooser = random.Random(0)
+    readings = [create_noisy_reading(chooser, chooser.choice(valid_champions)) for _ in range(parsed_args.samples)]
+
+    start = time.perf_counter()
+    scanned = [scan_linearly(reading, valid_champions) for reading in readings]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fuzzy_index = get_fuzzy_index(tuple(valid_champions))
+    indexed = [fuzzy_index.match(reading) for reading in readings]
+    index_time = time.perf_counter() - start
+
+    agreements = sum(scanned_name == indexed_name for scanned_name, indexed_name in zip(scanned, indexed))
+    print(f"linear scan: {scan_time / len(readings) * 1_000_000:.1f}us per lookup")
+    print(f"fuzzy index: {index_time / len(readings) * 1_000_000:.1f}us per lookup (including building the index)")
+    print(f"identical results: {agreements / len(readings) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
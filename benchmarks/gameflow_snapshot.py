@@ -0,0 +1,87 @@
+"""
+Benchmark of the requests the orchestrator makes to the League client, comparing a request per state check
+(how LCUIntegration used to answer every check) with the gameflow snapshot re-using states within its TTL.
+
+Run from the repository root: python -m benchmarks.gameflow_snapshot [--passes 20] [--interval 0.5] [--ttl 1.0]
+Both ways poll the stand-in of benchmarks.lcu_stand_in, without subscribing to its events.
+"""
+import argparse
+import time
+
+from benchmarks.lcu_stand_in import StandInLcu
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import LOBBY_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
+from tft_bot.league_api.league_api_integration import LCUIntegration
+from tft_bot.league_api.league_api_integration import TFT_NORMAL_GAME_QUEUE_ID
+
+
+def run_queue_pass(integration: LCUIntegration) -> None:
+    """
+    Check the states one pass of the queue loop checks while searching for a match.
+
+    Args:
+        integration: The integration to check with.
+    """
+    integration.client_connected()
+    integration.session_expired()
+    integration.in_game()
+    if integration.in_queue():
+        integration.found_queue()
+
+
+def run_game_pass(integration: LCUIntegration) -> None:
+    """
+    Check the states one pass of the in-game loop checks through check_if_post_game.
+
+    Args:
+        integration: The integration to check with.
+    """
+    if integration.in_game():
+        integration.should_reconnect()
+        integration.session_expired()
+    integration.should_reconnect()
+
+
+def main() -> None:
+    """
+    Parse the arguments, run the passes of every loop both ways and print the requests and time per pass.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Gameflow snapshot benchmark")
+    arg_parser.add_argument("--passes", type=int, default=20, help="How many passes to run per loop and way.")
+    arg_parser.add_argument("--interval", type=float, default=0.5, help="The seconds between passes.")
+    arg_parser.add_argument("--ttl", type=float, default=1.0, help="The TTL of the snapshot.")
+    parsed_args = arg_parser.parse_args()
+
+    stand_in = StandInLcu()
+    stand_in.start()
+    stand_in.set_state(LOBBY_URI, {"gameConfig": {"queueId": TFT_NORMAL_GAME_QUEUE_ID}})
+    integration = LCUIntegration()
+
+    for loop, run_pass, session, search_state in (
+        ("queue", run_queue_pass, {"phase": "Matchmaking"}, {"searchState": "Searching"}),
+        ("in-game", run_game_pass, {"phase": "InProgress"}, {"searchState": "Invalid"}),
+    ):
+        stand_in.set_state(GAMEFLOW_SESSION_URI, session)
+        stand_in.set_state(SEARCH_STATE_URI, search_state)
+        for way, ttl in (("per check", 0.0), ("snapshot", parsed_args.ttl)):
+            integration.set_connection(url=stand_in.url, auth_token="stand-in")
+            integration.gameflow.ttl = ttl
+            requests_before = stand_in.get_request_count()
+            check_time = 0.0
+            for _ in range(parsed_args.passes):
+                start = time.perf_counter()
+                run_pass(integration)
+                check_time += time.perf_counter() - start
+                time.sleep(parsed_args.interval)
+            requests = stand_in.get_request_count() - requests_before
+            print(
+                f"{loop} loop, {way}: {requests / parsed_args.passes:.2f} requests per pass, "
+                f"{check_time / parsed_args.passes * 1000:.2f}ms checking per pass"
+            )
+
+    stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark of reading the gold the way the default economy mode does every iteration (three gold_at_least checks
+with inputs in between), comparing reading it from the screen with reading it from the live client API.
+
+Run from the repository root: python -m benchmarks.gold_provider [--ticks 100]
+The screen shows one of the gold captures, or noise when it is unreadable and no gold capture matches.
+The live client is the stand-in of benchmarks.live_client_snapshot.
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+
+from benchmarks.live_client_snapshot import StandInLiveClient
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.gold_provider import gold_at_least
+from tft_bot.helpers.gold_provider import GOLD_PROVIDER
+from tft_bot.helpers.screen_helpers import GOLD_REGION
+from tft_bot.league_api.league_api_integration import GameClientIntegration
+
+WAYS = ("screen", "screen, unreadable", "live client")
+
+
+def create_frame(gold: int, readable: bool, generator: numpy.random.Generator) -> numpy.ndarray:
+    """
+    Create a frame of the game showing an amount of gold.
+
+    Args:
+        gold: The amount of gold to show, there has to be a capture of it.
+        readable: Whether to show the capture, else the gold display is noise.
+        generator: The random generator for the noise.
+
+    Returns:
+        A 1920x1080 BGR frame.
+    """
+    frame = generator.integers(0, 60, (1080, 1920, 3), dtype=numpy.uint8)
+    if readable:
+        capture = cv2.imread(CONSTANTS["game"]["gold"][str(gold)])
+        position_x, position_y = GOLD_REGION[:2]
+        frame[position_y : position_y + capture.shape[0], position_x : position_x + capture.shape[1]] = capture
+    return frame
+
+
+def main() -> None:
+    """
+    Parse the arguments, run the iterations every way and print the time per iteration and the correct checks.
+    A check is correct if it matches the gold of the live client, which the screen lags behind now and then.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Gold provider benchmark")
+    arg_parser.add_argument("--ticks", type=int, default=100, help="How many iterations to run per way.")
+    parsed_args = arg_parser.parse_args()
+
+    gold_amounts = [int(amount) for amount in CONSTANTS["game"]["gold"]]
+    stand_in = StandInLiveClient()
+    stand_in.start()
+    integration = GameClientIntegration(url=stand_in.url)
+    backend = SyntheticCaptureBackend()
+    set_capture_backend(backend)
+
+    for way in WAYS:
+        if way == "live client":
+            GOLD_PROVIDER.set_api_reader(integration.get_gold, invalidate=integration.live_data.invalidate)
+        else:
+            GOLD_PROVIDER.set_api_reader(None)
+        chooser = random.Random(0)
+        generator = numpy.random.default_rng(0)
+        requests_before = stand_in.get_request_count()
+        correct = 0
+        elapsed = 0.0
+        for _ in range(parsed_args.ticks):
+            gold = chooser.choice(gold_amounts)
+            backend.set_frame(create_frame(gold=gold, readable=way != "screen, unreadable", generator=generator))
+            # Every tenth iteration the screen lags behind the live client, like while the gold display animates.
+            actual_gold = gold + 2 if chooser.random() < 0.1 else gold
+            stand_in.active_player["currentGold"] = float(actual_gold)
+
+            start = time.perf_counter()
+            FRAME_SNAPSHOT.invalidate()
+            integration.live_data.invalidate()
+            checks = []
+            for amount in (3, 4, 5):
+                checks.append(gold_at_least(amount) == (actual_gold >= amount))
+                # The input in between spends no gold here, but the next check cannot know that, like click_helpers.
+                FRAME_SNAPSHOT.invalidate()
+                GOLD_PROVIDER.invalidate()
+            elapsed += time.perf_counter() - start
+            correct += sum(checks)
+
+        print(
+            f"{way}: {elapsed / parsed_args.ticks * 1000:.2f}ms per iteration, "
+            f"{correct / (parsed_args.ticks * 3) * 100:.1f}% of checks correct, "
+            f"{(stand_in.get_request_count() - requests_before) / parsed_args.ticks:.2f} requests per iteration"
+        )
+
+    GOLD_PROVIDER.log_statistics()
+    statistics = GOLD_PROVIDER.statistics
+    print(f"live client: {statistics.disagreements} of {statistics.cross_checks} cross-checks disagreed")
+    stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Calibration of the item slot threshold, printing how much the pixels of every item slot vary in recorded frames,
+to check that no item falls below ITEM_EMPTY_DEVIATION, under which slots are taken as empty without hovering.
+
+Run from the repository root: python -m benchmarks.item_slots --frames DIRECTORY [--labels FILE]
+The frames are PNG captures of the game window at any supported size, like 1920x1080 or 1600x900.
+The labels are a JSON object mapping the file name of a frame to the indices of its slots that hold an item.
+"""
+import argparse
+import json
+import os
+
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import DirectoryCaptureBackend
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.screen_helpers import get_frame
+from tft_bot.helpers.screen_helpers import get_item_slot_deviations
+from tft_bot.helpers.screen_helpers import ITEM_EMPTY_DEVIATION
+from tft_bot.helpers.viewport import get_viewport
+
+
+def print_separations(separations: dict[tuple[int, int], tuple[list[float], list[float]]]) -> None:
+    """
+    Print how well the threshold separates empty slots from items, per window size.
+
+    Args:
+        separations: The deviations of the empty and of the occupied slots, per window size.
+    """
+    print(f"Threshold: empty at most {ITEM_EMPTY_DEVIATION}, every other slot is hovered")
+    for (width, height), (empty_deviations, occupied_deviations) in sorted(separations.items()):
+        slot_deviations = empty_deviations + occupied_deviations
+        hovered = sum(deviation > ITEM_EMPTY_DEVIATION for deviation in slot_deviations)
+        # Only items taken as empty are missed, empty slots that are hovered just show no tooltip.
+        missed = sum(deviation <= ITEM_EMPTY_DEVIATION for deviation in occupied_deviations)
+        print(
+            f"{width}x{height}: empty slots up to {max(empty_deviations, default=0.0):.1f}, "
+            f"items from {min(occupied_deviations, default=float('inf')):.1f}, "
+            f"{hovered} of {len(slot_deviations)} slots hovered, {missed} items missed"
+        )
+
+
+def main() -> None:
+    """
+    Parse the arguments, print the slot deviations of every frame and, with labels, the separation per window size.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Item slot calibration")
+    arg_parser.add_argument("--frames", required=True, help="A directory of recorded PNG frames of the game.")
+    arg_parser.add_argument("--labels", help="A JSON file mapping frame file names to their occupied slot indices.")
+    parsed_args = arg_parser.parse_args()
+
+    labels = {}
+    if parsed_args.labels:
+        with open(parsed_args.labels, encoding="utf-8") as labels_file:
+            labels = json.load(labels_file)
+
+    backend = DirectoryCaptureBackend(parsed_args.frames, loop=False)
+    set_capture_backend(backend)
+    window_title = CONSTANTS["window_titles"]["game"]
+    separations: dict[tuple[int, int], tuple[list[float], list[float]]] = {}
+    for frame_index, path in enumerate(backend.paths):
+        if frame_index > 0:
+            backend.advance()
+        # Recorded frames may differ in size, so the window is located again for every one of them.
+        get_viewport(window_title=window_title).invalidate()
+        frame = get_frame(window_title=window_title)
+        deviations = get_item_slot_deviations(frame=frame)
+        file_name = os.path.basename(path)
+        print(f"{file_name} ({frame.get_width()}x{frame.get_height()}): {numpy.round(deviations, 1).tolist()}")
+        if file_name in labels:
+            occupied = numpy.zeros(len(deviations), dtype=bool)
+            occupied[labels[file_name]] = True
+            empty_deviations, occupied_deviations = separations.setdefault(
+                (frame.get_width(), frame.get_height()), ([], [])
+            )
+            empty_deviations.extend(deviations[~occupied].tolist())
+            occupied_deviations.extend(deviations[occupied].tolist())
+
+    print_separations(separations)
+
+
+if __name__ == "__main__":
+    main()
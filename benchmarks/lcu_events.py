@@ -0,0 +1,130 @@
+"""
+Benchmark of noticing League client state changes, comparing polling the endpoints between sleeps
+(how the queue and end of match loops used to wait) with waiting for the changes pushed over the LCU websocket.
+
+Run from the repository root: python -m benchmarks.lcu_events [--trials 5]
+Both ways run against the stand-in of benchmarks.lcu_stand_in, which changes the state after a random delay.
+"""
+import argparse
+import random
+import threading
+import time
+
+from benchmarks.lcu_stand_in import StandInLcu
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import LOBBY_URI
+from tft_bot.league_api.lcu_events import READY_CHECK_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
+from tft_bot.league_api.league_api_integration import LCUIntegration
+from tft_bot.league_api.league_api_integration import TFT_NORMAL_GAME_QUEUE_ID
+
+
+def wait_for_match(integration: LCUIntegration) -> None:
+    """
+    Wait for a found match the way the queue loop does.
+
+    Args:
+        integration: The integration to check with.
+    """
+    while not integration.found_queue():
+        integration.wait_for_event(timeout=3, uris=(SEARCH_STATE_URI, READY_CHECK_URI, GAMEFLOW_SESSION_URI))
+
+
+def wait_for_game_end(integration: LCUIntegration) -> None:
+    """
+    Wait for the game to end the way end_match does.
+
+    Args:
+        integration: The integration to check with.
+    """
+    while integration.in_game():
+        integration.wait_for_event(timeout=1, uris=(GAMEFLOW_SESSION_URI,))
+
+
+def run_trial(stand_in: StandInLcu, integration: LCUIntegration, scenario: str, delay: float) -> tuple[float, int]:
+    """
+    Change the state after a delay and measure how long the integration takes to notice.
+
+    Args:
+        stand_in: The stand-in League client.
+        integration: The integration to notice the change with.
+        scenario: "match found" or "game ended".
+        delay: The amount of seconds after which the state changes.
+
+    Returns:
+        The latency between the change and noticing it, and how many requests were made while waiting.
+    """
+    stand_in.set_state(LOBBY_URI, {"gameConfig": {"queueId": TFT_NORMAL_GAME_QUEUE_ID}})
+    changed_at = []
+    if scenario == "match found":
+        stand_in.set_state(GAMEFLOW_SESSION_URI, {"phase": "Matchmaking"})
+        stand_in.set_state(READY_CHECK_URI, None)
+        stand_in.set_state(SEARCH_STATE_URI, {"searchState": "Searching"})
+
+        def change_state():
+            changed_at.append(time.perf_counter())
+            stand_in.set_state(READY_CHECK_URI, {"playerResponse": "None"})
+            stand_in.set_state(SEARCH_STATE_URI, {"searchState": "Found"})
+
+        wait = wait_for_match
+    else:
+        stand_in.set_state(SEARCH_STATE_URI, {"searchState": "Invalid"})
+        stand_in.set_state(GAMEFLOW_SESSION_URI, {"phase": "InProgress"})
+
+        def change_state():
+            changed_at.append(time.perf_counter())
+            stand_in.set_state(GAMEFLOW_SESSION_URI, {"phase": "EndOfGame"})
+
+        wait = wait_for_game_end
+
+    # Let the pushed setup settle and forget the polled states of the previous trial,
+    # so waiting starts from the state it is meant to.
+    time.sleep(0.1)
+    integration.gameflow.invalidate()
+    requests_before = stand_in.get_request_count()
+    timer = threading.Timer(delay, change_state)
+    timer.start()
+    wait(integration)
+    noticed_at = time.perf_counter()
+    timer.join()
+    return noticed_at - changed_at[0], stand_in.get_request_count() - requests_before
+
+
+def main() -> None:
+    """
+    Parse the arguments, run every scenario both ways and print the latency and requests per trial.
+    """
+    arg_parser = argparse.ArgumentParser(prog="LCU event benchmark")
+    arg_parser.add_argument("--trials", type=int, default=5, help="How many state changes to notice per scenario.")
+    parsed_args = arg_parser.parse_args()
+
+    stand_in = StandInLcu()
+    stand_in.start()
+    chooser = random.Random(0)
+    delays = [chooser.uniform(0.5, 3.0) for _ in range(parsed_args.trials)]
+
+    for mode in ("polling", "events"):
+        integration = LCUIntegration()
+        integration.set_connection(url=stand_in.url, auth_token="stand-in")
+        if mode == "events" and not integration.subscribe_to_events():
+            print("events: could not subscribe, is websocket-client installed?")
+            continue
+
+        for scenario in ("match found", "game ended"):
+            results = [
+                run_trial(stand_in=stand_in, integration=integration, scenario=scenario, delay=delay)
+                for delay in delays
+            ]
+            latencies = sorted(latency for latency, _ in results)
+            print(
+                f"{mode}, {scenario}: {sum(latencies) / len(latencies) * 1000:.1f}ms mean latency, "
+                f"{latencies[-1] * 1000:.1f}ms worst, "
+                f"{sum(requests for _, requests in results) / len(results):.1f} requests per change"
+            )
+        integration.set_connection(url=stand_in.url, auth_token="stand-in")
+
+    stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
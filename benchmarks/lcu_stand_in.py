@@ -0,0 +1,300 @@
+"""
+A stand-in for the API of the League client, serving the lobby, queue and gameflow endpoints over plain HTTP
+and pushing their changes over a WAMP websocket like the client does, so the integration can be exercised offline.
+
+Run from the repository root: python -m benchmarks.lcu_stand_in [--port 2998]
+Point LCUIntegration.set_connection at "http://127.0.0.1:<port>" with any auth token.
+"""
+import argparse
+import base64
+import hashlib
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import struct
+import threading
+
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import get_event_name
+from tft_bot.league_api.lcu_events import LOBBY_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
+from tft_bot.league_api.lcu_events import WAMP_EVENT
+from tft_bot.league_api.lcu_events import WAMP_SUBSCRIBE
+
+# The queue type the integration creates lobbies of, the stand-in does not depend on the integration itself.
+TFT_NORMAL_GAME_QUEUE_ID = 1090
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+class _WebSocketClient:
+    """
+    A websocket connected to the stand-in, with the events it subscribed to.
+    """
+
+    def __init__(self, handler: BaseHTTPRequestHandler):
+        self.handler = handler
+        self.subscriptions: set[str] = set()
+        self._lock = threading.Lock()
+
+    def send(self, opcode: int, payload: bytes) -> None:
+        """
+        Send one unmasked frame.
+
+        Args:
+            opcode: The opcode of the frame.
+            payload: The payload of the frame.
+        """
+        if len(payload) < 126:
+            header = struct.pack("!BB", 0x80 | opcode, len(payload))
+        elif len(payload) < 2**16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, len(payload))
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, len(payload))
+        with self._lock:
+            self.handler.wfile.write(header + payload)
+            self.handler.wfile.flush()
+
+    def receive(self) -> tuple[int, bytes]:
+        """
+        Receive one masked frame.
+
+        Returns:
+            The opcode and the unmasked payload of the frame.
+        """
+        first_byte, second_byte = struct.unpack("!BB", self.handler.rfile.read(2))
+        length = second_byte & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", self.handler.rfile.read(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", self.handler.rfile.read(8))
+        mask = self.handler.rfile.read(4) if second_byte & 0x80 else b"\0\0\0\0"
+        payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(self.handler.rfile.read(length)))
+        return first_byte & 0x0F, payload
+
+
+class StandInLcu:
+    """
+    Holds the state of every endpoint, serves it and pushes every change to the subscribed websockets.
+    """
+
+    def __init__(self, port: int = 0):
+        """
+        Args:
+            port: The port to listen at. Defaults to 0, meaning any free one.
+        """
+        self._lock = threading.Lock()
+        self._states: dict[str, dict | str | None] = {
+            "/riotclient/ux-state": "ShowMain",
+            "/lol-gameflow/v1/availability": {"isAvailable": True},
+            "/lol-login/v1/session": {"error": None, "puuid": "stand-in"},
+        }
+        self._clients: list[_WebSocketClient] = []
+        self.requests: dict[str, int] = {}
+        self.bytes_served = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        The URL the stand-in serves at.
+        """
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> None:
+        """
+        Serve on a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="lcu_stand_in", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving and close every websocket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            try:
+                client.send(OPCODE_CLOSE, b"")
+            except OSError:
+                pass
+
+    def set_state(self, uri: str, data: dict | str | None) -> None:
+        """
+        Change the state of an endpoint and push the change.
+
+        Args:
+            uri: The endpoint.
+            data: The new state, None to delete the resource.
+        """
+        with self._lock:
+            previous_data = self._states.get(uri)
+            self._states[uri] = data
+            clients = [client for client in self._clients if get_event_name(uri) in client.subscriptions]
+
+        if data is None:
+            event_type = "Delete"
+        else:
+            event_type = "Create" if previous_data is None else "Update"
+        message = json.dumps([WAMP_EVENT, get_event_name(uri), {"data": data, "eventType": event_type, "uri": uri}])
+        for client in clients:
+            try:
+                client.send(OPCODE_TEXT, message.encode())
+            except OSError:
+                pass
+
+    def get_request_count(self) -> int:
+        """
+        Get how many HTTP requests were served for states.
+
+        Returns:
+            The amount of requests.
+        """
+        with self._lock:
+            return sum(self.requests.values())
+
+    def _get_data(self, path: str) -> dict | str | None:
+        """
+        Get the data to answer a GET with. Called with the lock held.
+
+        Args:
+            path: The requested path, including any query.
+
+        Returns:
+            The data or None if the path has no resource.
+        """
+        return self._states.get(path)
+
+    def _serve_state(self, handler: BaseHTTPRequestHandler) -> None:
+        """
+        Answer a GET with the state of the endpoint, 404 if it has no resource.
+
+        Args:
+            handler: The handler of the request.
+        """
+        with self._lock:
+            self.requests[handler.path] = self.requests.get(handler.path, 0) + 1
+            data = self._get_data(handler.path)
+
+        if data is None:
+            handler.send_response(404)
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+
+        body = json.dumps(data).encode()
+        with self._lock:
+            self.bytes_served += len(body)
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _serve_websocket(self, handler: BaseHTTPRequestHandler) -> None:
+        """
+        Upgrade a request to a websocket and handle subscriptions until it closes.
+
+        Args:
+            handler: The handler of the request.
+        """
+        accept = base64.b64encode(
+            hashlib.sha1((handler.headers["Sec-WebSocket-Key"] + WEBSOCKET_GUID).encode()).digest()
+        ).decode()
+        handler.send_response(101)
+        handler.send_header("Upgrade", "websocket")
+        handler.send_header("Connection", "Upgrade")
+        handler.send_header("Sec-WebSocket-Accept", accept)
+        handler.end_headers()
+        handler.close_connection = True
+
+        client = _WebSocketClient(handler)
+        with self._lock:
+            self._clients.append(client)
+        try:
+            while True:
+                opcode, payload = client.receive()
+                if opcode == OPCODE_CLOSE:
+                    client.send(OPCODE_CLOSE, b"")
+                    break
+                if opcode == OPCODE_PING:
+                    client.send(OPCODE_PONG, payload)
+                elif opcode == OPCODE_TEXT:
+                    message = json.loads(payload)
+                    if message[0] == WAMP_SUBSCRIBE:
+                        with self._lock:
+                            client.subscriptions.add(message[1])
+        except (OSError, struct.error, ValueError):
+            pass
+        finally:
+            with self._lock:
+                self._clients.remove(client)
+
+    def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+        """
+        Create the request handler class bound to this stand-in.
+
+        Returns:
+            The handler class.
+        """
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Routes websocket upgrades and state requests to the stand-in.
+            """
+
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, with Nagle every response would wait for a delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                if self.headers.get("Upgrade", "").lower() == "websocket":
+                    stand_in._serve_websocket(self)  # pylint: disable=protected-access
+                else:
+                    stand_in._serve_state(self)  # pylint: disable=protected-access
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            do_DELETE = do_POST
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    """
+    Parse the arguments and serve until interrupted.
+    """
+    arg_parser = argparse.ArgumentParser(prog="LCU stand-in")
+    arg_parser.add_argument("--port", type=int, default=2998, help="The port to listen at.")
+    parsed_args = arg_parser.parse_args()
+
+    stand_in = StandInLcu(port=parsed_args.port)
+    stand_in.set_state(GAMEFLOW_SESSION_URI, {"phase": "Lobby"})
+    stand_in.set_state(LOBBY_URI, {"gameConfig": {"queueId": TFT_NORMAL_GAME_QUEUE_ID}})
+    stand_in.set_state(SEARCH_STATE_URI, {"searchState": "Invalid"})
+    print(f"Serving a stand-in League client at {stand_in.url}, press Ctrl+C to stop")
+    stand_in.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Benchmark of the requests a game loop iteration makes to the live client, comparing a request per check
+(how GameClientIntegration used to answer is_dead, get_level and game_loaded) with the per-iteration snapshot
+of /liveclientdata/allgamedata and the incremental event reads.
+
+Run from the repository root: python -m benchmarks.live_client_snapshot [--ticks 200] [--events 40]
+Both ways poll a stand-in of the live client, built on the one of benchmarks.lcu_stand_in.
+"""
+import argparse
+import random
+import time
+from urllib.parse import parse_qs
+
+import requests
+
+from benchmarks.lcu_stand_in import StandInLcu
+from tft_bot.league_api.league_api_integration import GameClientIntegration
+from tft_bot.league_api.live_client_snapshot import ALL_GAME_DATA_URI
+from tft_bot.league_api.live_client_snapshot import EVENT_DATA_URI
+
+ACTIVE_PLAYER_URI = "/liveclientdata/activeplayer"
+
+
+class StandInLiveClient(StandInLcu):
+    """
+    Serves the live client data of a running game with eight players and a growing list of events.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events: list[dict] = []
+        self.active_player = {
+            "championStats": {"currentHealth": 100.0, "maxHealth": 100.0},
+            "currentGold": 0.0,
+            "level": 1,
+            "summonerName": "stand-in",
+        }
+
+    def add_event(self, name: str) -> None:
+        """
+        Add an event to the game.
+
+        Args:
+            name: The name of the event.
+        """
+        with self._lock:
+            self.events.append({"EventID": len(self.events), "EventName": name, "EventTime": len(self.events) * 30.0})
+
+    def _get_data(self, path: str) -> dict | str | None:
+        uri, _, query = path.partition("?")
+        if uri == EVENT_DATA_URI:
+            first_event_id = int(parse_qs(query).get("eventID", ["0"])[0])
+            return {"Events": [event for event in self.events if event["EventID"] >= first_event_id]}
+        if uri == ACTIVE_PLAYER_URI:
+            return self.active_player
+        if uri == ALL_GAME_DATA_URI:
+            return {
+                "activePlayer": self.active_player,
+                "allPlayers": [
+                    {"summonerName": f"player {index}", "level": 1, "isDead": False, "items": [], "scores": {}}
+                    for index in range(8)
+                ],
+                "events": {"Events": list(self.events)},
+                "gameData": {"gameMode": "TFT", "gameTime": len(self.events) * 30.0, "mapName": "Map22"},
+            }
+        return super()._get_data(path)
+
+
+class LegacyGameClientChecks:
+    """
+    The checks the way GameClientIntegration used to do them, one request each.
+    """
+
+    def __init__(self, url: str):
+        """
+        Args:
+            url: The URL of the live client.
+        """
+        self._url = url
+        self._session = requests.Session()
+
+    def game_loaded(self) -> bool:
+        """
+        Check if the game has loaded, reading every event.
+
+        Returns:
+            True if there is any event, False if not.
+        """
+        return len(self._session.get(f"{self._url}{EVENT_DATA_URI}").json()["Events"]) > 0
+
+    def is_dead(self) -> bool:
+        """
+        Check if the active player has no health left.
+
+        Returns:
+            True if dead, False if not.
+        """
+        return self._session.get(f"{self._url}{ACTIVE_PLAYER_URI}").json()["championStats"]["currentHealth"] <= 0.0
+
+    def get_level(self) -> int:
+        """
+        Get the level of the active player.
+
+        Returns:
+            The level.
+        """
+        return self._session.get(f"{self._url}{ACTIVE_PLAYER_URI}").json().get("level", 0)
+
+
+def main() -> None:
+    """
+    Parse the arguments, run the loading and game loop checks both ways and print the requests and bytes per check.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Live client snapshot benchmark")
+    arg_parser.add_argument("--ticks", type=int, default=200, help="How many game loop iterations to run per way.")
+    arg_parser.add_argument("--events", type=int, default=40, help="How many events the game has at most.")
+    parsed_args = arg_parser.parse_args()
+
+    for way in ("per check", "snapshot"):
+        stand_in = StandInLiveClient()
+        stand_in.start()
+        chooser = random.Random(0)
+        if way == "per check":
+            checks = LegacyGameClientChecks(url=stand_in.url)
+        else:
+            checks = GameClientIntegration(url=stand_in.url)
+            checks.live_data.reset()
+
+        # Loading: the loading loop checks for the first event, then the game adds events as it goes.
+        check_time = 0.0
+        for poll in range(parsed_args.ticks):
+            if poll % (parsed_args.ticks // parsed_args.events) == 0 and len(stand_in.events) < parsed_args.events:
+                stand_in.add_event("GameStart" if not stand_in.events else "MinionsSpawning")
+            start = time.perf_counter()
+            checks.game_loaded()
+            check_time += time.perf_counter() - start
+        print(
+            f"{way}, event polling: {stand_in.get_request_count() / parsed_args.ticks:.2f} requests, "
+            f"{stand_in.bytes_served / parsed_args.ticks:.0f} bytes, "
+            f"{check_time / parsed_args.ticks * 1000:.2f}ms per poll"
+        )
+
+        # Game loop: check_if_game_complete checks the health, the economy mode the level,
+        # and about every tenth iteration the board clean-up checks the level again.
+        requests_before = stand_in.get_request_count()
+        bytes_before = stand_in.bytes_served
+        check_time = 0.0
+        for tick in range(parsed_args.ticks):
+            stand_in.active_player["level"] = 1 + tick * 8 // parsed_args.ticks
+            start = time.perf_counter()
+            if way == "snapshot":
+                checks.live_data.invalidate()
+            checks.is_dead()
+            checks.get_level()
+            if chooser.random() < 0.1:
+                checks.get_level()
+            check_time += time.perf_counter() - start
+        print(
+            f"{way}, game loop: {(stand_in.get_request_count() - requests_before) / parsed_args.ticks:.2f} requests, "
+            f"{(stand_in.bytes_served - bytes_before) / parsed_args.ticks:.0f} bytes, "
+            f"{check_time / parsed_args.ticks * 1000:.2f}ms per iteration"
+        )
+        stand_in.stop()
+
+
+if __name__ == "__main__":
+    main()
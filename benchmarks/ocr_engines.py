@@ -0,0 +1,85 @@
+"""
+Benchmark of the latency per OCR read, comparing pytesseract (a tesseract.exe process per read)
+with the persistent in-process tesserocr engines of tft_bot.helpers.ocr_helpers.
+
+Run from the repository root: python -m benchmarks.ocr_engines [--tesseract PATH]
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+from pytesseract import pytesseract
+
+from tft_bot.helpers.ocr_helpers import DIGITS
+from tft_bot.helpers.ocr_helpers import OcrService
+from tft_bot.helpers.ocr_helpers import tesserocr
+
+
+def create_gold_display(amount: int) -> numpy.ndarray:
+    """
+    Render an amount the way get_gold_with_ocr passes it to OCR, dark text on a bright background.
+
+    Args:
+        amount: The amount to render.
+
+    Returns:
+        A gray-scaled image the size of the gold display.
+    """
+    pixels = numpy.full((28, 57), 255, dtype=numpy.uint8)
+    cv2.putText(pixels, str(amount), (4, 22), cv2.FONT_HERSHEY_SIMPLEX, 0.7, 0, 2)
+    return pixels
+
+
+def _time_reads(service: OcrService, images: list[tuple[int, numpy.ndarray]]) -> tuple[float, float]:
+    """
+    Time reading every image with a service.
+
+    Args:
+        service: The OCR service to read with.
+        images: The amounts and their rendered images.
+
+    Returns:
+        The average time per read in milliseconds and the share of reads that were correct.
+    """
+    service.read(images[0][1], config=DIGITS)
+    correct = 0
+    start = time.perf_counter()
+    for amount, pixels in images:
+        correct += service.read(pixels, config=DIGITS) == str(amount)
+    return (time.perf_counter() - start) / len(images) * 1000, correct / len(images)
+
+
+def main() -> None:
+    """
+    Parse the arguments and print the average latency per read of every available engine.
+    """
+    arg_parser = argparse.ArgumentParser(prog="OCR engine benchmark")
+    arg_parser.add_argument("--tesseract", default="tesseract", help="The path to tesseract.exe.")
+    arg_parser.add_argument("--reads", type=int, default=50, help="How many reads to time per engine.")
+    parsed_args = arg_parser.parse_args()
+
+    chooser = random.Random(0)
+    amounts = [chooser.randrange(100) for _ in range(parsed_args.reads)]
+    images = [(amount, create_gold_display(amount)) for amount in amounts]
+
+    engines = {"pytesseract": OcrService(in_process=False)}
+    if tesserocr is not None:
+        engines["tesserocr"] = OcrService()
+    else:
+        print("Skipping tesserocr, it is not installed")
+
+    for name, service in engines.items():
+        service.set_tesseract_location(parsed_args.tesseract)
+        try:
+            latency, accuracy = _time_reads(service, images)
+        except (pytesseract.TesseractNotFoundError, RuntimeError) as exc:
+            print(f"Skipping {name}, Tesseract-OCR is not available: {exc}")
+            continue
+        print(f"{name}: {latency:.2f}ms per read, {accuracy * 100:.1f}% read correctly")
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
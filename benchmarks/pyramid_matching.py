@@ -0,0 +1,133 @@
+"""
+Benchmark of the coarse-to-fine pyramid matching mode against a plain full-frame cv2.TM_CCOEFF_NORMED search,
+comparing latency and whether both agree on hits and their locations.
+
+Run from the repository root: python -m benchmarks.pyramid_matching [--frames DIRECTORY] [--resolution 1600x900]
+Without recorded frames, synthetic frames with the templates pasted at random positions are used.
+Both modes search the templates rescaled to the frame size, like match_templates does.
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+
+from tft_bot.helpers.capture_helpers import DirectoryCaptureBackend
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.roi_index import ROI_INDEX
+from tft_bot.helpers.screen_helpers import match_templates
+from tft_bot.helpers.screen_helpers import PYRAMID_LEVELS
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+
+WINDOW_TITLE = "Benchmark"
+
+
+def create_synthetic_frame(keys: list[str], seed: int, width: int, height: int) -> numpy.ndarray:
+    """
+    Create a frame with a smooth noisy background and some of the templates pasted at random positions.
+
+    Args:
+        keys: The template keys to choose from.
+        seed: The seed for the random generators, so runs are comparable.
+        width: The width of the frame.
+        height: The height of the frame.
+
+    Returns:
+        A gray-scaled frame of the given size.
+    """
+    generator = numpy.random.default_rng(seed)
+    frame = cv2.GaussianBlur(generator.integers(0, 90, (height, width), dtype=numpy.uint8), (7, 7), 0)
+    chooser = random.Random(seed)
+    for key in chooser.sample(keys, k=min(len(keys), 4)):
+        template = TEMPLATE_REGISTRY.get_for_resolution(key=key, width=width, height=height)
+        position_x = chooser.randrange(0, width - template.width)
+        position_y = chooser.randrange(0, height - template.height)
+        frame[position_y : position_y + template.height, position_x : position_x + template.width] = template.image
+    return frame
+
+
+def match_full_frame(gray_frame: numpy.ndarray, key: str, precision: float) -> tuple[int, int] | None:
+    """
+    Search a template the way get_on_screen always did, over the whole frame at full resolution.
+
+    Args:
+        gray_frame: The gray-scaled frame.
+        key: The template key.
+        precision: The precision a match needs to count as a hit.
+
+    Returns:
+        The location of the hit or None if there was none.
+    """
+    template = TEMPLATE_REGISTRY.get_for_resolution(key=key, width=gray_frame.shape[1], height=gray_frame.shape[0])
+    search_result = cv2.matchTemplate(gray_frame, template.image, cv2.TM_CCOEFF_NORMED)
+    _, max_precision, _, max_location = cv2.minMaxLoc(search_result)
+    return max_location if max_precision >= precision else None
+
+
+def main() -> None:
+    """
+    Parse the arguments, run both search modes over every frame and print latency and agreement per template.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Pyramid matching benchmark")
+    arg_parser.add_argument("--frames", help="A directory of recorded PNG frames of the game.")
+    arg_parser.add_argument("--resolution", default="1920x1080", help="The size of the synthetic frames.")
+    arg_parser.add_argument("--synthetic-frames", type=int, default=20, help="How many synthetic frames to use.")
+    arg_parser.add_argument("--precision", type=float, default=0.8, help="The precision a hit needs.")
+    parsed_args = arg_parser.parse_args()
+    width, height = (int(size) for size in parsed_args.resolution.split("x"))
+
+    TEMPLATE_REGISTRY.load_all()
+    keys = [key for key in PYRAMID_LEVELS if TEMPLATE_REGISTRY.get(key) is not None]
+    # Compare the search modes themselves, not the region of interest index.
+    ROI_INDEX.max_misses = 0
+
+    if parsed_args.frames:
+        backend = DirectoryCaptureBackend(parsed_args.frames, loop=False)
+        frame_count = len(backend.paths)
+    else:
+        backend = SyntheticCaptureBackend()
+        frame_count = parsed_args.synthetic_frames
+    set_capture_backend(backend)
+
+    timings = {key: [0.0, 0.0] for key in keys}
+    agreements = {key: 0 for key in keys}
+    for frame_index in range(frame_count):
+        if parsed_args.frames:
+            if frame_index > 0:
+                backend.advance()
+        else:
+            backend.set_frame(create_synthetic_frame(keys, seed=frame_index, width=width, height=height))
+
+        FRAME_SNAPSHOT.invalidate()
+        for key in keys:
+            gray_frame = cv2.cvtColor(backend.grab(backend.locate_window(WINDOW_TITLE)), cv2.COLOR_BGRA2GRAY)
+            start = time.perf_counter()
+            full_frame_hit = match_full_frame(gray_frame, key, parsed_args.precision)
+            timings[key][0] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            match = match_templates(window_title=WINDOW_TITLE, paths=[key], precision=parsed_args.precision)[0]
+            timings[key][1] += time.perf_counter() - start
+
+            pyramid_hit = (match.position_x, match.position_y) if match.score >= parsed_args.precision else None
+            if full_frame_hit == pyramid_hit or (
+                full_frame_hit is not None
+                and pyramid_hit is not None
+                and abs(full_frame_hit[0] - pyramid_hit[0]) <= 2
+                and abs(full_frame_hit[1] - pyramid_hit[1]) <= 2
+            ):
+                agreements[key] += 1
+
+    print(f"{'template':<40} {'level':>5} {'full frame':>11} {'pyramid':>9} {'agreement':>10}")
+    for key in keys:
+        print(
+            f"{key:<40} {PYRAMID_LEVELS[key]:>5} {timings[key][0] / frame_count * 1000:>9.2f}ms "
+            f"{timings[key][1] / frame_count * 1000:>7.2f}ms {agreements[key] / frame_count * 100:>9.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
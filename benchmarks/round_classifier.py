@@ -0,0 +1,128 @@
+"""
+Benchmark of the per-tick cost of determining the round without OCR, comparing the template cascade
+determine_minimum_round used to run (one capture and full window match per template) with classify_round.
+
+Run from the repository root: python -m benchmarks.round_classifier [--frames DIRECTORY]
+Without recorded frames, synthetic 1920x1080 frames with a round template pasted into the stage tracker are used.
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import DirectoryCaptureBackend
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.hud_helpers import classify_round
+from tft_bot.helpers.hud_helpers import STAGE_TRACKER_REGION
+from tft_bot.helpers.roi_index import ROI_INDEX
+from tft_bot.helpers.screen_helpers import FRAME_CHANGE_DETECTOR
+from tft_bot.helpers.screen_helpers import get_on_screen_in_game
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+
+
+def create_synthetic_frame(seed: int) -> numpy.ndarray:
+    """
+    Create a frame with a smooth noisy background and one round template pasted into the stage tracker.
+
+    Args:
+        seed: The seed for the random generators, so runs are comparable.
+
+    Returns:
+        A 1920x1080 gray-scaled frame.
+    """
+    generator = numpy.random.default_rng(seed)
+    frame = cv2.GaussianBlur(generator.integers(0, 90, (1080, 1920), dtype=numpy.uint8), (7, 7), 0)
+    chooser = random.Random(seed)
+    template = None
+    while template is None:
+        template = TEMPLATE_REGISTRY.get(chooser.choice(list(CONSTANTS["game"]["round"].values())))
+    position_x = chooser.randrange(STAGE_TRACKER_REGION[0], STAGE_TRACKER_REGION[2] - template.width)
+    position_y = chooser.randrange(STAGE_TRACKER_REGION[1], STAGE_TRACKER_REGION[3] - template.height)
+    frame[position_y : position_y + template.height, position_x : position_x + template.width] = template.image
+    return frame
+
+
+def determine_stage_with_cascade() -> int:
+    """
+    Determine the stage the way determine_minimum_round used to, with a fresh capture before every match.
+
+    Returns:
+        The stage or 0 if it could not be determined.
+    """
+
+    def on_screen(name: str, precision: float = 0.8) -> bool:
+        FRAME_SNAPSHOT.invalidate()
+        return get_on_screen_in_game(CONSTANTS["game"]["round"][name], precision) is not None
+
+    output = 0
+    if on_screen("krugs_inactive", 0.9) or on_screen("krugs_active", 0.9):
+        output = 2
+    if on_screen("wolves_inactive", 0.9) or on_screen("wolves_active", 0.9):
+        output = 3
+    if on_screen("birds_inactive", 0.9) or on_screen("birds_active", 0.9):
+        output = 4
+    if on_screen("elder_dragon_inactive", 0.9) or on_screen("elder_dragon_active", 0.9):
+        output = 5
+    if output == 0:
+        for i in range(1, 7):
+            if on_screen(f"{i}-"):
+                output = i
+                break
+    return output
+
+
+def main() -> None:
+    """
+    Parse the arguments, determine the stage of every frame both ways and print the cost per tick and agreement.
+    """
+    arg_parser = argparse.ArgumentParser(prog="Round classifier benchmark")
+    arg_parser.add_argument("--frames", help="A directory of recorded 1920x1080 PNG frames of the game.")
+    arg_parser.add_argument("--synthetic-frames", type=int, default=20, help="How many synthetic frames to use.")
+    parsed_args = arg_parser.parse_args()
+
+    TEMPLATE_REGISTRY.load_all()
+    # Compare the detection itself, not the caches in front of it.
+    ROI_INDEX.max_misses = 0
+    FRAME_CHANGE_DETECTOR.enabled = False
+
+    if parsed_args.frames:
+        backend = DirectoryCaptureBackend(parsed_args.frames, loop=False)
+        frame_count = len(backend.paths)
+    else:
+        backend = SyntheticCaptureBackend()
+        frame_count = parsed_args.synthetic_frames
+    set_capture_backend(backend)
+
+    cascade_time = 0.0
+    classifier_time = 0.0
+    agreements = 0
+    for frame_index in range(frame_count):
+        if parsed_args.frames:
+            if frame_index > 0:
+                backend.advance()
+        else:
+            backend.set_frame(create_synthetic_frame(seed=frame_index))
+
+        start = time.perf_counter()
+        cascade_stage = determine_stage_with_cascade()
+        cascade_time += time.perf_counter() - start
+
+        FRAME_SNAPSHOT.invalidate()
+        start = time.perf_counter()
+        classified_stage = classify_round().stage
+        classifier_time += time.perf_counter() - start
+
+        agreements += cascade_stage == classified_stage
+
+    print(f"template cascade: {cascade_time / frame_count * 1000:.2f}ms per tick")
+    print(f"round classifier: {classifier_time / frame_count * 1000:.2f}ms per tick")
+    print(f"agreement on the stage: {agreements / frame_count * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
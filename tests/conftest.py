@@ -0,0 +1,22 @@
+"""Fixtures shared by the tests that capture from a synthetic backend."""
+from typing import Iterator
+
+import pytest
+
+from tft_bot.helpers import screen_helpers
+from tft_bot.helpers.capture_helpers import get_capture_backend
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+
+
+@pytest.fixture(name="backend")
+def fixture_backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[SyntheticCaptureBackend]:
+    """
+    Capture from a synthetic backend with a fresh frame change detector.
+    """
+    previous_backend = get_capture_backend()
+    backend = SyntheticCaptureBackend()
+    set_capture_backend(backend)
+    monkeypatch.setattr(screen_helpers, "FRAME_CHANGE_DETECTOR", screen_helpers.FrameChangeDetector())
+    yield backend
+    set_capture_backend(previous_backend)
@@ -0,0 +1,169 @@
+"""Tests of reading digits with the glyph atlas, against rendered digits and the gold and round captures."""
+# pylint: disable=protected-access
+import os
+
+import cv2
+import numpy
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import glyph_helpers
+from tft_bot.helpers.glyph_helpers import GlyphAtlas
+from tft_bot.helpers.hud_helpers import ROUND_DIGITS
+
+
+def render_digits(text: str) -> numpy.ndarray:
+    """
+    Render digits as bright text on a dark background, like the HUD shows them.
+
+    Args:
+        text: The digits to render.
+
+    Returns:
+        The gray-scaled pixels of the text.
+    """
+    pixels = numpy.zeros((40, 30 * len(text) + 20), dtype=numpy.uint8)
+    cv2.putText(pixels, text, (10, 32), cv2.FONT_HERSHEY_SCRIPT_COMPLEX, 1.0, 255, 2)
+    return pixels
+
+
+def build_atlas(texts: list[str]) -> tuple[numpy.ndarray, list[str]]:
+    """
+    Build the glyphs of an atlas from rendered digits.
+
+    Args:
+        texts: The digits to render, every character becomes one row of the atlas.
+
+    Returns:
+        The glyphs and their digits, like GlyphAtlas keeps them.
+    """
+    glyphs, digits = [], []
+    for text in texts:
+        glyphs.extend(glyph_helpers._segment_glyphs(render_digits(text)))
+        digits.extend(text)
+    return numpy.array(glyphs), digits
+
+
+def get_capture_glyphs(
+    monkeypatch: pytest.MonkeyPatch, skipped_path: str = "", skipped_digit: str = ""
+) -> tuple[list[numpy.ndarray], list[str]]:
+    """
+    Get the glyphs of the gold and round captures, like GLYPH_ATLAS builds them, leaving a capture or a digit out.
+
+    Args:
+        monkeypatch: The fixture to leave the capture out with.
+        skipped_path: The path of a capture to leave out. Defaults to "".
+        skipped_digit: A digit to leave out. Defaults to "".
+
+    Returns:
+        Every normalized glyph and its digit.
+    """
+    for captures in ("gold", "round"):
+        monkeypatch.setitem(
+            CONSTANTS["game"],
+            captures,
+            {name: path for name, path in CONSTANTS["game"][captures].items() if path != skipped_path},
+        )
+    glyphs, digits = glyph_helpers._get_capture_glyphs()
+    kept = [index for index, digit in enumerate(digits) if digit != skipped_digit]
+    return [glyphs[index] for index in kept], [digits[index] for index in kept]
+
+
+def build_capture_atlas(monkeypatch: pytest.MonkeyPatch, skipped_path: str = "", skipped_digit: str = "") -> GlyphAtlas:
+    """
+    Build an atlas from the gold and round captures, leaving a capture or a digit out.
+
+    Args:
+        monkeypatch: The fixture to leave the capture out with.
+        skipped_path: The path of a capture to leave out. Defaults to "".
+        skipped_digit: A digit to leave out. Defaults to "".
+
+    Returns:
+        The atlas.
+    """
+    glyphs, digits = get_capture_glyphs(monkeypatch, skipped_path=skipped_path, skipped_digit=skipped_digit)
+    atlas = GlyphAtlas()
+    monkeypatch.setattr(atlas, "_atlas", (numpy.array(glyphs), digits))
+    return atlas
+
+
+def test_read_digits_with_complete_atlas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Every digit of an atlas that knows all of them is read.
+    """
+    atlas = GlyphAtlas()
+    monkeypatch.setattr(atlas, "_atlas", build_atlas(["0123456789"]))
+    assert atlas.read(render_digits("3580")) == "3580"
+
+
+def test_read_digits_checks_the_atlas_before_segmenting(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    An atlas without the digit 8 must not read an 8 as its closest known digit, the 5, so it does not read at all.
+    """
+    atlas = GlyphAtlas()
+    monkeypatch.setattr(atlas, "_atlas", build_atlas(["01234567", "9"]))
+
+    def segment_glyphs(_: numpy.ndarray) -> list:
+        raise AssertionError("the pixels were segmented")
+
+    monkeypatch.setattr(glyph_helpers, "_segment_glyphs", segment_glyphs)
+    assert atlas.read(render_digits("8")) is None
+    assert atlas.read(render_digits("38")) is None
+
+
+def test_read_digits_rejects_ambiguous_three_and_five(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    A glyph between the 3 and the 5 of the gold captures scores high with both, so it must not be guessed.
+    """
+    atlas = build_capture_atlas(monkeypatch)
+    # The captures do not show an 8 or 9, rendered ones complete the atlas.
+    glyphs, digits = atlas._atlas
+    rendered_glyphs, rendered_digits = build_atlas(["89"])
+    monkeypatch.setattr(atlas, "_atlas", (numpy.vstack([glyphs, rendered_glyphs]), digits + rendered_digits))
+
+    three = cv2.imread(CONSTANTS["game"]["gold"]["3"], cv2.IMREAD_GRAYSCALE)
+    five = cv2.imread(CONSTANTS["game"]["gold"]["5"], cv2.IMREAD_GRAYSCALE)
+    assert atlas.read(three) == "3"
+    assert atlas.read(five) == "5"
+    assert atlas.read(cv2.addWeighted(three, 0.5, five, 0.5, 0)) is None
+
+
+@pytest.mark.parametrize(
+    "name", [name for name, path in CONSTANTS["game"]["round"].items() if len(name) == 3 and os.path.isfile(path)]
+)
+def test_round_captures_are_read_exactly_without_themselves(monkeypatch: pytest.MonkeyPatch, name: str) -> None:
+    """
+    The captures show every digit the stage display can, so each of them is read exactly by the atlas of the others.
+    """
+    path = CONSTANTS["game"]["round"][name]
+    atlas = build_capture_atlas(monkeypatch, skipped_path=path)
+
+    assert atlas.read(cv2.imread(path, cv2.IMREAD_GRAYSCALE), digits=ROUND_DIGITS) == name
+
+
+def test_digit_missing_from_the_captures_is_learned_from_labelled_reads(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: str
+) -> None:
+    """
+    A digit the captures do not show is learned from a labelled gold display once a read of another number confirms
+    it, after which the gold display is read exactly, also after loading the atlas again.
+    """
+    atlas = build_capture_atlas(monkeypatch, skipped_digit="4")
+    atlas.load(os.path.join(tmp_path, "glyph_atlas.json"))
+    four = cv2.imread(CONSTANTS["game"]["gold"]["4"], cv2.IMREAD_GRAYSCALE)
+    three = cv2.imread(CONSTANTS["game"]["gold"]["3"], cv2.IMREAD_GRAYSCALE)
+    two_four = cv2.imread(CONSTANTS["game"]["round"]["2-4"], cv2.IMREAD_GRAYSCALE)
+
+    # A display that still shows the 3 while the label already says 4 is not learned.
+    assert not atlas.learn(three, text="4")
+    assert not atlas.learn(four, text="4")
+    assert atlas.read(four, digits="01234567") is None
+    assert atlas.learn(two_four, text="24")
+    assert atlas.read(four, digits="01234567") == "4"
+
+    atlas.save()
+    capture_glyphs = get_capture_glyphs(monkeypatch, skipped_digit="4")
+    monkeypatch.setattr(glyph_helpers, "_get_capture_glyphs", lambda: tuple(list(part) for part in capture_glyphs))
+    loaded_atlas = GlyphAtlas()
+    loaded_atlas.load(os.path.join(tmp_path, "glyph_atlas.json"))
+    assert loaded_atlas.read(four, digits="01234567") == "4"
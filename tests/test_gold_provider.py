@@ -0,0 +1,137 @@
+"""Tests of the gold provider, which reads the gold from the live client API or the screen."""
+import cv2
+import numpy
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import gold_provider as gold_provider_module
+from tft_bot.helpers import screen_helpers
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.gold_provider import GoldProvider
+
+# Where the gold display sits in a 1920x1080 game window, like in tests.test_screen_helpers.
+GOLD_POSITION = (850, 880)
+
+
+def show_gold(backend: SyntheticCaptureBackend, gold: int | None) -> None:
+    """
+    Show a game frame with the gold display showing one of the gold captures, or nothing.
+
+    Args:
+        backend: The backend to show the frame on.
+        gold: The amount of gold to show, there has to be a capture of it. None to show no gold display.
+    """
+    frame = cv2.GaussianBlur(numpy.random.default_rng(0).integers(0, 60, (1080, 1920, 3), dtype=numpy.uint8), (7, 7), 0)
+    if gold is not None:
+        capture = cv2.imread(CONSTANTS["game"]["gold"][str(gold)])
+        position_x, position_y = GOLD_POSITION
+        frame[position_y : position_y + capture.shape[0], position_x : position_x + capture.shape[1]] = capture
+    backend.set_frame(frame)
+
+
+def test_gold_provider_checks_zero_from_the_api_against_the_screen() -> None:
+    """
+    The API reports 0 gold when it does not know it, so 0 is only trusted when the screen shows it too.
+    """
+    gold_provider = GoldProvider()
+    gold_provider.set_api_reader(lambda: 0)
+
+    assert gold_provider.get_gold(screen_reader=lambda: 0) == 0
+    assert gold_provider.get_gold(screen_reader=lambda: None) is None
+    assert gold_provider.get_gold(screen_reader=lambda: 14) == 14
+    assert gold_provider.statistics.disagreements == 1
+
+
+def test_gold_provider_switches_to_the_screen_after_disagreements_in_a_row() -> None:
+    """
+    An API that keeps disagreeing with the screen is not read anymore until the next game.
+    """
+    api_reads = []
+
+    def read_api_gold() -> int:
+        api_reads.append(0)
+        return 0
+
+    gold_provider = GoldProvider(max_disagreements=3)
+    gold_provider.set_api_reader(read_api_gold)
+    for _ in range(3):
+        assert gold_provider.get_gold(screen_reader=lambda: 20) == 20
+    assert gold_provider.get_gold(screen_reader=lambda: 22) == 22
+    assert len(api_reads) == 3
+
+    gold_provider.reset()
+    assert gold_provider.get_gold(screen_reader=lambda: 0) == 0
+    assert len(api_reads) == 4
+
+
+def test_gold_provider_keeps_the_api_if_disagreements_are_not_in_a_row() -> None:
+    """
+    The screen lags behind the API now and then, single disagreements keep the more exact API value.
+    """
+    gold_provider = GoldProvider(cross_check_interval=1, max_disagreements=2)
+    gold_provider.set_api_reader(lambda: 30)
+
+    assert gold_provider.get_gold(screen_reader=lambda: 26) == 30
+    assert gold_provider.get_gold(screen_reader=lambda: 30) == 30
+    assert gold_provider.get_gold(screen_reader=lambda: 26) == 30
+    assert gold_provider.statistics.disagreements == 2
+
+
+def test_gold_provider_labels_the_screen_with_cross_checks_that_do_not_disagree() -> None:
+    """
+    The gold from the API teaches the screen reader how the gold display looks, unless the screen shows another
+    amount, which may just lag behind.
+    """
+    learned_gold = []
+    gold_provider = GoldProvider(cross_check_interval=1, max_disagreements=10, screen_learner=learned_gold.append)
+    gold_provider.set_api_reader(lambda: 38)
+
+    assert gold_provider.get_gold(screen_reader=lambda: None) == 38
+    assert gold_provider.get_gold(screen_reader=lambda: 38) == 38
+    assert gold_provider.get_gold(screen_reader=lambda: 35) == 38
+    assert learned_gold == [38, 38]
+
+
+@pytest.mark.parametrize("gold", [int(amount) for amount in CONSTANTS["game"]["gold"]])
+def test_default_screen_reader_reads_the_gold_captures(backend: SyntheticCaptureBackend, gold: int) -> None:
+    """
+    The gold display is read from the screen without the live client, so cross-checks can disagree.
+    """
+    show_gold(backend, gold)
+    assert GoldProvider().get_gold() == gold
+
+
+def test_default_screen_reader_cross_checks_the_api(backend: SyntheticCaptureBackend) -> None:
+    """
+    Gold on screen next to 0 from the API is a disagreement, and the gold on screen is returned.
+    """
+    show_gold(backend, 4)
+    gold_provider = GoldProvider()
+    gold_provider.set_api_reader(lambda: 0)
+
+    assert gold_provider.get_gold() == 4
+    assert gold_provider.statistics.cross_checks == 1
+    assert gold_provider.statistics.disagreements == 1
+
+
+def test_gold_at_least_matches_the_gold_captures_once(
+    backend: SyntheticCaptureBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    gold_at_least reads the gold from the screen once, instead of checking every amount up to the wanted one.
+    """
+    monkeypatch.setattr(gold_provider_module, "GOLD_PROVIDER", GoldProvider())
+    matched_paths = []
+    match_templates = screen_helpers.match_templates
+
+    def count_match_templates(**kwargs) -> list[screen_helpers.TemplateMatch]:
+        matched_paths.extend(kwargs["paths"])
+        return match_templates(**kwargs)
+
+    monkeypatch.setattr(gold_provider_module, "match_templates", count_match_templates)
+    show_gold(backend, 3)
+    assert gold_provider_module.gold_at_least(3)
+    assert not gold_provider_module.gold_at_least(4)
+    show_gold(backend, None)
+    assert gold_provider_module.gold_at_least(4)
+    assert len(matched_paths) == 3 * len(CONSTANTS["game"]["gold"])
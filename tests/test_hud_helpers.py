@@ -0,0 +1,79 @@
+"""Tests of reading the HUD, run headless against synthetic frames."""
+import os
+
+import cv2
+import numpy
+import pytest
+
+from benchmarks.round_classifier import determine_stage_with_cascade
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import hud_helpers
+from tft_bot.helpers import screen_helpers
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.roi_index import RoiIndex
+
+
+def create_stage_tracker_frame(seed: int, width: int, height: int) -> numpy.ndarray:
+    """
+    Create a game frame with up to one PvE round marker and up to two stage displays, each either in the stage tracker
+    or anywhere else in the window, rendered at 1920x1080 and rescaled to the window size.
+
+    Args:
+        seed: The seed for the random generators.
+        width: The width of the window.
+        height: The height of the window.
+
+    Returns:
+        The BGR frame.
+    """
+    generator = numpy.random.default_rng(seed)
+    frame = cv2.GaussianBlur(generator.integers(0, 60, (1080, 1920, 3), dtype=numpy.uint8), (7, 7), 0)
+    rounds = {name: path for name, path in CONSTANTS["game"]["round"].items() if os.path.isfile(path)}
+    marker_names = [name for name in rounds if name.rsplit("_", 1)[0] in hud_helpers.PVE_ROUND_MARKERS]
+    text_names = [name for name in rounds if "-" in name]
+    names = list(generator.choice(text_names, size=generator.integers(0, 3), replace=False))
+    if generator.random() < 0.5:
+        names.append(generator.choice(marker_names))
+
+    tracker_region = hud_helpers.STAGE_TRACKER_REGION
+    for index, name in enumerate(names):
+        capture = cv2.imread(rounds[name])
+        if generator.random() < 0.5:
+            # Side by side in the tracker, like the game shows them.
+            position_x = tracker_region[0] + 20 + index * 120
+            position_y = generator.integers(tracker_region[1], tracker_region[3] - capture.shape[0])
+        else:
+            position_x = generator.integers(0, 1920 - capture.shape[1])
+            position_y = generator.integers(tracker_region[3], 1080 - capture.shape[0])
+        frame[position_y : position_y + capture.shape[0], position_x : position_x + capture.shape[1]] = capture
+    return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+
+@pytest.mark.parametrize("width,height", [(1920, 1080), (1600, 900)])
+def test_classify_round_agrees_with_the_template_cascade(
+    backend: SyntheticCaptureBackend, monkeypatch: pytest.MonkeyPatch, width: int, height: int
+) -> None:
+    """
+    The stage read from the cropped stage tracker is the one the full window template cascade it replaced reads,
+    also for stage displays and markers outside of the crop.
+    """
+    monkeypatch.setattr(screen_helpers, "ROI_INDEX", RoiIndex())
+    for seed in range(8):
+        backend.set_frame(create_stage_tracker_frame(seed=seed, width=width, height=height))
+        assert hud_helpers.classify_round().stage == determine_stage_with_cascade(), f"seed {seed}"
+
+
+@pytest.mark.parametrize(
+    "name", [name for name, path in CONSTANTS["game"]["round"].items() if len(name) == 3 and os.path.isfile(path)]
+)
+def test_get_round_with_glyphs_reads_the_captured_stage_display(backend: SyntheticCaptureBackend, name: str) -> None:
+    """
+    A captured stage display shown in the round region of the game window is read exactly with the glyph atlas.
+    """
+    frame = numpy.full((1080, 1920, 3), 10, dtype=numpy.uint8)
+    capture = cv2.imread(CONSTANTS["game"]["round"][name])
+    position_x, position_y = screen_helpers.ROUND_REGION[0] + 20, screen_helpers.ROUND_REGION[1]
+    frame[position_y : position_y + capture.shape[0], position_x : position_x + capture.shape[1]] = capture
+    backend.set_frame(frame)
+
+    assert hud_helpers.get_round_with_glyphs() == name.replace("-", "")
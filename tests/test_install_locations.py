@@ -0,0 +1,117 @@
+"""Tests of the install location cache, run against resolvers instead of the registry."""
+import pathlib
+
+import pytest
+
+from tft_bot.helpers import install_locations
+
+
+@pytest.fixture(name="overrides")
+def fixture_overrides(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """
+    Take the configured overrides from a dictionary instead of the config.
+    """
+    overrides = {}
+    monkeypatch.setattr(install_locations, "_get_override_install_location", overrides.get)
+    return overrides
+
+
+def test_missing_location_is_reused_until_the_override_changes(
+    overrides: dict[str, str], tmp_path: pathlib.Path
+) -> None:
+    """
+    A location that was not found is saved like any other, so the next start does not resolve it again.
+    """
+    resolutions = []
+
+    def resolve_missing(cache: install_locations.InstallLocationCache) -> str | None:
+        resolutions.append(cache)
+        return overrides.get("app")
+
+    path = str(tmp_path / "install_locations.json")
+    for _ in range(2):
+        cache = install_locations.InstallLocationCache()
+        cache.register("app", resolve_missing)
+        cache.load(path)
+        assert cache.get("app") is None
+    assert len(resolutions) == 1
+
+    overrides["app"] = str(tmp_path)
+    cache = install_locations.InstallLocationCache()
+    cache.register("app", resolve_missing)
+    cache.load(path)
+    assert cache.get("app") == str(tmp_path)
+    assert len(resolutions) == 2
+
+
+@pytest.mark.usefixtures("overrides")
+def test_location_is_resolved_again_with_its_dependency(tmp_path: pathlib.Path) -> None:
+    """
+    A location looked up from another one is resolved again whenever the other one is.
+    """
+    installed = tmp_path / "installed"
+    resolutions = []
+
+    def resolve_directory(cache: install_locations.InstallLocationCache) -> str:  # pylint: disable=unused-argument
+        return str(installed)
+
+    def resolve_executable(cache: install_locations.InstallLocationCache) -> str | None:
+        resolutions.append(cache)
+        executable = cache.get("directory") + "/app.exe"
+        return executable if installed.is_dir() else None
+
+    path = str(tmp_path / "install_locations.json")
+
+    def load() -> install_locations.InstallLocationCache:
+        cache = install_locations.InstallLocationCache()
+        cache.register("directory", resolve_directory)
+        cache.register("executable", resolve_executable, depends_on=("directory",))
+        cache.load(path)
+        return cache
+
+    assert load().get("executable") is None
+    assert load().get("executable") is None
+    assert len(resolutions) == 1
+
+    installed.mkdir()
+    assert load().get("executable") == str(installed) + "/app.exe"
+    assert len(resolutions) == 2
+
+
+@pytest.mark.usefixtures("overrides")
+def test_location_is_resolved_again_when_its_registry_entry_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    """
+    A first install, or a reinstall somewhere else, only shows in the registry, so its raw value is part of the stamp,
+    also of locations that were not found.
+    """
+    entry = ("HKEY_LOCAL_MACHINE", r"SOFTWARE\App", "InstallDir")
+    reader = install_locations.StaticRegistryReader()
+    monkeypatch.setattr(install_locations, "_REGISTRY_READER", reader)
+    resolutions = []
+
+    def resolve_from_registry(cache: install_locations.InstallLocationCache) -> str | None:
+        resolutions.append(cache)
+        return install_locations.get_registry_reader().read(*entry)
+
+    path = str(tmp_path / "install_locations.json")
+
+    def load() -> install_locations.InstallLocationCache:
+        cache = install_locations.InstallLocationCache()
+        cache.register("app", resolve_from_registry, registry_entries=(entry,))
+        cache.load(path)
+        return cache
+
+    assert load().get("app") is None
+    assert load().get("app") is None
+    assert len(resolutions) == 1
+
+    reader.values[entry] = str(tmp_path / "first")
+    assert load().get("app") == str(tmp_path / "first")
+    assert load().get("app") == str(tmp_path / "first")
+    assert len(resolutions) == 2
+
+    reader.values[entry] = str(tmp_path / "second")
+    assert load().get("app") == str(tmp_path / "second")
+    assert len(resolutions) == 3
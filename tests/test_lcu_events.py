@@ -0,0 +1,107 @@
+"""Tests of the League client event stream, run without a League client."""
+import json
+
+import pytest
+
+from benchmarks.lcu_stand_in import StandInLcu
+from tft_bot.league_api import lcu_events
+
+
+class FailingConnection:
+    """
+    A websocket that delivers some messages and then fails in a way the event stream does not expect.
+    """
+
+    def __init__(self, messages: list[str]):
+        self.messages = messages
+        self.closed = False
+
+    def recv(self) -> str:
+        """
+        Deliver the next message, or fail once there are none left.
+        """
+        if not self.messages:
+            raise RuntimeError("The websocket broke")
+        return self.messages.pop(0)
+
+    def close(self) -> None:
+        """
+        Remember that the websocket was closed.
+        """
+        self.closed = True
+
+
+def test_malformed_event_is_ignored() -> None:
+    """
+    An event that is not an object is dropped instead of failing the event thread.
+    """
+    stream = lcu_events.LcuEventStream()
+    stream._handle_message(  # pylint: disable=protected-access
+        json.dumps([lcu_events.WAMP_EVENT, lcu_events.get_event_name(lcu_events.LOBBY_URI), "not an event"])
+    )
+    assert stream.events == 0
+
+
+@pytest.mark.skipif(lcu_events.websocket is None, reason="websocket-client is not installed")
+def test_unexpected_error_falls_back_to_polling() -> None:
+    """
+    Any error on the event thread clears the pushed states, so they are polled again instead of going stale.
+    """
+    event = {"uri": lcu_events.LOBBY_URI, "eventType": "Update", "data": {"gameConfig": {}}}
+    connection = FailingConnection(
+        [json.dumps([lcu_events.WAMP_EVENT, lcu_events.get_event_name(lcu_events.LOBBY_URI), event])]
+    )
+    stream = lcu_events.LcuEventStream()
+    stream._connection = connection  # pylint: disable=protected-access
+    stream._receive_events(connection)  # pylint: disable=protected-access
+
+    assert stream.events == 1
+    assert not stream.is_connected()
+    assert stream.get_state(lcu_events.LOBBY_URI) == (False, None)
+
+
+def push_state(stand_in: StandInLcu, stream: lcu_events.LcuEventStream, uri: str, data: dict | None) -> bool:
+    """
+    Change a state of the stand-in until the stream received it. The stand-in subscribes the websocket while the
+    first change may already be pushed, and waiting only notices events after it started.
+
+    Args:
+        stand_in: The stand-in League client.
+        stream: The event stream subscribed to the stand-in.
+        uri: The endpoint.
+        data: The new state, None to delete the resource.
+
+    Returns:
+        True if the stream received the state within 5 seconds, False otherwise.
+    """
+    for _ in range(50):
+        stand_in.set_state(uri, data)
+        stream.wait_for_change(timeout=0.1, uris=(uri,))
+        if stream.get_state(uri) == (True, data):
+            return True
+    return False
+
+
+@pytest.mark.skipif(lcu_events.websocket is None, reason="websocket-client is not installed")
+def test_pushed_states_replace_polling_until_the_stream_closes() -> None:
+    """
+    Changes the League client pushes are served without a request, deletions included,
+    until the websocket closes and the states are polled again.
+    """
+    stand_in = StandInLcu()
+    stand_in.start()
+    stream = lcu_events.LcuEventStream()
+    try:
+        assert stream.connect(stand_in.url, auth=("riot", "stand-in"), certificate=False)
+        assert stream.get_state(lcu_events.LOBBY_URI) == (False, None)
+
+        requests_before = stand_in.get_request_count()
+        assert push_state(stand_in, stream, lcu_events.LOBBY_URI, {"gameConfig": {"queueId": 1090}})
+        assert push_state(stand_in, stream, lcu_events.LOBBY_URI, None)
+        assert stand_in.get_request_count() == requests_before
+    finally:
+        stand_in.stop()
+
+    assert not stream.wait_for_change(timeout=5.0)
+    assert not stream.is_connected()
+    assert stream.get_state(lcu_events.LOBBY_URI) == (False, None)
@@ -0,0 +1,111 @@
+"""Tests of the OCR service, against a stand-in for the tesserocr engines so they run without Tesseract."""
+import os
+import threading
+import types
+
+import numpy
+import pytest
+
+from tft_bot.helpers import ocr_helpers
+from tft_bot.helpers.ocr_helpers import DIGITS
+from tft_bot.helpers.ocr_helpers import OcrService
+
+
+class FakeApi:
+    """
+    Stands in for tesserocr.PyTessBaseAPI, reading the tessdata path it was created with as its text.
+    """
+
+    created: list["FakeApi"] = []
+    barrier: threading.Barrier | None = None
+
+    def __init__(self, path: str = "", **_: object):
+        self.path = path
+        self.ended = False
+        FakeApi.created.append(self)
+
+    def SetVariable(self, name: str, value: str) -> None:  # pylint: disable=invalid-name
+        """
+        Ignore the whitelist.
+        """
+
+    def SetImageBytes(self, *_: object) -> None:  # pylint: disable=invalid-name
+        """
+        Ignore the pixels.
+        """
+
+    def GetUTF8Text(self) -> str:  # pylint: disable=invalid-name
+        """
+        Wait for the other reads at the barrier, if there is one, and read the tessdata path.
+        """
+        if FakeApi.barrier is not None:
+            FakeApi.barrier.wait(timeout=5)
+        return self.path
+
+    def End(self) -> None:  # pylint: disable=invalid-name
+        """
+        Mark the engine as ended.
+        """
+        self.ended = True
+
+
+@pytest.fixture(name="service")
+def fixture_service(monkeypatch: pytest.MonkeyPatch) -> OcrService:
+    """
+    An OCR service reading with fake in-process engines.
+    """
+    FakeApi.created = []
+    FakeApi.barrier = None
+    monkeypatch.setattr(
+        ocr_helpers, "tesserocr", types.SimpleNamespace(PyTessBaseAPI=FakeApi, OEM=types.SimpleNamespace(DEFAULT=3))
+    )
+    return OcrService()
+
+
+def test_reads_on_several_threads_run_at_the_same_time(service: OcrService) -> None:
+    """
+    A read does not hold the service lock, so two threads read with an engine each instead of one after the other.
+    """
+    FakeApi.barrier = threading.Barrier(2)
+    errors = []
+
+    def read(value: int) -> None:
+        try:
+            service.read(numpy.full((10, 10), value, dtype=numpy.uint8), config=DIGITS)
+        except threading.BrokenBarrierError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=read, args=(value,)) for value in (0, 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(FakeApi.created) == 2
+
+
+def test_engines_are_reused_and_ended_on_close(service: OcrService) -> None:
+    """
+    Reads one after the other share one engine, which is ended when the service is closed.
+    """
+    for value in range(3):
+        service.read(numpy.full((10, 10), value, dtype=numpy.uint8), config=DIGITS)
+    service.close()
+
+    assert len(FakeApi.created) == 1
+    assert FakeApi.created[0].ended
+
+
+def test_changing_the_tesseract_location_drops_cached_results(service: OcrService) -> None:
+    """
+    Pixels read with one installation are read again once another installation is set.
+    """
+    pixels = numpy.zeros((10, 10), dtype=numpy.uint8)
+    service.set_tesseract_location("first/tesseract.exe")
+    assert service.read(pixels, config=DIGITS) == os.path.join("first", "tessdata")
+    assert service.read(pixels, config=DIGITS) == os.path.join("first", "tessdata")
+
+    service.set_tesseract_location("second/tesseract.exe")
+    assert service.read(pixels, config=DIGITS) == os.path.join("second", "tessdata")
+    assert service.statistics.cache_hits == 1
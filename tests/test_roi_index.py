@@ -0,0 +1,118 @@
+"""Tests of the region of interest index, alone and through the template matching that uses it."""
+from typing import Iterator
+
+import cv2
+import numpy
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import screen_helpers
+from tft_bot.helpers.capture_helpers import get_capture_backend
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.roi_index import RoiIndex
+
+WIDTH, HEIGHT = 1920, 1080
+FOUND_AT = (100, 100, 140, 120)
+
+
+def record_region_searches(roi_index: RoiIndex, hits: int, misses: int = 0) -> list[bool]:
+    """
+    Record searches limited to the region of FOUND_AT.
+
+    Args:
+        roi_index: The index to record in.
+        hits: The amount of searches that found the template.
+        misses: The amount of searches after them that did not find it. Defaults to 0.
+
+    Returns:
+        Whether every miss had to be confirmed by a full window search.
+    """
+    for _ in range(hits):
+        roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=FOUND_AT, searched_region=True)
+    return [
+        roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=None, searched_region=True)
+        for _ in range(misses)
+    ]
+
+
+def test_miss_in_unproven_region_is_confirmed() -> None:
+    """
+    A region that has not proven itself yet cannot tell that the template is not on screen.
+    """
+    roi_index = RoiIndex(min_searches=20)
+    roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=FOUND_AT, searched_region=False)
+
+    assert roi_index.get_search_region(key="template", width=WIDTH, height=HEIGHT) is not None
+    assert record_region_searches(roi_index, hits=5, misses=1) == [True]
+
+
+def test_miss_in_proven_region_is_trusted_until_max_misses() -> None:
+    """
+    A region the template is nearly always found in is trusted for max_misses misses in a row.
+    """
+    roi_index = RoiIndex(max_misses=3, min_searches=20, min_hit_rate=0.9)
+    roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=FOUND_AT, searched_region=False)
+
+    assert record_region_searches(roi_index, hits=30, misses=3) == [False, False, False]
+    assert roi_index.get_search_region(key="template", width=WIDTH, height=HEIGHT) is None
+
+
+def test_region_found_outside_has_to_prove_itself_again() -> None:
+    """
+    Once the template showed up outside of its region, a miss in the grown region is confirmed again.
+    """
+    roi_index = RoiIndex(min_searches=20)
+    roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=FOUND_AT, searched_region=False)
+    record_region_searches(roi_index, hits=20)
+    roi_index.record(key="template", width=WIDTH, height=HEIGHT, found_at=(800, 600, 840, 620), searched_region=False)
+
+    assert record_region_searches(roi_index, hits=0, misses=1) == [True]
+
+
+@pytest.fixture(name="backend")
+def fixture_backend(monkeypatch: pytest.MonkeyPatch) -> Iterator[SyntheticCaptureBackend]:
+    """
+    Capture from a synthetic backend with a fresh region of interest index and frame change detector.
+    """
+    previous_backend = get_capture_backend()
+    backend = SyntheticCaptureBackend()
+    set_capture_backend(backend)
+    monkeypatch.setattr(screen_helpers, "ROI_INDEX", RoiIndex())
+    monkeypatch.setattr(screen_helpers, "FRAME_CHANGE_DETECTOR", screen_helpers.FrameChangeDetector())
+    yield backend
+    set_capture_backend(previous_backend)
+
+
+def create_frame_with_template(path: str, position: tuple[int, int]) -> numpy.ndarray:
+    """
+    Create a 1920x1080 frame with a noisy background and a template at a position.
+
+    Args:
+        path: The path of the template.
+        position: Where the top left corner of the template is.
+
+    Returns:
+        The BGR frame.
+    """
+    generator = numpy.random.default_rng(0)
+    frame = cv2.GaussianBlur(generator.integers(0, 60, (HEIGHT, WIDTH, 3), dtype=numpy.uint8), (7, 7), 0)
+    template = cv2.imread(path)
+    position_x, position_y = position
+    frame[position_y : position_y + template.shape[0], position_x : position_x + template.shape[1]] = template
+    return frame
+
+
+def test_moved_template_is_found_on_the_first_check(backend: SyntheticCaptureBackend) -> None:
+    """
+    A button that shows up somewhere else than before is found right away, not after several missed checks.
+    """
+    path = CONSTANTS["game"]["gamelogic"]["vote"]
+    for _ in range(3):
+        backend.set_frame(create_frame_with_template(path=path, position=(300, 200)))
+        assert screen_helpers.get_on_screen_in_game(path).position_x == 300
+
+    backend.set_frame(create_frame_with_template(path=path, position=(1200, 700)))
+    search_result = screen_helpers.get_on_screen_in_game(path)
+    assert search_result is not None
+    assert (search_result.position_x, search_result.position_y) == (1200, 700)
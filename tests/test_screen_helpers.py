@@ -0,0 +1,167 @@
+"""Tests of the screen helpers, run headless against synthetic frames."""
+import sys
+import time
+import types
+
+import cv2
+import numpy
+import pytest
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers import screen_helpers
+from tft_bot.helpers.capture_helpers import Frame
+from tft_bot.helpers.capture_helpers import get_capture_backend
+from tft_bot.helpers.capture_helpers import set_capture_backend
+from tft_bot.helpers.capture_helpers import SyntheticCaptureBackend
+from tft_bot.helpers.roi_index import RoiIndex
+from tft_bot.helpers.template_registry import Template
+
+# Where the gold display sits in a 1920x1080 game window, inside the region get_gold_with_opencv searches.
+GOLD_POSITION = (850, 880)
+
+
+def create_game_frame(gold: int) -> numpy.ndarray:
+    """
+    Create a 1920x1080 game frame with a noisy background and the gold display showing an amount.
+
+    Args:
+        gold: The amount of gold to show, there has to be a file for it in captures/gold .
+
+    Returns:
+        The BGR frame.
+    """
+    generator = numpy.random.default_rng(0)
+    frame = cv2.GaussianBlur(generator.integers(0, 60, (1080, 1920, 3), dtype=numpy.uint8), (7, 7), 0)
+    gold_display = cv2.imread(CONSTANTS["game"]["gold"][f"{gold}"])
+    position_x, position_y = GOLD_POSITION
+    height, width = gold_display.shape[:2]
+    frame[position_y : position_y + height, position_x : position_x + width] = gold_display
+    return frame
+
+
+def test_memoized_gold_check_notices_one_digit_change(backend: SyntheticCaptureBackend) -> None:
+    """
+    A change of a single HUD digit is too small for the thumbnail, the memoized match must not survive it.
+    """
+    backend.set_frame(create_game_frame(gold=2))
+    assert screen_helpers.get_gold_with_opencv(2)
+    backend.set_frame(create_game_frame(gold=2))
+    assert screen_helpers.get_gold_with_opencv(2)
+    assert screen_helpers.FRAME_CHANGE_DETECTOR.skipped_matches == 1
+
+    backend.set_frame(create_game_frame(gold=3))
+    assert not screen_helpers.get_gold_with_opencv(2)
+    assert screen_helpers.get_gold_with_opencv(3)
+
+
+def test_parallel_first_hit_keeps_the_order_of_the_paths(
+    backend: SyntheticCaptureBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A hit on a later path that finishes first must not win over a hit on an earlier path, like in the sequential scan.
+    """
+    frame = create_game_frame(gold=2)
+    round_display = cv2.imread(CONSTANTS["game"]["round"]["3-2"])
+    frame[100 : 100 + round_display.shape[0], 200 : 200 + round_display.shape[1]] = round_display
+    backend.set_frame(frame)
+    monkeypatch.setattr(screen_helpers, "ROI_INDEX", RoiIndex())
+    paths = [CONSTANTS["game"]["round"]["3-2"], CONSTANTS["game"]["gold"]["2"]]
+    match_template = screen_helpers._match_template  # pylint: disable=protected-access
+
+    def match_first_path_slowly(
+        frame: Frame, region: screen_helpers.BoundingBox, template: Template, precision: float
+    ) -> screen_helpers.TemplateMatch:
+        if template.key == paths[0]:
+            time.sleep(0.2)
+        return match_template(frame, region, template, precision)
+
+    monkeypatch.setattr(screen_helpers, "_match_template", match_first_path_slowly)
+    window_title = CONSTANTS["window_titles"]["game"]
+    parallel_match = screen_helpers.get_first_on_screen(window_title=window_title, paths=paths, parallel=True)
+    monkeypatch.setattr(screen_helpers, "FRAME_CHANGE_DETECTOR", screen_helpers.FrameChangeDetector())
+    sequential_match = screen_helpers.get_first_on_screen(window_title=window_title, paths=paths)
+
+    assert parallel_match.key == paths[0]
+    assert parallel_match == sequential_match
+
+
+# Item slots the board fixture puts an icon into, by their index in the item coordinates.
+OCCUPIED_ITEM_SLOTS = (0, 3, 4, 8)
+
+
+def create_item_bench_frame(width: int, height: int) -> numpy.ndarray:
+    """
+    Create a game frame with icons on some item slots, rendered at 1920x1080 and rescaled to the window size.
+    There are no captures of items, so the icons are the captures of the PvE round icons, which have the same size.
+
+    Args:
+        width: The width of the window.
+        height: The height of the window.
+
+    Returns:
+        The BGR frame.
+    """
+    generator = numpy.random.default_rng(0)
+    frame = cv2.GaussianBlur(generator.integers(0, 90, (1080, 1920, 3), dtype=numpy.uint8), (7, 7), 0)
+    icons = [cv2.imread(path) for name, path in CONSTANTS["game"]["round"].items() if name.endswith("_active")]
+    for index in OCCUPIED_ITEM_SLOTS:
+        icon = icons[index % len(icons)]
+        center_x, center_y = CONSTANTS["game"]["coordinates"]["items"][index]
+        min_x, min_y = center_x - icon.shape[1] // 2, center_y - icon.shape[0] // 2
+        frame[min_y : min_y + icon.shape[0], min_x : min_x + icon.shape[1]] = icon
+    return cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+
+
+@pytest.mark.parametrize("width,height", [(1920, 1080), (1600, 900)])
+def test_item_slot_deviations_separate_empty_and_occupied_slots(width: int, height: int) -> None:
+    """
+    The slot square scales with the window, so the same slots are told apart at both supported sizes.
+    """
+    previous_backend = get_capture_backend()
+    set_capture_backend(SyntheticCaptureBackend(create_item_bench_frame(width=width, height=height)))
+    try:
+        frame = screen_helpers.get_frame(window_title=CONSTANTS["window_titles"]["game"])
+        deviations = screen_helpers.get_item_slot_deviations(frame=frame)
+    finally:
+        set_capture_backend(previous_backend)
+
+    occupied = numpy.zeros(len(deviations), dtype=bool)
+    occupied[list(OCCUPIED_ITEM_SLOTS)] = True
+    assert deviations[occupied].min() > screen_helpers.ITEM_EMPTY_DEVIATION
+    assert deviations[~occupied].max() <= screen_helpers.ITEM_EMPTY_DEVIATION
+
+
+def test_get_items_hovers_every_slot_that_is_not_clearly_empty(
+    backend: SyntheticCaptureBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A slot is only taken as holding an item if hovering it shows the tooltip of an item, even if it looks occupied.
+    """
+    backend.set_frame(create_item_bench_frame(width=1920, height=1080))
+    item_positions = screen_helpers.calculate_window_click_offsets(
+        window_title=CONSTANTS["window_titles"]["game"], positions=CONSTANTS["game"]["coordinates"]["items"]
+    )
+    hovered_positions = []
+    # Moving the mouse needs a display, so it is recorded instead.
+    monkeypatch.setitem(
+        sys.modules,
+        "tft_bot.helpers.click_helpers",
+        types.SimpleNamespace(
+            move_to=lambda position_x, position_y: hovered_positions.append((position_x, position_y))
+        ),
+    )
+    # The first occupied slot holds something that is not an item, so hovering it shows no tooltip.
+    not_an_item = item_positions[OCCUPIED_ITEM_SLOTS[0]]
+    monkeypatch.setattr(
+        screen_helpers,
+        "_is_item_tooltip_shown",
+        lambda: hovered_positions[-1] != (not_an_item.position_x, not_an_item.position_y),
+    )
+
+    items = screen_helpers.get_items()
+
+    occupied_positions = [
+        (item_positions[index].position_x, item_positions[index].position_y) for index in OCCUPIED_ITEM_SLOTS
+    ]
+    assert hovered_positions == occupied_positions
+    assert [item for item in items if item is not None] == occupied_positions[1:]
@@ -18,22 +18,34 @@ from requests import HTTPError
 from win32process import DETACHED_PROCESS
 
 from tft_bot import config
+from tft_bot.constants import client_error_messages
 from tft_bot.constants import CONSTANTS
 from tft_bot.constants import exit_now_images
 from tft_bot.constants import league_processes
 from tft_bot.constants import message_exit_buttons
 from tft_bot.economy.base import EconomyMode
 from tft_bot.helpers import system_helpers
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
 from tft_bot.helpers.click_helpers import click_to
 from tft_bot.helpers.click_helpers import click_to_image
 from tft_bot.helpers.click_helpers import move_to
 from tft_bot.helpers.click_helpers import press
+from tft_bot.helpers.gold_provider import GOLD_PROVIDER
+from tft_bot.helpers.hud_helpers import classify_round
+from tft_bot.helpers.lifecycle import initialize_helpers
+from tft_bot.helpers.lifecycle import log_helper_statistics
+from tft_bot.helpers.lifecycle import save_helpers
 from tft_bot.helpers.screen_helpers import calculate_window_click_offset
+from tft_bot.helpers.screen_helpers import calculate_window_click_offsets
 from tft_bot.helpers.screen_helpers import check_league_game_size
+from tft_bot.helpers.screen_helpers import get_first_on_screen
 from tft_bot.helpers.screen_helpers import get_on_screen_in_client
 from tft_bot.helpers.screen_helpers import get_on_screen_in_game
 from tft_bot.helpers.screen_helpers import get_round_with_ocr
 from tft_bot.league_api import league_api_integration
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import READY_CHECK_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
 
 auto.FAILSAFE = False
 WIN = LOSS = 0
@@ -273,9 +285,11 @@ def queue() -> None:  # pylint: disable=too-many-branches
             start_queue_repeating = False
             if LCU_INTEGRATION.found_queue() and not LCU_INTEGRATION.queue_accepted():
                 LCU_INTEGRATION.accept_queue()
-                time.sleep(3)
+                LCU_INTEGRATION.wait_for_event(timeout=3, uris=(READY_CHECK_URI, GAMEFLOW_SESSION_URI))
             else:
-                time.sleep(3)
+                LCU_INTEGRATION.wait_for_event(
+                    timeout=3, uris=(SEARCH_STATE_URI, READY_CHECK_URI, GAMEFLOW_SESSION_URI)
+                )
             continue
 
         if not PLAY_NEXT_GAME:
@@ -290,7 +304,7 @@ def queue() -> None:  # pylint: disable=too-many-branches
                 continue
 
             LCU_INTEGRATION.start_queue()
-            time.sleep(3)
+            LCU_INTEGRATION.wait_for_event(timeout=3, uris=(SEARCH_STATE_URI,))
             start_queue_repeating = True
             continue
 
@@ -313,6 +327,8 @@ def loading_match() -> None:
             restart_league_client()
         return
 
+    GAME_CLIENT_INTEGRATION.live_data.reset()
+    GOLD_PROVIDER.reset()
     game_start_timeout = config.get_timeout(config.Timeout.GAME_START, 300)
     logger.info(f"Match loading, waiting for game to start (~{game_start_timeout}s timeout)")
     for _ in range(game_start_timeout):
@@ -338,14 +354,12 @@ def start_match() -> None:
         move_to(position_x=vote_option_offset.position_x, position_y=vote_option_offset.position_y)
         time.sleep(1)
         if get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["vote"]):
-            click_to_image(
-                image_search_result=get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["vote"])
-            )
+            click_to_image(image_search_result=get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["vote"]))
         else:
             click_to(position_x=vote_option_offset.position_x + 270, position_y=vote_option_offset.position_y + 110)
             click_to(position_x=vote_option_offset.position_x + 280, position_y=vote_option_offset.position_y + 120)
             click_to(position_x=vote_option_offset.position_x + 290, position_y=vote_option_offset.position_y + 130)
-            
+
         time.sleep(25)
 
     logger.info("Initial vote complete, continuing with game")
@@ -354,16 +368,13 @@ def start_match() -> None:
 
 def shared_draft_pathing() -> None:
     """Navigate counter-clockwise in a diamond to help ensure a champ is picked up."""
-    top = calculate_window_click_offset(window_title=CONSTANTS["window_titles"]["game"], position_x=946, position_y=315)
-    left = calculate_window_click_offset(
-        window_title=CONSTANTS["window_titles"]["game"], position_x=700, position_y=450
-    )
-    bottom = calculate_window_click_offset(
-        window_title=CONSTANTS["window_titles"]["game"], position_x=950, position_y=675
-    )
-    right = calculate_window_click_offset(
-        window_title=CONSTANTS["window_titles"]["game"], position_x=1200, position_y=460
+    offsets = calculate_window_click_offsets(
+        window_title=CONSTANTS["window_titles"]["game"], positions=[(946, 315), (700, 450), (950, 675), (1200, 460)]
     )
+    if not offsets:
+        return
+
+    top, left, bottom, right = offsets
     click_to(position_x=top.position_x, position_y=top.position_y, action="right")
     time.sleep(2)
     click_to(position_x=left.position_x, position_y=left.position_y, action="right")
@@ -393,32 +404,22 @@ def wait_for_internet() -> None:
         time.sleep(60)
 
 
-def check_if_client_error() -> bool:  # pylint: disable=too-many-return-statements
-    """Check if any client error is detected.
+def check_if_client_error() -> bool:
+    """Check if any client error is detected, matching all known error messages against a single screenshot.
     If any are detected, the League client is restarted.
 
     Returns:
         bool: True if a client error message was detected.
     """
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["down_for_maintenance"]):
-        logger.info("League down for maintenance, delaying restart for 5 minutes!")
-        return acknowledge_error_and_restart_league(delay=300)
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["failed_to_reconnect"]):
-        logger.info("Failed to reconnect!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["login_servers_down"]):
-        logger.info("Login servers down!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["session_expired"]):
-        logger.info("Session expired!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["unexpected_error_with_session"]):
-        logger.info("Unexpected error with session!")
-        return acknowledge_error_and_restart_league()
-    if get_on_screen_in_client(CONSTANTS["client"]["messages"]["unexpected_login_error"]):
-        logger.info("Unexpected login error!")
-        return acknowledge_error_and_restart_league()
-    return False
+    client_error = get_first_on_screen(
+        window_title=CONSTANTS["window_titles"]["client"], paths=list(client_error_messages), parallel=True
+    )
+    if client_error is None:
+        return False
+
+    log_message, delay = client_error_messages[client_error.key]
+    logger.info(log_message)
+    return acknowledge_error_and_restart_league(delay=delay)
 
 
 def acknowledge_error_and_restart_league(delay: int = 5) -> bool:
@@ -448,13 +449,12 @@ def check_screen_for_exit_button() -> bool:
         True if any known exit buttons were found, False if not.
 
     """
-    for image in exit_now_images:
-        if click_to_image(image_search_result=get_on_screen_in_game(image)):
-            logger.info("End of game detected, exiting")
-            break
-    else:
+    exit_button = get_first_on_screen(window_title=CONSTANTS["window_titles"]["game"], paths=exit_now_images)
+    if not click_to_image(image_search_result=exit_button):
         return False
 
+    logger.info("End of game detected, exiting")
+
     time.sleep(5)
     return True
 
@@ -493,10 +493,11 @@ def check_if_game_complete(wait_for_exit_buttons: bool = False) -> bool:
             parse_task_kill_result(kill_process(CONSTANTS["processes"]["game"], force=False))
             graceful_exit_timeout = config.get_timeout(config.Timeout.GRACEFUL_EXIT, 60)
             logger.info(f"Waiting ~{graceful_exit_timeout}s for graceful exit")
-            for _ in range(graceful_exit_timeout):
+            deadline = time.perf_counter() + graceful_exit_timeout
+            while time.perf_counter() < deadline:
                 if not LCU_INTEGRATION.in_game():
                     break
-                time.sleep(1)
+                LCU_INTEGRATION.wait_for_event(timeout=1, uris=(GAMEFLOW_SESSION_URI,))
             else:
                 logger.error("Game did not exit gracefully, restarting everything to be safe")
                 restart_league_client()
@@ -548,35 +549,7 @@ def determine_minimum_round() -> tuple[bool, int]:
     """
     tesseract_location = config.get_tesseract_location(system_helpers=system_helpers)
     if not config.get_round_ocr_config() or tesseract_location is None:
-        output = 0
-
-        if get_on_screen_in_game(CONSTANTS["game"]["round"]["krugs_inactive"], 0.9) or get_on_screen_in_game(
-            CONSTANTS["game"]["round"]["krugs_active"], 0.9
-        ):
-            output = 2
-
-        if get_on_screen_in_game(CONSTANTS["game"]["round"]["wolves_inactive"], 0.9) or get_on_screen_in_game(
-            CONSTANTS["game"]["round"]["wolves_active"], 0.9
-        ):
-            output = 3
-
-        if get_on_screen_in_game(CONSTANTS["game"]["round"]["birds_inactive"], 0.9) or get_on_screen_in_game(
-            CONSTANTS["game"]["round"]["birds_active"], 0.9
-        ):
-            output = 4
-
-        if get_on_screen_in_game(CONSTANTS["game"]["round"]["elder_dragon_inactive"], 0.9) or get_on_screen_in_game(
-            CONSTANTS["game"]["round"]["elder_dragon_active"], 0.9
-        ):
-            output = 5
-
-        if output == 0:
-            for i in range(1, 7):
-                if get_on_screen_in_game(CONSTANTS["game"]["round"][f"{i}-"]):
-                    output = i
-                    break
-
-        return (False, output)
+        return (False, classify_round().stage)
 
     current_round = get_round_with_ocr(tesseract_location=tesseract_location)
     if current_round is not None:
@@ -605,6 +578,10 @@ def main_game_loop(economy_mode: EconomyMode) -> None:
             time.sleep(5)
             continue
 
+        # Every detector of this iteration shares one screenshot and one copy of the live client data,
+        # both taken on first use.
+        FRAME_SNAPSHOT.invalidate()
+        GAME_CLIENT_INTEGRATION.live_data.invalidate()
         post_game = check_if_post_game()
         if post_game:
             match_complete()
@@ -612,8 +589,8 @@ def main_game_loop(economy_mode: EconomyMode) -> None:
 
         current_round = determine_minimum_round()[1]
         major_round = int(str(current_round)[0])
-        press('space')
-        
+        press("space")
+
         # Free champ round
         if major_round > 1 and get_on_screen_in_game(CONSTANTS["game"]["round"]["draft_active"], 0.95):
             logger.info("Active draft detected, pathing to carousel")
@@ -628,8 +605,13 @@ def main_game_loop(economy_mode: EconomyMode) -> None:
             click_to(position_x=augment_offset.position_x, position_y=augment_offset.position_y)
             time.sleep(3)
             continue
-    
-        if prev_round != current_round and prev_round != 0 and current_round != 0 and current_round not in [1, 11, 12, 13, 14]:
+
+        if (
+            prev_round != current_round
+            and prev_round != 0
+            and current_round != 0
+            and current_round not in [1, 11, 12, 13, 14]
+        ):
             event = prev_event + 1
             if (event >= 4 and config.get_item_config() is False) or event >= 5:
                 event = 1
@@ -657,16 +639,12 @@ def end_match() -> None:
 
     Will check for client errors that require a restart.
     """
-    counter = 0
-    while True:
-        if counter >= 60:
+    deadline = time.perf_counter() + 60
+    while LCU_INTEGRATION.in_game():
+        if time.perf_counter() >= deadline:
             restart_league_client()
             return
-        if LCU_INTEGRATION.in_game():
-            counter += 1
-            time.sleep(1)
-            continue
-        break
+        LCU_INTEGRATION.wait_for_event(timeout=1, uris=(GAMEFLOW_SESSION_URI,))
 
     bring_league_client_to_forefront()
     time.sleep(10)
@@ -678,6 +656,7 @@ def match_complete() -> None:
     and begin the end of match logic.
     """
     print_timer()
+    save_helpers()
     logger.info("Match complete! Cleaning up and restarting")
     end_match()
 
@@ -750,7 +729,7 @@ def print_timer() -> None:
         winrate = output[0]
         WIN = output[1]
         LOSS = output[2]
-    
+
     TOTAL = WIN + LOSS
 
     logger.info("-----------------------------------------")
@@ -759,6 +738,9 @@ def print_timer() -> None:
     logger.info(f"Games played: {str(TOTAL)}")
     logger.info(f"Win rate: {winrate}%")
     logger.info("-----------------------------------------")
+    log_helper_statistics()
+    LCU_INTEGRATION.gameflow.log_statistics()
+    GAME_CLIENT_INTEGRATION.live_data.log_statistics()
 
     LAST_TIMER_PRINTED_AT = datetime.now()
 
@@ -945,6 +927,11 @@ def main():
     # retention=10 to only keep the 10 most recent files.
     logger.add(storage_path + "\\tft-bot-debug-{time}.log", level="DEBUG", retention=10)
     system_helpers.disable_quickedit()
+    initialize_helpers(
+        storage_path=storage_path,
+        gold_reader=GAME_CLIENT_INTEGRATION.get_gold,
+        invalidate_gold=GAME_CLIENT_INTEGRATION.live_data.invalidate,
+    )
     # Start auth + main script
     logger.info(
         r"""Initial codebase by:
@@ -1020,4 +1007,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Received wish to exit by CTRL+C, exiting")
         print_timer()
+        save_helpers()
         sys.exit(0)
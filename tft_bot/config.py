@@ -176,6 +176,17 @@ def get_timeout(timeout: Timeout, default: int) -> int:
     return _SELF.get(timeout, default)
 
 
+def get_client_state_ttl() -> float:
+    """
+    Get for how long a state polled from the League client is re-used.
+
+    Returns:
+        The TTL in seconds.
+
+    """
+    return _SELF.get("client_state_ttl", 1.0)
+
+
 def get_tesseract_override_install_location() -> str | None:
     """
     Get the value of the override_tesseract_location setting in the config.
@@ -205,10 +216,11 @@ def get_economy_mode(system_helpers) -> EconomyMode:
         case "default":
             return DefaultEconomyMode(wanted_traits=wanted_traits, prioritized_order=prioritized_order)
         case "ocr_standard":
-            tesseract_location = system_helpers.determine_tesseract_ocr_install_location() + "\\tesseract.exe"
-            if not os.path.isfile(tesseract_location):
+            tesseract_location = system_helpers.determine_tesseract_ocr_executable_location()
+            if tesseract_location is None:
                 logger.warning(
-                    f'Tesseract location "{tesseract_location}" does not exist. Falling back to default economy mode'
+                    f'Tesseract location "{system_helpers.determine_tesseract_ocr_install_location()}\\tesseract.exe" '
+                    "does not exist. Falling back to default economy mode"
                 )
                 return DefaultEconomyMode(wanted_traits=wanted_traits, prioritized_order=prioritized_order)
 
@@ -227,11 +239,7 @@ def get_tesseract_location(system_helpers) -> str | None:
     Returns:
         String or None
     """
-    tesseract_location: str = system_helpers.determine_tesseract_ocr_install_location() + "\\tesseract.exe"
-    if not os.path.isfile(tesseract_location):
-        return None
-
-    return tesseract_location
+    return system_helpers.determine_tesseract_ocr_executable_location()
 
 
 def get_item_config() -> bool:
@@ -274,6 +274,19 @@ message_exit_buttons = [
     CONSTANTS["client"]["messages"]["buttons"]["message_exit"]["2"],
 ]
 
+# Client error messages in the order we check for them, with what to log and how long to wait before restarting.
+client_error_messages = {
+    CONSTANTS["client"]["messages"]["down_for_maintenance"]: (
+        "League down for maintenance, delaying restart for 5 minutes!",
+        300,
+    ),
+    CONSTANTS["client"]["messages"]["failed_to_reconnect"]: ("Failed to reconnect!", 5),
+    CONSTANTS["client"]["messages"]["login_servers_down"]: ("Login servers down!", 5),
+    CONSTANTS["client"]["messages"]["session_expired"]: ("Session expired!", 5),
+    CONSTANTS["client"]["messages"]["unexpected_error_with_session"]: ("Unexpected error with session!", 5),
+    CONSTANTS["client"]["messages"]["unexpected_login_error"]: ("Unexpected login error!", 5),
+}
+
 league_processes = [
     CONSTANTS["processes"]["client"],
     CONSTANTS["processes"]["client_ux"],
@@ -1,12 +1,21 @@
 """
 Module holding the base economy mode blueprint class.
 """
-from time import sleep
 import random
+from time import sleep
 
 from tft_bot.constants import CONSTANTS
-from tft_bot.helpers.click_helpers import click_to, click_to_image, move_to, hold_and_move_to, press
-from tft_bot.helpers.screen_helpers import get_on_screen_in_game, calculate_window_click_offset, get_items, check_champion
+from tft_bot.helpers.click_helpers import click_to
+from tft_bot.helpers.click_helpers import click_to_image
+from tft_bot.helpers.click_helpers import hold_and_move_to
+from tft_bot.helpers.click_helpers import move_to
+from tft_bot.helpers.click_helpers import press
+from tft_bot.helpers.screen_helpers import calculate_window_click_offset
+from tft_bot.helpers.screen_helpers import calculate_window_click_offsets
+from tft_bot.helpers.screen_helpers import check_champion
+from tft_bot.helpers.screen_helpers import get_items
+from tft_bot.helpers.screen_helpers import get_on_screen_in_game
+from tft_bot.helpers.shop_helpers import analyze_shop
 
 
 class EconomyMode:
@@ -43,12 +52,24 @@ class EconomyMode:
         Args:
             amount: The amount of units to purchase.
         """
+        shop_slots = analyze_shop(wanted_traits=self.wanted_traits)
         for _ in range(amount):
+            purchased = False
             for trait in self.wanted_traits:
-                if click_to_image(image_search_result=get_on_screen_in_game(CONSTANTS["game"]["trait"][trait])):
-                    sleep(0.5)
-                elif self.prioritized_order:
-                    return
+                shop_slot = next((shop_slot for shop_slot in shop_slots if trait in shop_slot.traits), None)
+                if shop_slot is None:
+                    if self.prioritized_order:
+                        return
+                    continue
+
+                click_to_image(image_search_result=shop_slot.card)
+                purchased = True
+                sleep(0.5)
+                # Only the shop changes by buying, so only the shop is captured again.
+                shop_slots = analyze_shop(wanted_traits=self.wanted_traits, shop_only=True)
+
+            if not purchased:
+                return
 
     def sell_unit(self, coordinates: tuple[int, int], calculate_offset: bool = True) -> None:
         """
@@ -59,17 +80,21 @@ class EconomyMode:
         calculate_offset: Wether to calculate the offset of the given coordinates or not. Defaults to True
         """
         if calculate_offset:
-            point = calculate_window_click_offset(window_title=CONSTANTS["window_titles"]["game"], position_x=coordinates[0], position_y=coordinates[1])
+            point = calculate_window_click_offset(
+                window_title=CONSTANTS["window_titles"]["game"], position_x=coordinates[0], position_y=coordinates[1]
+            )
             coordinates = (point.position_x, point.position_y)
 
         move_to(position_x=coordinates[0], position_y=coordinates[1])
         sleep(0.5)
 
         if random.randint(0, 1) == 1:
-            sell_offset = calculate_window_click_offset(window_title=CONSTANTS["window_titles"]["game"], position_x=random.randint(800, 1300), position_y=980)
+            sell_offset = calculate_window_click_offset(
+                window_title=CONSTANTS["window_titles"]["game"], position_x=random.randint(800, 1300), position_y=980
+            )
             hold_and_move_to(sell_offset.position_x, sell_offset.position_y)
         else:
-            press('E')
+            press("E")
 
     def roll(self) -> None:
         """
@@ -78,7 +103,7 @@ class EconomyMode:
         if random.randint(0, 1) == 1:
             click_to_image(image_search_result=get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["reroll"]))
         else:
-            press('D')  # hotkey for roll
+            press("D")  # hotkey for roll
 
     def purchase_xp(self) -> None:
         """
@@ -87,25 +112,19 @@ class EconomyMode:
         if random.randint(0, 1) == 1:
             click_to_image(image_search_result=get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["xp_buy"]))
         else:
-            press('F')  # hotkey for xp
+            press("F")  # hotkey for xp
 
     def collect_items(self) -> None:
         """
         Runs a circle (square) around the map, trying to collect items on the way.
         """
-        checkpoint1 = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=550, position_y=620
-        )
-        checkpoint2 = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=1300, position_y=650
-        )
-        checkpoint3 = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=1250, position_y=250
+        checkpoint_list = calculate_window_click_offsets(
+            window_title=CONSTANTS["window_titles"]["game"],
+            positions=[(550, 620), (1300, 650), (1250, 250), (600, 250)],
         )
-        checkpoint4 = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=600, position_y=250
-        )
-        checkpoint_list = [checkpoint1, checkpoint2, checkpoint3, checkpoint4]
+        if not checkpoint_list:
+            return
+
         random.shuffle(checkpoint_list)
         for point in checkpoint_list:
             click_to(position_x=point.position_x, position_y=point.position_y, action="right")
@@ -116,9 +135,9 @@ class EconomyMode:
         Walks to a random point on the field.
         """
         goal_offset = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], 
-            position_x=random.randint(500, 1200), 
-            position_y=random.randint(300, 650)
+            window_title=CONSTANTS["window_titles"]["game"],
+            position_x=random.randint(500, 1200),
+            position_y=random.randint(300, 650),
         )
 
         click_to(position_x=goal_offset.position_x, position_y=goal_offset.position_y, action="right")
@@ -150,7 +169,9 @@ class EconomyMode:
         sleep(0.5)
 
         champion_offset = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=target_champion[0], position_y=target_champion[1]
+            window_title=CONSTANTS["window_titles"]["game"],
+            position_x=target_champion[0],
+            position_y=target_champion[1],
         )
         hold_and_move_to(champion_offset.position_x, champion_offset.position_y)
         sleep(0.5)
@@ -165,7 +186,7 @@ class EconomyMode:
         from tft import GAME_CLIENT_INTEGRATION
 
         level = GAME_CLIENT_INTEGRATION.get_level()
-        board_targets = CONSTANTS["game"]["coordinates"]["board"][:level + 2]
+        board_targets = CONSTANTS["game"]["coordinates"]["board"][: level + 2]
 
         return board_targets
 
@@ -179,7 +200,11 @@ class EconomyMode:
         bench_champions = []
         # safe_point = calculate_window_click_offset(CONSTANTS["window_titles"]["game"], position_x=800, position_y=625)
         for coordinates in self.bench_targets:
-            point = calculate_window_click_offset(window_title=CONSTANTS["window_titles"]["game"], position_x=coordinates[0], position_y=coordinates[1]-25)
+            point = calculate_window_click_offset(
+                window_title=CONSTANTS["window_titles"]["game"],
+                position_x=coordinates[0],
+                position_y=coordinates[1] - 25,
+            )
 
             click_to(position_x=point.position_x, position_y=point.position_y, action="right")
 
@@ -198,7 +223,9 @@ class EconomyMode:
         board_champions = []
         board_targets = self.get_board_targets()
         for coordinates in board_targets:
-            point = calculate_window_click_offset(window_title=CONSTANTS["window_titles"]["game"], position_x=coordinates[0], position_y=coordinates[1])
+            point = calculate_window_click_offset(
+                window_title=CONSTANTS["window_titles"]["game"], position_x=coordinates[0], position_y=coordinates[1]
+            )
 
             click_to(position_x=point.position_x, position_y=point.position_y, action="right")
 
@@ -225,13 +252,14 @@ class EconomyMode:
         Sells all champions we don't want on the board.
         """
         ocr_round = False
-        # if we are using ocr, we get rounds as double digits (12, 34, 55 etc). That means if the int is > 8, we are using ocr
+        # if we are using ocr, we get rounds as double digits (12, 34, 55 etc).
+        # That means if the int is > 8, we are using ocr
         if current_round > 8:
             ocr_round = True
 
         board_champions = self.check_board()
         board_targets = self.get_board_targets()
-        
+
         known_champions = []
         index = 0
         for champion in board_champions:
@@ -241,10 +269,12 @@ class EconomyMode:
                 sleep(0.1)
 
             # this sells duplicate champs, even if they have the trait we want. Only triggers round 4 onwards
-            elif ((ocr_round and current_round > 40) or (not ocr_round and current_round > 3)) and champion in known_champions:
+            elif (
+                (ocr_round and current_round > 40) or (not ocr_round and current_round > 3)
+            ) and champion in known_champions:
                 target = board_targets[index]
                 self.sell_unit(target)
                 sleep(0.1)
-            
+
             known_champions.append(champion)
-            index += 1
\ No newline at end of file
+            index += 1
@@ -1,15 +1,17 @@
 """
 Module holding the default economy mode.
 """
-import time
 import random
+import time
 
 from loguru import logger
+
 from tft import GAME_CLIENT_INTEGRATION
 
-from ..helpers import screen_helpers
+# config imports this module, so it is imported as a module to not need get_item_config while config is loading.
+from .. import config
+from ..helpers import gold_provider
 from .base import EconomyMode
-# from ..config import get_item_config
 
 
 class DefaultEconomyMode(EconomyMode):
@@ -36,18 +38,18 @@ class DefaultEconomyMode(EconomyMode):
         self.walk_random()
         time.sleep(0.5)
 
-        if screen_helpers.gold_at_least(3):
+        if gold_provider.gold_at_least(3):
             self.purchase_units(amount=3)
             time.sleep(0.5)
 
-        if random.randint(0, 8) == 1 and get_item_config():    
+        if random.randint(0, 8) == 1 and config.get_item_config():
             self.place_items()
             time.sleep(0.5)
 
         if current_round[1] < 2:
             return
 
-        if screen_helpers.gold_at_least(4) and GAME_CLIENT_INTEGRATION.get_level() < 8:
+        if gold_provider.gold_at_least(4) and GAME_CLIENT_INTEGRATION.get_level() < 8:
             self.purchase_xp()
             time.sleep(0.5)
             if current_round[1] >= 4:
@@ -64,6 +66,6 @@ class DefaultEconomyMode(EconomyMode):
         if current_round[1] < 3:
             return
 
-        if screen_helpers.gold_at_least(5):
+        if gold_provider.gold_at_least(5):
             self.roll()
             time.sleep(0.5)
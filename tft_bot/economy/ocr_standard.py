@@ -2,21 +2,22 @@
 Module holding the OCR standard economy mode.
 """
 from loguru import logger
-from pytesseract import pytesseract
 
 from tft import GAME_CLIENT_INTEGRATION
 
-from ..helpers import screen_helpers
+from ..helpers import hud_helpers
+from ..helpers.ocr_helpers import OCR_SERVICE
 from .base import EconomyMode
 
+
 class OCRStandardEconomyMode(EconomyMode):
     """
     OCR standard economy mode implementation.
     """
 
-    def __init__(self, wanted_traits: list[str], prioritized_order: bool, tesseract_location: str): 
+    def __init__(self, wanted_traits: list[str], prioritized_order: bool, tesseract_location: str):
         super().__init__(wanted_traits, prioritized_order)
-        pytesseract.tesseract_cmd = tesseract_location
+        OCR_SERVICE.set_tesseract_location(tesseract_location)
 
     def loop_decision(self, current_round: int, event: int):
         if event != 0:
@@ -41,12 +42,17 @@ class OCRStandardEconomyMode(EconomyMode):
         if current_round <= 30:
             return
 
-        gold = screen_helpers.get_gold_with_ocr()
-        logger.debug(f"OCR recognized {gold} gold")
+        hud_state = hud_helpers.read_hud(level_provider=GAME_CLIENT_INTEGRATION.get_level, use_ocr=True)
+        gold = hud_state.gold or 0
+        level = hud_state.level or 0
+        logger.debug(f"Read {gold} gold")
 
-        while (gold >= 58 or current_round >= 60 and gold >= 24) and GAME_CLIENT_INTEGRATION.get_level() < 8:
+        while (gold >= 58 or current_round >= 60 and gold >= 24) and level < 8:
             self.purchase_xp()
             gold -= 4
+            # Buying XP may level us up, so the level is fetched again instead of taken from the data of this tick.
+            GAME_CLIENT_INTEGRATION.live_data.invalidate()
+            level = GAME_CLIENT_INTEGRATION.get_level()
 
         if gold >= 55 or (current_round >= 60 and gold >= 35):
-            self.roll()
\ No newline at end of file
+            self.roll()
@@ -0,0 +1,415 @@
+"""A collection of capture helpers, so every detector of a loop iteration can share a single screenshot."""
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+import os
+import time
+
+import cv2
+from loguru import logger
+import mss
+import numpy
+
+try:
+    import win32gui
+except ImportError:
+    # Only the file and synthetic backends are usable without pywin32, e.g. to run detectors headless.
+    win32gui = None
+
+
+class CaptureBackend:
+    """
+    Blueprint class for the ways we can locate a window and get its pixels.
+    """
+
+    def locate_window(self, window_title: str) -> tuple[int, int, int, int] | None:
+        """
+        Locate a window on the screen.
+
+        Args:
+            window_title: The title of the window to locate.
+
+        Returns:
+            The absolute bounding box of the window (min x, min y, max x, max y) or None if it does not exist.
+        """
+        raise NotImplementedError
+
+    def grab(self, bounding_box: tuple[int, int, int, int]) -> numpy.ndarray:
+        """
+        Grab the pixels of a region of the screen.
+
+        Args:
+            bounding_box: The absolute region to grab (min x, min y, max x, max y).
+
+        Returns:
+            The pixels of the region as a BGRA array.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release any resources held by the backend.
+        """
+
+
+class MssCaptureBackend(CaptureBackend):
+    """
+    Captures the real screen through a single mss instance that is kept alive between grabs.
+    mss instances are bound to the thread that created them, so this backend should only be used from the bot thread.
+    """
+
+    def __init__(self):
+        self._screenshot_taker: mss.base.MSSBase | None = None
+        self._window_handles: dict[str, int] = {}
+
+    def locate_window(self, window_title: str) -> tuple[int, int, int, int] | None:
+        if win32gui is None:
+            return None
+
+        # Looking up a window by its title walks every top level window, so the handle is kept until it is closed.
+        window_handle = self._window_handles.get(window_title)
+        if not window_handle or not win32gui.IsWindow(window_handle):
+            window_handle = win32gui.FindWindowEx(0, 0, 0, window_title)
+            if not window_handle:
+                self._window_handles.pop(window_title, None)
+                return None
+            self._window_handles[window_title] = window_handle
+
+        return win32gui.GetWindowRect(window_handle)
+
+    def grab(self, bounding_box: tuple[int, int, int, int]) -> numpy.ndarray:
+        if self._screenshot_taker is None:
+            self._screenshot_taker = mss.mss()
+
+        screenshot = self._screenshot_taker.grab(bounding_box)
+        # A view of the buffer mss already allocated for the screenshot, instead of copying it into a new array.
+        return numpy.frombuffer(screenshot.raw, dtype=numpy.uint8).reshape(screenshot.height, screenshot.width, 4)
+
+    def close(self) -> None:
+        if self._screenshot_taker is not None:
+            self._screenshot_taker.close()
+            self._screenshot_taker = None
+
+
+class SyntheticCaptureBackend(CaptureBackend):
+    """
+    Serves an in-memory frame as if it was a window located at the top left of the screen.
+    Useful to run detectors headless or to benchmark them without the capture cost.
+    """
+
+    def __init__(self, frame: numpy.ndarray | None = None, window_titles: set[str] | None = None):
+        """
+        Args:
+            frame: The pixels to serve, either gray-scaled, BGR or BGRA. Defaults to None, which means no window exists.
+            window_titles: The titles of the windows the frame should be served for. Defaults to None, meaning all.
+        """
+        self._frame: numpy.ndarray | None = None
+        self.window_titles = window_titles
+        if frame is not None:
+            self.set_frame(frame)
+
+    def set_frame(self, frame: numpy.ndarray) -> None:
+        """
+        Replace the frame that is served.
+
+        Args:
+            frame: The pixels to serve, either gray-scaled, BGR or BGRA.
+        """
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGRA)
+        elif frame.shape[2] == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)
+        self._frame = frame
+        # A shared frame of the previous pixels would be stale now.
+        FRAME_SNAPSHOT.invalidate()
+
+    def locate_window(self, window_title: str) -> tuple[int, int, int, int] | None:
+        if self._frame is None or (self.window_titles is not None and window_title not in self.window_titles):
+            return None
+
+        return 0, 0, self._frame.shape[1], self._frame.shape[0]
+
+    def grab(self, bounding_box: tuple[int, int, int, int]) -> numpy.ndarray:
+        min_x, min_y, max_x, max_y = bounding_box
+        pixels = numpy.zeros((max_y - min_y, max_x - min_x, 4), dtype=numpy.uint8)
+        if self._frame is None:
+            return pixels
+
+        # Anything outside of the frame stays black, like the screen around a window would be.
+        clipped_min_x, clipped_min_y = max(min_x, 0), max(min_y, 0)
+        clipped_max_x, clipped_max_y = min(max_x, self._frame.shape[1]), min(max_y, self._frame.shape[0])
+        if clipped_min_x < clipped_max_x and clipped_min_y < clipped_max_y:
+            pixels[
+                clipped_min_y - min_y : clipped_max_y - min_y, clipped_min_x - min_x : clipped_max_x - min_x
+            ] = self._frame[clipped_min_y:clipped_max_y, clipped_min_x:clipped_max_x]
+        return pixels
+
+
+class DirectoryCaptureBackend(SyntheticCaptureBackend):
+    """
+    Serves recorded PNG frames from a directory, one after another, in file name order.
+    """
+
+    def __init__(self, directory: str, loop: bool = True, window_titles: set[str] | None = None):
+        """
+        Args:
+            directory: The directory holding the recorded frames.
+            loop: Whether to start from the first frame again after the last one. Defaults to True.
+            window_titles: The titles of the windows the frames should be served for. Defaults to None, meaning all.
+        """
+        super().__init__(window_titles=window_titles)
+        self.paths = sorted(
+            os.path.join(directory, file_name) for file_name in os.listdir(directory) if file_name.endswith(".png")
+        )
+        self.loop = loop
+        self.index = -1
+        self.advance()
+
+    def advance(self) -> bool:
+        """
+        Move on to the next recorded frame.
+
+        Returns:
+            True if there was a next frame, False if all frames were served and we are not looping.
+        """
+        if not self.paths or (self.index + 1 >= len(self.paths) and not self.loop):
+            return False
+
+        self.index = (self.index + 1) % len(self.paths)
+        frame = cv2.imread(self.paths[self.index], cv2.IMREAD_UNCHANGED)
+        if frame is None:
+            logger.warning(f"The recorded frame {self.paths[self.index]} could not be read")
+            return False
+
+        self.set_frame(frame)
+        return True
+
+
+_CAPTURE_BACKEND: CaptureBackend = MssCaptureBackend()
+
+
+def get_capture_backend() -> CaptureBackend:
+    """
+    Get the backend all screen helpers capture through.
+
+    Returns:
+        The currently active capture backend.
+    """
+    return _CAPTURE_BACKEND
+
+
+def set_capture_backend(backend: CaptureBackend) -> None:
+    """
+    Replace the backend all screen helpers capture through, closing the previous one.
+
+    Args:
+        backend: The new capture backend.
+    """
+    global _CAPTURE_BACKEND
+    _CAPTURE_BACKEND.close()
+    _CAPTURE_BACKEND = backend
+    FRAME_SNAPSHOT.invalidate()
+
+
+class BufferPool:
+    """
+    Hands out preallocated arrays, so converting every frame does not allocate new ones.
+    Every name and shape has depth buffers that are handed out in turn, so an array stays intact until depth more
+    arrays of the same name and shape were requested. Only the least recently used max_keys names and shapes are kept,
+    so resizing a window does not grow the pool forever.
+    """
+
+    def __init__(self, depth: int = 2, max_keys: int = 16):
+        """
+        Args:
+            depth: The amount of buffers per name and shape. Defaults to 2, so the previous frame stays intact.
+            max_keys: The amount of names and shapes to keep buffers for. Defaults to 16.
+        """
+        self.depth = depth
+        self.max_keys = max_keys
+        self._buffers: OrderedDict[tuple, tuple[list[numpy.ndarray], int]] = OrderedDict()
+        self.allocations = 0
+        self.reuses = 0
+
+    def get(self, name: str, shape: tuple[int, ...], dtype: numpy.dtype = numpy.uint8) -> numpy.ndarray:
+        """
+        Get a buffer to write into. Its content is whatever was written into it the last time it was handed out.
+
+        Args:
+            name: What the buffer is used for, so different uses of the same shape do not share buffers.
+            shape: The shape of the buffer.
+            dtype: The type of the buffer. Defaults to numpy.uint8.
+
+        Returns:
+            A writable, contiguous array.
+        """
+        key = (name, tuple(shape), numpy.dtype(dtype))
+        buffers, next_index = self._buffers.pop(key, ([], 0))
+        if len(buffers) < self.depth:
+            buffers.append(numpy.empty(shape, dtype=dtype))
+            self.allocations += 1
+            next_index = len(buffers) - 1
+        else:
+            self.reuses += 1
+
+        self._buffers[key] = (buffers, (next_index + 1) % self.depth)
+        if len(self._buffers) > self.max_keys:
+            self._buffers.popitem(last=False)
+        return buffers[next_index]
+
+    def clear(self) -> None:
+        """
+        Release every buffer.
+        """
+        self._buffers.clear()
+
+    def log_statistics(self) -> None:
+        """
+        Log how many buffers were allocated and how often one was re-used instead.
+        """
+        logger.debug(f"Buffer pool: {self.allocations} allocations, {self.reuses} re-uses")
+
+
+BUFFER_POOL = BufferPool()
+
+
+@dataclass
+class Frame:
+    """
+    A dataclass holding a single screenshot of a window and the views derived from it.
+    The pixel arrays are read-only, since every detector of a loop iteration shares them.
+    The gray-scaled pixels are converted into a buffer of BUFFER_POOL, so they are only valid until two more frames
+    of the same size were converted. Detectors should not hold on to a frame across captures.
+    """
+
+    window_title: str
+    bounding_box: tuple[int, int, int, int]
+    pixels: numpy.ndarray
+    captured_at: float
+    scale: tuple[float, float] = (1.0, 1.0)
+    _gray: numpy.ndarray | None = field(default=None, repr=False)
+    _downscaled_gray: dict[int, numpy.ndarray] = field(default_factory=dict, repr=False)
+
+    def get_gray(self) -> numpy.ndarray:
+        """
+        Get the gray-scaled pixels of the frame. They are only converted once, on first access.
+
+        Returns:
+            A read-only 2D array of the gray-scaled frame.
+        """
+        if self._gray is None:
+            gray = BUFFER_POOL.get(name="gray", shape=self.pixels.shape[:2])
+            cv2.cvtColor(self.pixels, cv2.COLOR_BGRA2GRAY, dst=gray)
+            # The pooled buffer itself stays writable for the next conversion, detectors only get a read-only view.
+            self._gray = gray.view()
+            self._gray.flags.writeable = False
+        return self._gray
+
+    def get_downscaled_gray(self, level: int) -> numpy.ndarray:
+        """
+        Get the gray-scaled pixels of the frame, downscaled by 2 to the power of level.
+        Every level is only computed once, on first access.
+
+        Args:
+            level: The pyramid level, 1 for half the size, 2 for a quarter and so on.
+
+        Returns:
+            A read-only 2D array of the downscaled, gray-scaled frame.
+        """
+        if level not in self._downscaled_gray:
+            scale = 2**level
+            gray = self.get_gray()
+            downscaled_gray = cv2.resize(
+                gray, (gray.shape[1] // scale, gray.shape[0] // scale), interpolation=cv2.INTER_AREA
+            )
+            downscaled_gray.flags.writeable = False
+            self._downscaled_gray[level] = downscaled_gray
+        return self._downscaled_gray[level]
+
+    def get_width(self) -> int:
+        """
+        Get the width of the frame.
+
+        Returns:
+            The width in pixels.
+        """
+        return self.pixels.shape[1]
+
+    def get_height(self) -> int:
+        """
+        Get the height of the frame.
+
+        Returns:
+            The height in pixels.
+        """
+        return self.pixels.shape[0]
+
+
+class FrameSnapshot:
+    """
+    Hands out one shared frame per window until it gets stale.
+    A frame is stale once it is older than max_age or after any input was sent (see invalidate).
+    """
+
+    def __init__(self, max_age: float = 0.75):
+        """
+        Args:
+            max_age: The amount of seconds a frame may be re-used for. Defaults to 0.75.
+        """
+        self.max_age = max_age
+        self._frames: dict[str, Frame] = {}
+        self.captures = 0
+        self.reuses = 0
+
+    def get(
+        self, window_title: str, bounding_box: tuple[int, int, int, int], scale: tuple[float, float] = (1.0, 1.0)
+    ) -> Frame:
+        """
+        Get the current frame of a window, capturing a new one if there is no fresh one.
+
+        Args:
+            window_title: The title of the window the frame belongs to.
+            bounding_box: The absolute bounding box of the window (min x, min y, max x, max y).
+            scale: The factors to scale native coordinates of the window by to get frame coordinates.
+              Defaults to (1.0, 1.0).
+
+        Returns:
+            The shared frame of the window.
+        """
+        frame = self._frames.get(window_title)
+        if (
+            frame is not None
+            and frame.bounding_box == bounding_box
+            and time.perf_counter() - frame.captured_at < self.max_age
+        ):
+            self.reuses += 1
+            return frame
+
+        pixels = get_capture_backend().grab(bounding_box)
+        pixels.flags.writeable = False
+        frame = Frame(
+            window_title=window_title,
+            bounding_box=bounding_box,
+            pixels=pixels,
+            captured_at=time.perf_counter(),
+            scale=scale,
+        )
+        self._frames[window_title] = frame
+        self.captures += 1
+        return frame
+
+    def invalidate(self) -> None:
+        """
+        Mark every frame as stale, so the next detector captures a new one.
+        Called at the start of each game loop iteration and after every input we send.
+        """
+        self._frames.clear()
+
+    def log_statistics(self) -> None:
+        """
+        Log how many frames were captured and how often a frame was shared instead.
+        """
+        logger.debug(f"Frame snapshot: {self.captures} captures, {self.reuses} re-uses")
+
+
+FRAME_SNAPSHOT = FrameSnapshot()
@@ -1,14 +1,16 @@
 """A collection of click helpers."""
 import random
 import time
+
 import keyboard
 from pyHM import mouse
 
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.gold_provider import GOLD_PROVIDER
 from tft_bot.helpers.screen_helpers import ImageSearchResult
 
 
 def click(delay=0.1, button="left") -> None:
-   
     """A click helper to simulate clicking the specified button.
 
     Args:
@@ -19,6 +21,8 @@ def click(delay=0.1, button="left") -> None:
     mouse.down(button=button)
     time.sleep(delay)
     mouse.up(button=button)
+    FRAME_SNAPSHOT.invalidate()
+    GOLD_PROVIDER.invalidate()
 
 
 def move_to(
@@ -35,6 +39,7 @@ def move_to(
     position_x = position_x + random.randint(0, 2)
     position_y = position_y + random.randint(0, 2)
     mouse.move(position_x, position_y, multiplier=0.6)
+    FRAME_SNAPSHOT.invalidate()
 
 
 def click_to(
@@ -103,6 +108,9 @@ def hold_and_move_to(position_x: int, position_y: int, action: str = "left"):
     move_to(position_x, position_y)
     time.sleep(0.1)
     mouse.up(button=action)
+    FRAME_SNAPSHOT.invalidate()
+    GOLD_PROVIDER.invalidate()
+
 
 def press(key: str) -> None:
     """
@@ -113,4 +121,6 @@ def press(key: str) -> None:
     """
     keyboard.press(key)
     time.sleep(0.1)
-    keyboard.release(key)
\ No newline at end of file
+    keyboard.release(key)
+    FRAME_SNAPSHOT.invalidate()
+    GOLD_PROVIDER.invalidate()
@@ -0,0 +1,127 @@
+"""A fuzzy lookup of OCR results in a fixed set of names, built once instead of scanning every name per lookup."""
+from collections import Counter
+from difflib import SequenceMatcher
+import functools
+from typing import Iterable
+
+# The similarity ratio a name needs with an OCR result to count as read.
+SIMILARITY_THRESHOLD = 0.7
+
+
+def _get_trigrams(text: str) -> set[str]:
+    """
+    Get the trigrams of a text, padded so the start and end of the text form trigrams as well.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The set of trigrams.
+    """
+    padded_text = f"  {text} "
+    return {padded_text[index : index + 3] for index in range(len(padded_text) - 2)}
+
+
+class FuzzyIndex:
+    """
+    Looks up which name an OCR result is, with the same semantics as scanning the names in order and taking the first
+    that is contained in the result or has a SequenceMatcher ratio of at least the threshold with it.
+    Names that cannot reach the threshold by their length or character counts are skipped without building a matcher.
+    """
+
+    def __init__(self, names: Iterable[str], threshold: float = SIMILARITY_THRESHOLD):
+        """
+        Args:
+            names: The names to look up, in the order they should be preferred in.
+            threshold: The ratio a name needs to count as matched. Defaults to SIMILARITY_THRESHOLD.
+        """
+        self.names = list(dict.fromkeys(names))
+        self.threshold = threshold
+        self._character_counts = [Counter(name) for name in self.names]
+        self._trigram_index: dict[str, list[int]] = {}
+        for index, name in enumerate(self.names):
+            for trigram in _get_trigrams(name):
+                self._trigram_index.setdefault(trigram, []).append(index)
+
+    def _get_ratio(self, index: int, text: str, text_counts: Counter, matcher: SequenceMatcher) -> float:
+        """
+        Get the similarity ratio of a name and a text, or an upper bound of it if that is below the threshold.
+
+        Args:
+            index: The index of the name.
+            text: The text to compare the name with.
+            text_counts: The character counts of the text.
+            matcher: A SequenceMatcher that already has the text set as its second sequence.
+
+        Returns:
+            The ratio, which is exact if it is at least the threshold.
+        """
+        name = self.names[index]
+        length_sum = len(name) + len(text)
+        if not length_sum:
+            return 1.0
+
+        # Like SequenceMatcher.real_quick_ratio and quick_ratio, but without building a matcher per name.
+        upper_bound = 2.0 * min(len(name), len(text)) / length_sum
+        if upper_bound < self.threshold:
+            return upper_bound
+        upper_bound = 2.0 * sum((self._character_counts[index] & text_counts).values()) / length_sum
+        if upper_bound < self.threshold:
+            return upper_bound
+
+        matcher.set_seq1(name)
+        return matcher.ratio()
+
+    def match(self, text: str) -> str | None:
+        """
+        Get the first name that is contained in the text or similar enough to it.
+
+        Args:
+            text: The OCR result to look up.
+
+        Returns:
+            The name or None if no name matched.
+        """
+        text_counts = Counter(text)
+        matcher = SequenceMatcher(b=text)
+        for index, name in enumerate(self.names):
+            if name in text or self._get_ratio(index, text, text_counts, matcher) >= self.threshold:
+                return name
+        return None
+
+    def get_candidates(self, text: str, top_k: int = 3) -> list[tuple[str, float]]:
+        """
+        Get the names most similar to the text, among the names sharing at least one trigram with it.
+
+        Args:
+            text: The OCR result to look up.
+            top_k: The amount of candidates to return at most. Defaults to 3.
+
+        Returns:
+            The names and their similarity ratio, best first. Names contained in the text have a ratio of 1,
+            ratios below the threshold are upper bounds.
+        """
+        indices = {index for trigram in _get_trigrams(text) for index in self._trigram_index.get(trigram, ())}
+        text_counts = Counter(text)
+        matcher = SequenceMatcher(b=text)
+        candidates = []
+        for index in sorted(indices):
+            name = self.names[index]
+            ratio = 1.0 if name in text else self._get_ratio(index, text, text_counts, matcher)
+            candidates.append((name, ratio))
+        candidates.sort(key=lambda candidate: candidate[1], reverse=True)
+        return candidates[:top_k]
+
+
+@functools.lru_cache(maxsize=32)
+def get_fuzzy_index(names: tuple[str, ...]) -> FuzzyIndex:
+    """
+    Get the fuzzy index of a set of names, building it only the first time the set is seen.
+
+    Args:
+        names: The names to look up, in the order they should be preferred in.
+
+    Returns:
+        The index.
+    """
+    return FuzzyIndex(names)
@@ -0,0 +1,339 @@
+"""An atlas of the digit glyphs of the HUD, so its numbers are read by comparing glyphs instead of with Tesseract."""
+import json
+import os
+import threading
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+
+# The size every glyph is normalized to before it is compared to the atlas.
+GLYPH_SIZE = 16
+# The correlation a glyph needs with its closest atlas glyph to be recognized.
+GLYPH_MIN_SCORE = 0.75
+# How much closer a glyph has to be to its digit than to any other digit, so look-alikes like 3 and 5 are not guessed.
+# Leaving each capture out of the atlas, the smallest margin of a correctly read glyph is 0.09.
+GLYPH_MIN_MARGIN = 0.08
+# Every digit a number can have, like the gold display shows them.
+GLYPH_DIGITS = "0123456789"
+# How many glyphs the atlas learns per digit, on top of the ones of the captures.
+GLYPH_MAX_LEARNED = 4
+
+
+def _segment_glyphs(gray_scaled_pixels: numpy.ndarray) -> list[str | numpy.ndarray]:
+    """
+    Split bright text on a dark background into its glyphs, from left to right.
+
+    Args:
+        gray_scaled_pixels: The gray-scaled pixels of a single line of text.
+
+    Returns:
+        Every glyph normalized to a flat, zero mean and unit length vector of GLYPH_SIZE x GLYPH_SIZE pixels,
+        or "-" for glyphs shaped like a dash.
+    """
+    _, mask = cv2.threshold(gray_scaled_pixels, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    component_count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    if component_count <= 1:
+        return []
+
+    stats = stats[1:]
+    max_height = stats[:, cv2.CC_STAT_HEIGHT].max()
+    glyphs = []
+    for min_x, min_y, width, height, _ in sorted(stats.tolist()):
+        if height < max_height * 0.5:
+            if width > height and height < max_height * 0.4:
+                glyphs.append("-")
+            continue
+
+        glyph = mask[min_y : min_y + height, min_x : min_x + width]
+        scaled_width = max(1, min(GLYPH_SIZE, round(width * GLYPH_SIZE / height)))
+        glyph = cv2.resize(glyph, (scaled_width, GLYPH_SIZE), interpolation=cv2.INTER_AREA).astype(numpy.float32)
+        canvas = numpy.zeros((GLYPH_SIZE, GLYPH_SIZE), dtype=numpy.float32)
+        offset = (GLYPH_SIZE - scaled_width) // 2
+        canvas[:, offset : offset + scaled_width] = glyph
+        canvas = canvas.ravel() - canvas.mean()
+        glyphs.append(canvas / (numpy.linalg.norm(canvas) or 1.0))
+
+    return glyphs
+
+
+class GlyphAtlas:
+    """
+    Holds the known glyph of every digit, built from the gold and round captures.
+    The captures do not show every digit, so the atlas learns the missing ones from reads labelled by a source that
+    knows the exact number, like the live client gold or OCR, and keeps them between runs if a path is set.
+
+    A field is only read if the atlas knows every digit it can show, since reading with a partial atlas would map
+    unknown digits to known ones. A learned glyph must not look like any known digit, so a display that lags behind
+    its label is not learned, and it is only trusted once a read of another number confirms it.
+    """
+
+    def __init__(self, max_learned: int = GLYPH_MAX_LEARNED):
+        """
+        Args:
+            max_learned: The amount of glyphs to learn per digit. Defaults to GLYPH_MAX_LEARNED.
+        """
+        self.max_learned = max_learned
+        self._atlas: tuple[numpy.ndarray, list[str]] | None = None
+        self._learned: dict[str, list[numpy.ndarray]] = {}
+        # Glyphs of digits the atlas does not know yet, with the text they were labelled by, waiting for confirmation.
+        self._pending: dict[str, list[tuple[str, numpy.ndarray]]] = {}
+        self._lock = threading.Lock()
+        self._path: str | None = None
+        self._dirty = False
+
+    def _get_glyphs(self) -> tuple[numpy.ndarray, list[str]]:
+        """
+        Get the glyphs of the atlas, building them from the captures on first use.
+
+        Returns:
+            A matrix with one normalized glyph per row and the digit of every row.
+        """
+        if self._atlas is None:
+            glyphs, digits = _get_capture_glyphs()
+            for digit, learned_glyphs in self._learned.items():
+                glyphs.extend(learned_glyphs)
+                digits.extend(digit * len(learned_glyphs))
+            self._atlas = (numpy.array(glyphs).reshape(-1, GLYPH_SIZE * GLYPH_SIZE), digits)
+            logger.debug(f"Built a glyph atlas of {len(digits)} glyphs for the digits {''.join(sorted(set(digits)))}")
+        return self._atlas
+
+    def knows(self, digits: str) -> bool:
+        """
+        Check if the atlas has a glyph for every digit.
+
+        Args:
+            digits: The digits to check.
+
+        Returns:
+            True if every digit is known, False otherwise.
+        """
+        with self._lock:
+            return set(digits).issubset(self._get_glyphs()[1])
+
+    def _score(self, digit_glyphs: list[numpy.ndarray], digits: str) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Find the closest digit of every glyph, among the given digits.
+
+        Args:
+            digit_glyphs: The normalized glyphs.
+            digits: The digits the glyphs can be, all of them known to the atlas.
+
+        Returns:
+            The index of the closest digit of every glyph in digits, and whether it was recognized as that digit.
+        """
+        glyphs, atlas_digits = self._get_glyphs()
+        scores = numpy.array(digit_glyphs) @ glyphs.T
+        atlas_digit_array = numpy.array(atlas_digits)
+        digit_scores = numpy.stack([scores[:, atlas_digit_array == digit].max(axis=1) for digit in digits], axis=1)
+        if len(digits) == 1:
+            best_scores = digit_scores[:, 0]
+            return numpy.zeros(len(digit_glyphs), dtype=int), best_scores >= GLYPH_MIN_SCORE
+
+        best_scores, second_best_scores = numpy.sort(digit_scores, axis=1)[:, :-3:-1].T
+        recognized = (best_scores >= GLYPH_MIN_SCORE) & (best_scores - second_best_scores >= GLYPH_MIN_MARGIN)
+        return digit_scores.argmax(axis=1), recognized
+
+    def read(self, gray_scaled_pixels: numpy.ndarray, digits: str = GLYPH_DIGITS) -> str | None:
+        """
+        Read the digits (and dashes) of bright text on a dark background by comparing its glyphs to the atlas.
+
+        Args:
+            gray_scaled_pixels: The gray-scaled pixels of a single line of text.
+            digits: Every digit the text can show. Defaults to GLYPH_DIGITS.
+
+        Returns:
+            The text that was read or None if the atlas does not know every digit, there was no text
+            or any glyph after the first digit was not recognized.
+        """
+        if not self.knows(digits):
+            return None
+
+        segmented = _segment_glyphs(gray_scaled_pixels)
+        digit_glyphs = [glyph for glyph in segmented if not isinstance(glyph, str)]
+        if not digit_glyphs:
+            return None
+
+        with self._lock:
+            best_digits, recognized = self._score(digit_glyphs, digits)
+        # Icons in front of the text, like the coin of the gold display, are not part of it.
+        first_recognized = recognized.argmax()
+        if not recognized[first_recognized:].all():
+            return None
+
+        text = []
+        digit_index = 0
+        for glyph in segmented:
+            if isinstance(glyph, str):
+                if digit_index >= first_recognized:
+                    text.append(glyph)
+                continue
+            if digit_index >= first_recognized:
+                text.append(digits[best_digits[digit_index]])
+            digit_index += 1
+        return "".join(text)
+
+    def learn(self, gray_scaled_pixels: numpy.ndarray, text: str) -> bool:
+        """
+        Learn the glyphs of digits the atlas does not know yet from a read labelled with the exact number.
+        The last glyphs of the pixels are taken as the digits of the text, so icons in front of it are skipped.
+
+        Args:
+            gray_scaled_pixels: The gray-scaled pixels of a single line of text, like read takes them.
+            text: The digits the pixels show.
+
+        Returns:
+            True if the atlas learned a digit, False otherwise.
+        """
+        if not text.isdigit() or self.knows(text):
+            return False
+
+        digit_glyphs = [glyph for glyph in _segment_glyphs(gray_scaled_pixels) if not isinstance(glyph, str)]
+        if len(digit_glyphs) < len(text):
+            return False
+
+        digit_glyphs = digit_glyphs[-len(text) :]
+        with self._lock:
+            known_digits = "".join(sorted(set(self._get_glyphs()[1])))
+            best_digits, recognized = self._score(digit_glyphs, known_digits)
+            for glyph_index, digit in enumerate(text):
+                is_known = digit in known_digits
+                # A known digit must be read as itself, and an unknown one must not be read as any known digit.
+                if is_known != bool(recognized[glyph_index]) or (
+                    is_known and known_digits[best_digits[glyph_index]] != digit
+                ):
+                    return False
+
+            learned = False
+            for glyph, digit in zip(digit_glyphs, text):
+                if digit not in known_digits:
+                    learned |= self._confirm(glyph=glyph, digit=digit, text=text)
+        return learned
+
+    def _confirm(self, glyph: numpy.ndarray, digit: str, text: str) -> bool:
+        """
+        Add the glyph of an unknown digit to the atlas if a glyph of another text confirms it, else keep it pending.
+
+        Args:
+            glyph: The normalized glyph.
+            digit: The digit it was labelled as.
+            text: The text it was labelled by.
+
+        Returns:
+            True if the digit was added to the atlas, False otherwise.
+        """
+        pending = self._pending.setdefault(digit, [])
+        confirming = [
+            pending_glyph
+            for pending_text, pending_glyph in pending
+            if pending_text != text and float(pending_glyph @ glyph) >= GLYPH_MIN_SCORE
+        ]
+        if not confirming:
+            if len(pending) < self.max_learned:
+                pending.append((text, glyph))
+            return False
+
+        new_glyphs = [glyph, *confirming][: self.max_learned]
+        self._learned.setdefault(digit, []).extend(new_glyphs)
+        del self._pending[digit]
+        glyphs, digits = self._get_glyphs()
+        self._atlas = (numpy.vstack([glyphs, *new_glyphs]), digits + [digit] * len(new_glyphs))
+        self._dirty = True
+        logger.info(f"Learned the glyph of the digit {digit}")
+        return True
+
+    def load(self, path: str) -> None:
+        """
+        Load previously learned glyphs and remember where to save them to.
+
+        Args:
+            path: The path of the JSON file holding the learned glyphs.
+        """
+        self._path = path
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(path, mode="r", encoding="UTF-8") as atlas_file:
+                stored_glyphs = json.load(atlas_file)
+            learned = {
+                digit: [numpy.array(glyph, dtype=numpy.float32).reshape(GLYPH_SIZE * GLYPH_SIZE) for glyph in glyphs]
+                for digit, glyphs in stored_glyphs.items()
+                if digit in GLYPH_DIGITS
+            }
+        except (OSError, ValueError) as exc:
+            logger.opt(exception=exc).warning(f"Could not read the learned glyphs at {path}, starting over")
+            return
+
+        with self._lock:
+            self._learned = learned
+            self._atlas = None
+        logger.debug(f"Loaded learned glyphs for the digits {''.join(sorted(learned))}")
+
+    def save(self) -> None:
+        """
+        Save the learned glyphs, if any were learned since they were loaded or last saved.
+        """
+        if self._path is None or not self._dirty:
+            return
+
+        with self._lock:
+            stored_glyphs = {
+                digit: [numpy.round(glyph, 5).tolist() for glyph in glyphs] for digit, glyphs in self._learned.items()
+            }
+            self._dirty = False
+
+        with open(self._path, mode="w", encoding="UTF-8") as atlas_file:
+            json.dump(stored_glyphs, atlas_file)
+
+
+def _get_capture_glyphs() -> tuple[list[numpy.ndarray], list[str]]:
+    """
+    Get the digit glyphs shown in the gold and round captures.
+
+    Returns:
+        Every normalized glyph and its digit.
+    """
+    glyphs, digits = [], []
+    for amount, path in CONSTANTS["game"]["gold"].items():
+        template = TEMPLATE_REGISTRY.get(path)
+        if template is None:
+            continue
+        # The gold captures show a coin followed by the amount, so the amount is the last glyph.
+        segmented = [glyph for glyph in _segment_glyphs(template.image) if not isinstance(glyph, str)]
+        if segmented:
+            glyphs.append(segmented[-1])
+            digits.append(amount)
+
+    for name, path in CONSTANTS["game"]["round"].items():
+        template = TEMPLATE_REGISTRY.get(path)
+        if "-" not in name or template is None:
+            continue
+        segmented = [glyph for glyph in _segment_glyphs(template.image) if not isinstance(glyph, str)]
+        name_digits = name.replace("-", "")
+        # Only trust captures that segment into exactly the digits their name says they show.
+        if len(segmented) == len(name_digits):
+            glyphs.extend(segmented)
+            digits.extend(name_digits)
+
+    return glyphs, digits
+
+
+GLYPH_ATLAS = GlyphAtlas()
+
+
+def read_digits(gray_scaled_pixels: numpy.ndarray, digits: str = GLYPH_DIGITS) -> str | None:
+    """
+    Read the digits (and dashes) of bright text on a dark background with GLYPH_ATLAS.
+
+    Args:
+        gray_scaled_pixels: The gray-scaled pixels of a single line of text.
+        digits: Every digit the text can show. Defaults to GLYPH_DIGITS.
+
+    Returns:
+        The text that was read or None if it could not be read.
+    """
+    return GLYPH_ATLAS.read(gray_scaled_pixels, digits=digits)
@@ -0,0 +1,238 @@
+"""Provides the gold of the player, from the live client API when it can be trusted or else from the screen."""
+from dataclasses import dataclass
+from typing import Callable
+
+from loguru import logger
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.glyph_helpers import GLYPH_ATLAS
+from tft_bot.helpers.glyph_helpers import read_digits
+from tft_bot.helpers.screen_helpers import get_frame
+from tft_bot.helpers.screen_helpers import get_game_region
+from tft_bot.helpers.screen_helpers import GOLD_DISPLAY_OFFSETS
+from tft_bot.helpers.screen_helpers import GOLD_PRECISION
+from tft_bot.helpers.screen_helpers import GOLD_REGION
+from tft_bot.helpers.screen_helpers import match_templates
+
+
+def get_gold_with_glyphs() -> int | None:
+    """
+    Get the gold by reading the gold display with the glyph atlas, without Tesseract-OCR.
+
+    Returns:
+        The amount of gold the player currently has or None if it could not be read.
+    """
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
+        return None
+
+    gold = read_digits(get_game_region(frame=frame, region=GOLD_REGION))
+    if gold is None or not gold.isdigit():
+        return None
+
+    return int(gold)
+
+
+def get_gold_with_templates() -> int | None:
+    """
+    Get the gold by matching every gold capture against the gold display once, like get_gold_with_opencv does
+    for a single amount.
+
+    Returns:
+        The amount of the best matching capture or None if no capture matched, e.g. for amounts without a capture.
+    """
+    amounts = {path: int(amount) for amount, path in CONSTANTS["game"]["gold"].items()}
+    matches = match_templates(
+        window_title=CONSTANTS["window_titles"]["game"],
+        paths=list(amounts),
+        precision=GOLD_PRECISION,
+        offsets=GOLD_DISPLAY_OFFSETS,
+    )
+    hits = [match for match in matches if match.score >= GOLD_PRECISION]
+    if not hits:
+        return None
+
+    return amounts[max(hits, key=lambda match: match.score).key]
+
+
+def read_gold_on_screen() -> int | None:
+    """
+    Get the gold from the screen, with the glyph atlas or else by matching the gold captures.
+    The glyph atlas reads any amount once it learned every digit, the captures only cover single digit amounts.
+
+    Returns:
+        The amount of gold the player currently has or None if it could not be read.
+    """
+    gold = get_gold_with_glyphs()
+    return gold if gold is not None else get_gold_with_templates()
+
+
+def learn_gold_glyphs(gold: int) -> None:
+    """
+    Teach the glyph atlas the digits of the gold display it does not know yet, labelled by the exact gold.
+
+    Args:
+        gold: The gold the live client reports.
+    """
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is not None:
+        GLYPH_ATLAS.learn(get_game_region(frame=frame, region=GOLD_REGION), text=str(gold))
+
+
+# The most gold a player can sanely have, more than that means the live client payload is broken.
+MAX_SANE_GOLD = 999
+# How many gold reads from the live client pass between two cross-checks with the screen.
+GOLD_CROSS_CHECK_INTERVAL = 10
+# How many cross-checks in a row may disagree with the screen before the live client is not trusted anymore.
+GOLD_MAX_DISAGREEMENTS = 3
+
+
+@dataclass
+class GoldProviderStatistics:
+    """
+    A dataclass holding counters about where the gold was read from.
+    """
+
+    api_reads: int = 0
+    screen_reads: int = 0
+    cross_checks: int = 0
+    disagreements: int = 0
+
+
+class GoldProvider:
+    """
+    Provides the exact gold from the live client API when it is present and sane, else reads it from the screen.
+    Every GOLD_CROSS_CHECK_INTERVAL-th read from the API is cross-checked with the screen. So is every read of 0,
+    which the API also reports when it does not know the gold, and which is only trusted if the screen confirms it.
+    Once GOLD_MAX_DISAGREEMENTS cross-checks in a row disagree, the gold is read from the screen until the next game.
+    Cross-checks the screen could not read, or that agree, label the gold display for the screen learner.
+    """
+
+    def __init__(
+        self,
+        cross_check_interval: int = GOLD_CROSS_CHECK_INTERVAL,
+        max_disagreements: int = GOLD_MAX_DISAGREEMENTS,
+        screen_learner: Callable[[int], None] | None = None,
+    ):
+        """
+        Args:
+            cross_check_interval: How many API reads pass between two cross-checks.
+              Defaults to GOLD_CROSS_CHECK_INTERVAL.
+            max_disagreements: How many cross-checks in a row may disagree before the screen is used instead.
+              Defaults to GOLD_MAX_DISAGREEMENTS.
+            screen_learner: A function learning how the screen shows the gold from the gold the API reports,
+              like learn_gold_glyphs. Defaults to None.
+        """
+        self.cross_check_interval = cross_check_interval
+        self.max_disagreements = max_disagreements
+        self.screen_learner = screen_learner
+        self._api_reader: Callable[[], int | None] | None = None
+        self._invalidate_api: Callable[[], None] | None = None
+        # The API is not trusted anymore once max_disagreements cross-checks in a row disagreed.
+        self._disagreements_in_row = 0
+        self.statistics = GoldProviderStatistics()
+
+    def set_api_reader(
+        self, api_reader: Callable[[], int | None] | None, invalidate: Callable[[], None] | None = None
+    ) -> None:
+        """
+        Set where the gold is read from the live client API.
+
+        Args:
+            api_reader: A function returning the gold, like GameClientIntegration.get_gold, None to only use the screen.
+            invalidate: A function marking the data api_reader reads as stale. Defaults to None.
+        """
+        self._api_reader = api_reader
+        self._invalidate_api = invalidate
+        self.reset()
+
+    def get_gold(self, screen_reader: Callable[[], int | None] = read_gold_on_screen) -> int | None:
+        """
+        Get the gold the player currently has.
+
+        Args:
+            screen_reader: A function reading the gold from the screen, for the fallback and cross-checks.
+              Defaults to read_gold_on_screen.
+
+        Returns:
+            The amount of gold or None if it could not be read.
+        """
+        api_trusted = self._disagreements_in_row < self.max_disagreements
+        gold = self._api_reader() if self._api_reader is not None and api_trusted else None
+        if gold is None or not 0 <= gold <= MAX_SANE_GOLD:
+            self.statistics.screen_reads += 1
+            return screen_reader()
+
+        self.statistics.api_reads += 1
+        if gold != 0 and (self.statistics.api_reads - 1) % self.cross_check_interval != 0:
+            return gold
+
+        screen_gold = screen_reader()
+        if self.screen_learner is not None and screen_gold in (None, gold):
+            self.screen_learner(gold)
+        if screen_gold is None:
+            return gold if gold != 0 else None
+
+        self.statistics.cross_checks += 1
+        if screen_gold == gold:
+            self._disagreements_in_row = 0
+            return gold
+
+        self.statistics.disagreements += 1
+        self._disagreements_in_row += 1
+        logger.debug(f"The live client reports {gold} gold, but the screen shows {screen_gold}")
+        api_trusted = self._disagreements_in_row < self.max_disagreements
+        if not api_trusted:
+            logger.warning(
+                f"The live client disagreed with the screen {self._disagreements_in_row} times in a row, "
+                "reading the gold from the screen for the rest of the game"
+            )
+        # Gold on screen next to 0 from the API means the API does not know the gold.
+        return screen_gold if gold == 0 or not api_trusted else gold
+
+    def reset(self) -> None:
+        """
+        Trust the API again, called when a new game starts.
+        """
+        self._disagreements_in_row = 0
+
+    def invalidate(self) -> None:
+        """
+        Mark the gold from the API as stale, so the next read fetches it again. Called after every input that may
+        spend or earn gold.
+        """
+        if self._invalidate_api is not None:
+            self._invalidate_api()
+
+    def log_statistics(self) -> None:
+        """
+        Log how often the gold was read from the API or the screen, and how often the two disagreed.
+        """
+        logger.debug(
+            f"Gold provider: {self.statistics.api_reads} API reads, {self.statistics.screen_reads} screen reads, "
+            f"{self.statistics.disagreements} of {self.statistics.cross_checks} cross-checks disagreed"
+        )
+
+
+GOLD_PROVIDER = GoldProvider(screen_learner=learn_gold_glyphs)
+
+
+def gold_at_least(num: int) -> bool:
+    """
+    Check if the gold is at least the provided amount, from GOLD_PROVIDER.
+
+    Args:
+        num (int): The value to check if the gold is at least.
+
+    Returns:
+        bool: True if the value is >= `num`, False otherwise.
+    """
+    logger.debug(f"Looking for at least {num} gold")
+    gold = GOLD_PROVIDER.get_gold()
+    if gold is not None:
+        logger.debug(f"Read {gold} gold")
+        return gold >= num
+
+    # The screen reader already matched every gold capture, so matching them one by one would not find more.
+    logger.debug("No gold value found, assuming we have more")
+    return True
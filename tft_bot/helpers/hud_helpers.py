@@ -0,0 +1,254 @@
+"""Reads the HUD of the game, the stage tracker, the round and the gold, from a single frame."""
+from dataclasses import dataclass
+from typing import Callable
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.glyph_helpers import GLYPH_ATLAS
+from tft_bot.helpers.glyph_helpers import GLYPH_DIGITS
+from tft_bot.helpers.glyph_helpers import read_digits
+from tft_bot.helpers.gold_provider import get_gold_with_templates
+from tft_bot.helpers.gold_provider import GOLD_PROVIDER
+from tft_bot.helpers.ocr_helpers import DIGITS
+from tft_bot.helpers.ocr_helpers import OCR_SERVICE
+from tft_bot.helpers.screen_helpers import get_frame
+from tft_bot.helpers.screen_helpers import get_game_region
+from tft_bot.helpers.screen_helpers import GOLD_REGION
+from tft_bot.helpers.screen_helpers import match_templates
+from tft_bot.helpers.screen_helpers import ROUND_REGION
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+
+
+@dataclass
+class RoundState:
+    """
+    A dataclass holding what could be read from the stage tracker.
+    """
+
+    stage: int
+    sub_round: int | None
+    confidence: float
+
+
+# The stage tracker at the top of the game window, in 1920x1080 pixels.
+STAGE_TRACKER_REGION = (640, 0, 1280, 64)
+# The stage each PvE round marker is shown in.
+PVE_ROUND_MARKERS = {"krugs": 2, "wolves": 3, "birds": 4, "elder_dragon": 5}
+PVE_ROUND_MARKER_PRECISION = 0.9
+ROUND_TEXT_PRECISION = 0.8
+
+
+def _get_round_template_keys() -> tuple[list[str], numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """
+    Get every round template key and what a hit on it means.
+
+    Returns:
+        The template keys, the stage of every key (0 if unknown), the sub-round of every key (0 if unknown),
+        whether every key is a PvE round marker and the precision a hit on every key needs.
+    """
+    keys, stages, sub_rounds, markers = [], [], [], []
+    for name, path in CONSTANTS["game"]["round"].items():
+        marker_name = name.rsplit("_", 1)[0]
+        if marker_name in PVE_ROUND_MARKERS:
+            keys.append(path)
+            stages.append(PVE_ROUND_MARKERS[marker_name])
+            sub_rounds.append(0)
+            markers.append(True)
+        elif "-" in name:
+            stage, sub_round = name.split("-")
+            keys.append(path)
+            stages.append(int(stage or 0))
+            sub_rounds.append(int(sub_round or 0))
+            markers.append(False)
+
+    markers = numpy.array(markers)
+    precisions = numpy.where(markers, PVE_ROUND_MARKER_PRECISION, ROUND_TEXT_PRECISION)
+    return keys, numpy.array(stages), numpy.array(sub_rounds), markers, precisions
+
+
+_ROUND_TEMPLATE_KEYS = _get_round_template_keys()
+
+
+def _decide_round(scores: numpy.ndarray) -> RoundState:
+    """
+    Decide the round from the scores of every round template, in the order the template cascade this replaces did:
+    the highest stage of any PvE round marker, else the lowest stage of any stage display like "3-".
+
+    Args:
+        scores: The score of every template in _ROUND_TEMPLATE_KEYS, -1 for templates that were not matched.
+
+    Returns:
+        The round state, with a stage of 0 and a confidence of 0 if nothing could be read.
+    """
+    _, stages, sub_rounds, markers, precisions = _ROUND_TEMPLATE_KEYS
+    hits = scores >= precisions
+    marker_hits = hits & markers
+    stage_hits = hits & ~markers & (stages > 0) & (sub_rounds == 0)
+    if marker_hits.any():
+        stage = stages[marker_hits].max()
+        confidence = scores[marker_hits & (stages == stage)].max()
+    elif stage_hits.any():
+        stage = stages[stage_hits].min()
+        confidence = scores[stage_hits & (stages == stage)].max()
+    else:
+        return RoundState(stage=0, sub_round=None, confidence=0.0)
+
+    # The sub-round is only known from templates showing it, either with the matching stage or on its own.
+    sub_round_hits = hits & ~markers & (sub_rounds > 0) & ((stages == stage) | (stages == 0))
+    sub_round = None
+    if sub_round_hits.any():
+        sub_round = int(sub_rounds[numpy.flatnonzero(sub_round_hits)[scores[sub_round_hits].argmax()]])
+
+    return RoundState(stage=int(stage), sub_round=sub_round, confidence=float(confidence))
+
+
+def classify_round() -> RoundState:
+    """
+    Read the stage, and the sub-round if possible, from the stage tracker.
+    The tracker is cropped once and every round template is scored against that crop only.
+    If no PvE round marker is in the crop, the markers and stage displays are searched in the whole window,
+    like the template cascade this replaces did, so one just outside of the crop is not missed.
+
+    Returns:
+        The round state, with a stage of 0 and a confidence of 0 if nothing could be read.
+    """
+    window_title = CONSTANTS["window_titles"]["game"]
+    frame = get_frame(window_title)
+    if frame is None:
+        return RoundState(stage=0, sub_round=None, confidence=0.0)
+
+    tracker_pixels = get_game_region(frame=frame, region=STAGE_TRACKER_REGION)
+    keys, stages, sub_rounds, markers, precisions = _ROUND_TEMPLATE_KEYS
+    scores = numpy.full(len(keys), -1.0)
+    for index, key in enumerate(keys):
+        template = TEMPLATE_REGISTRY.get_for_resolution(key=key, width=frame.get_width(), height=frame.get_height())
+        if template is None or tracker_pixels.shape[0] < template.height or tracker_pixels.shape[1] < template.width:
+            continue
+        scores[index] = cv2.minMaxLoc(cv2.matchTemplate(tracker_pixels, template.image, cv2.TM_CCOEFF_NORMED))[1]
+
+    if not (markers & (scores >= precisions)).any():
+        window_indices = numpy.flatnonzero(markers | ((stages > 0) & (sub_rounds == 0)))
+        window_scores = {
+            match.key: match.score
+            for match in match_templates(
+                window_title=window_title,
+                paths=[keys[index] for index in window_indices],
+                precision=ROUND_TEXT_PRECISION,
+            )
+        }
+        for index in window_indices:
+            scores[index] = max(scores[index], window_scores.get(keys[index], -1.0))
+
+    round_state = _decide_round(scores)
+    logger.debug(
+        f"Classified the round as stage {round_state.stage}, sub-round {round_state.sub_round} "
+        f"with a confidence of {round_state.confidence:.2f}"
+    )
+    return round_state
+
+
+# Every digit the stage display can show, which the captures all show as well.
+ROUND_DIGITS = "".join(sorted(set("".join(CONSTANTS["game"]["round_text"]))))
+
+
+def get_round_with_glyphs() -> str | None:
+    """
+    Get the current round by reading the stage display with the glyph atlas, without Tesseract-OCR.
+
+    Returns:
+        The current round as a string like get_round_with_ocr returns it, or None if it could not be read.
+    """
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
+        return None
+
+    game_round = read_digits(get_game_region(frame=frame, region=ROUND_REGION), digits=ROUND_DIGITS)
+    if game_round is None:
+        return None
+
+    game_round = game_round.replace("-", "")
+    return game_round if game_round in CONSTANTS["game"]["round_text"] else None
+
+
+@dataclass(frozen=True)
+class HudState:
+    """
+    A dataclass holding the numbers shown on the HUD at one point in time, read once per tick.
+    Fields that could not be read are None.
+    """
+
+    game_round: str | None
+    gold: int | None
+    level: int | None
+
+    def get_stage(self) -> int:
+        """
+        Get the stage of the round.
+
+        Returns:
+            The stage or 0 if the round could not be read.
+        """
+        return int(self.game_round[0]) if self.game_round else 0
+
+
+def _read_hud_number(pixels: numpy.ndarray, digits: str, use_ocr: bool) -> str | None:
+    """
+    Read the digits of a HUD field with the glyph atlas, falling back to OCR if allowed.
+    Digits read with OCR teach the glyph atlas the ones it does not know yet.
+
+    Args:
+        pixels: The gray-scaled pixels of the field.
+        digits: Every digit the field can show.
+        use_ocr: Whether to read with OCR if the glyph atlas could not read the field.
+
+    Returns:
+        The digits that were read, without dashes, or None if nothing could be read.
+    """
+    text = read_digits(pixels, digits=digits)
+    if text is None and use_ocr:
+        text = OCR_SERVICE.read(~pixels, config=DIGITS).replace("-", "")
+        GLYPH_ATLAS.learn(pixels, text=text)
+    if not text:
+        return None
+
+    text = text.replace("-", "")
+    return text if text.isdigit() else None
+
+
+def read_hud(level_provider: Callable[[], int] | None = None, use_ocr: bool = False) -> HudState:
+    """
+    Read the round, gold and level from a single frame of the game. The gold comes from GOLD_PROVIDER,
+    which only reads it from the frame if the live client does not report it.
+
+    Args:
+        level_provider: A function returning the level, like GameClientIntegration.get_level. It is called once.
+          Defaults to None, which leaves the level unread.
+        use_ocr: Whether to read fields with OCR if the glyph atlas could not read them. Only set this if the
+          Tesseract-OCR location is set on OCR_SERVICE. Defaults to False.
+
+    Returns:
+        The state of the HUD.
+    """
+    level = level_provider() if level_provider is not None else None
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
+        return HudState(game_round=None, gold=GOLD_PROVIDER.get_gold(screen_reader=lambda: None), level=level)
+
+    def read_gold_on_screen() -> int | None:
+        gold = _read_hud_number(get_game_region(frame=frame, region=GOLD_REGION), digits=GLYPH_DIGITS, use_ocr=use_ocr)
+        # Without OCR the gold captures still read single digit amounts the glyph atlas cannot read yet.
+        return int(gold) if gold is not None else get_gold_with_templates()
+
+    game_round = _read_hud_number(
+        get_game_region(frame=frame, region=ROUND_REGION), digits=ROUND_DIGITS, use_ocr=use_ocr
+    )
+    hud_state = HudState(
+        game_round=game_round if game_round in CONSTANTS["game"]["round_text"] else None,
+        gold=GOLD_PROVIDER.get_gold(screen_reader=read_gold_on_screen),
+        level=level,
+    )
+    logger.debug(f"Read the HUD as {hud_state}")
+    return hud_state
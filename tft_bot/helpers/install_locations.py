@@ -0,0 +1,399 @@
+"""
+A cache of where the tools we depend on are installed, resolved once and persisted between runs,
+so hot paths look them up without reading the registry or touching the file system.
+"""
+import json
+import os
+import pathlib
+import re
+import threading
+from typing import Callable
+
+from loguru import logger
+
+try:
+    import winreg
+except ImportError:
+    # Without a registry, like off Windows, only the static reader and the default locations are usable.
+    winreg = None
+
+LEAGUE_CLIENT = "league_client"
+RIOT_CLIENT = "riot_client"
+TESSERACT_OCR = "tesseract_ocr"
+TESSERACT_OCR_EXECUTABLE = "tesseract_ocr_executable"
+
+# The registry entries the locations are resolved from, as hive, path and value name.
+LEAGUE_CLIENT_REGISTRY_ENTRY = (
+    "HKEY_CURRENT_USER",
+    r"Software\Microsoft\Windows\CurrentVersion\Uninstall\Riot Game league_of_legends.live",
+    "InstallLocation",
+)
+RIOT_CLIENT_REGISTRY_ENTRY = (
+    "HKEY_CURRENT_USER",
+    r"Software\Microsoft\Windows\CurrentVersion\Uninstall\Riot Game league_of_legends.live",
+    "UninstallString",
+)
+TESSERACT_OCR_REGISTRY_ENTRY = ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Tesseract-OCR", "InstallDir")
+
+
+class RegistryReader:
+    """
+    Blueprint class for the ways we can read values from the Windows registry.
+    """
+
+    def read(self, hive: str, path: str, value: str) -> str | None:
+        """
+        Read a value from the registry.
+
+        Args:
+            hive: The name of the HKEY to read at, like "HKEY_CURRENT_USER".
+            path: The path to read at.
+            value: The specific value to read from the path.
+
+        Returns:
+            The value as a str if found, otherwise None.
+        """
+        raise NotImplementedError
+
+
+class WindowsRegistryReader(RegistryReader):
+    """
+    Reads the actual Windows registry.
+    """
+
+    def read(self, hive: str, path: str, value: str) -> str | None:
+        if winreg is None:
+            return None
+
+        try:
+            access_registry = winreg.ConnectRegistry(None, getattr(winreg, hive))
+            access_key = winreg.OpenKey(access_registry, path, 0, winreg.KEY_READ)
+            [registry_value, _] = winreg.QueryValueEx(access_key, value)
+        except FileNotFoundError:
+            # The app is not installed, the caller falls back to its default location.
+            logger.debug(f"There is no registry entry at {path}\\{value}")
+            return None
+        except Exception as exc:
+            logger.opt(exception=exc).error(f"Could not read registry at {path}\\{value}.")
+            return None
+
+        return registry_value
+
+
+class StaticRegistryReader(RegistryReader):
+    """
+    Serves registry values from a dictionary instead of the registry, to resolve locations headless.
+    """
+
+    def __init__(self, values: dict[tuple[str, str, str], str] | None = None):
+        """
+        Args:
+            values: The values by hive, path and value name. Defaults to None, meaning no values.
+        """
+        self.values = values or {}
+
+    def read(self, hive: str, path: str, value: str) -> str | None:
+        return self.values.get((hive, path, value))
+
+
+_REGISTRY_READER: RegistryReader = WindowsRegistryReader()
+
+
+def get_registry_reader() -> RegistryReader:
+    """
+    Get the reader install locations are resolved with.
+
+    Returns:
+        The currently active registry reader.
+    """
+    return _REGISTRY_READER
+
+
+def set_registry_reader(reader: RegistryReader) -> None:
+    """
+    Replace the reader install locations are resolved with, dropping every location resolved with the previous one.
+
+    Args:
+        reader: The new registry reader.
+    """
+    global _REGISTRY_READER
+    _REGISTRY_READER = reader
+    INSTALL_LOCATIONS.invalidate()
+
+
+def _get_override_install_location(app: str) -> str | None:
+    """
+    Get the install location the user configured for an app.
+
+    Args:
+        app: The name of the app, as used in the config.
+
+    Returns:
+        The configured location or None if there is none.
+    """
+    from tft_bot import config
+
+    if app == TESSERACT_OCR:
+        return config.get_tesseract_override_install_location()
+    return config.get_override_install_location(app)
+
+
+def _resolve_league_client_location(cache: "InstallLocationCache") -> str:  # pylint: disable=unused-argument
+    """
+    Determine the location League was installed.
+
+    Args:
+        cache: The cache resolving the location.
+
+    Returns:
+        If successful, the determined install location. If unsuccessful, the default install location.
+    """
+    # Assign default just in case it failed to be found
+    league_path = r"C:\Riot Games\League of Legends"
+    override_path = _get_override_install_location(LEAGUE_CLIENT)
+
+    if override_path is not None:
+        logger.warning(f"Override path supplied, using '{override_path}' as League install directory.")
+        league_path = override_path
+    else:
+        registry_entry = get_registry_reader().read(*LEAGUE_CLIENT_REGISTRY_ENTRY)
+        if registry_entry:
+            league_path = registry_entry
+
+    return str(pathlib.PureWindowsPath(league_path))
+
+
+def _resolve_riot_client_location(cache: "InstallLocationCache") -> str:  # pylint: disable=unused-argument
+    """
+    Determine the location the Riot Client was installed.
+
+    Args:
+        cache: The cache resolving the location.
+
+    Returns:
+        If successful, the determined install location. If unsuccessful, the default install location.
+    """
+    # Assign default just in case it failed to be found
+    riot_path = r"C:\Riot Games\Riot Client"
+    override_path = _get_override_install_location(RIOT_CLIENT)
+
+    if override_path is not None:
+        logger.warning(f"Override path supplied, using '{override_path}' as Riot Client install directory.")
+        riot_path = override_path
+    else:
+        registry_entry = get_registry_reader().read(*RIOT_CLIENT_REGISTRY_ENTRY)
+        # The only way we can parse the install location of client services is from the league uninstallation
+        # registry entry, so we parse it to ensure we strip the uninstall args
+        if registry_entry and r"Riot Client\RiotClientServices.exe" in registry_entry:
+            try:
+                search_result = re.search(r".*Riot Client\\RiotClientServices.exe", registry_entry)
+                riot_path = search_result.group()[1:]
+                riot_path = re.search(r".*\\Riot Client", riot_path).group()
+            except Exception:
+                pass
+
+    return str(pathlib.PureWindowsPath(riot_path))
+
+
+def _resolve_tesseract_ocr_location(cache: "InstallLocationCache") -> str:  # pylint: disable=unused-argument
+    """
+    Determine the location Tesseract-OCR was installed at.
+
+    Args:
+        cache: The cache resolving the location.
+
+    Returns:
+        If successful, the determined install location. If unsuccessful, the default install location.
+    """
+    tesseract_ocr_path = r"C:\Program Files\Tesseract-OCR"
+    override_path = _get_override_install_location(TESSERACT_OCR)
+
+    if override_path is not None:
+        logger.warning(f"Override path supplied, using '{override_path}' as Tesseract-OCR install directory.")
+        return override_path
+
+    registry_entry = get_registry_reader().read(*TESSERACT_OCR_REGISTRY_ENTRY)
+    if registry_entry:
+        tesseract_ocr_path = registry_entry
+
+    return str(pathlib.PureWindowsPath(tesseract_ocr_path))
+
+
+def _resolve_tesseract_ocr_executable_location(cache: "InstallLocationCache") -> str | None:
+    """
+    Determine where tesseract.exe is, if it exists.
+
+    Args:
+        cache: The cache resolving the location, to get the install location of Tesseract-OCR from.
+
+    Returns:
+        The path to tesseract.exe or None if it does not exist.
+    """
+    tesseract_location = cache.get(TESSERACT_OCR) + "\\tesseract.exe"
+    return tesseract_location if os.path.isfile(tesseract_location) else None
+
+
+class InstallLocationCache:
+    """
+    Resolves every install location once and keeps it in memory, so looking one up is a dictionary access.
+    Resolved locations are saved with a stamp of the override that was configured, the registry entries they were
+    resolved from and the location on disk, so a reinstall or a first install after a location was not found shows.
+    Saved locations are re-used on the next start as long as their stamp still matches and every location they
+    depend on was re-used too, else they are resolved again. This includes locations that were not found.
+    """
+
+    def __init__(self):
+        # The resolver, the locations it depends on and the registry entries it reads, of every location.
+        self._registrations: dict[
+            str,
+            tuple[Callable[["InstallLocationCache"], str | None], tuple[str, ...], tuple[tuple[str, str, str], ...]],
+        ] = {}
+        self._locations: dict[str, str | None] = {}
+        self._stamps: dict[str, dict] = {}
+        self._lock = threading.RLock()
+        self._path: str | None = None
+        self.resolutions = 0
+
+    def register(
+        self,
+        name: str,
+        resolver: Callable[["InstallLocationCache"], str | None],
+        depends_on: tuple[str, ...] = (),
+        registry_entries: tuple[tuple[str, str, str], ...] = (),
+    ) -> None:
+        """
+        Register how a location is resolved.
+
+        Args:
+            name: The name of the location.
+            resolver: Resolves the location, given this cache to look up other locations with.
+            depends_on: The names of the locations the resolver looks up, registered before this one.
+              Defaults to none.
+            registry_entries: The registry entries the resolver reads, as hive, path and value name.
+              Defaults to none.
+        """
+        self._registrations[name] = (resolver, depends_on, registry_entries)
+
+    def load(self, path: str) -> None:
+        """
+        Load previously saved locations, resolve every location whose stamp does not match anymore
+        and remember where to save them to.
+
+        Args:
+            path: The path of the JSON file holding the locations.
+        """
+        self._path = path
+        stored_locations = {}
+        if os.path.isfile(path):
+            try:
+                with open(path, mode="r", encoding="UTF-8") as locations_file:
+                    stored_locations = json.load(locations_file)
+            except (OSError, ValueError) as exc:
+                logger.opt(exception=exc).warning(f"Could not read the install locations at {path}, resolving them")
+
+        with self._lock:
+            self._locations.clear()
+            self._stamps.clear()
+            for name, (_, depends_on, _) in self._registrations.items():
+                stored_location = stored_locations.get(name)
+                if (
+                    stored_location is not None
+                    and all(dependency in self._locations for dependency in depends_on)
+                    and stored_location.get("stamp")
+                    == self._get_stamp(name=name, location=stored_location.get("location"))
+                ):
+                    self._locations[name] = stored_location["location"]
+                    self._stamps[name] = stored_location["stamp"]
+
+            for name in self._registrations:
+                self.get(name)
+        self.save()
+
+    def save(self) -> None:
+        """
+        Save every resolved location with its stamp.
+        """
+        if self._path is None:
+            return
+
+        with self._lock:
+            stored_locations = {
+                name: {"location": location, "stamp": self._stamps[name]} for name, location in self._locations.items()
+            }
+
+        with open(self._path, mode="w", encoding="UTF-8") as locations_file:
+            json.dump(stored_locations, locations_file, indent=2)
+
+    def get(self, name: str) -> str | None:
+        """
+        Get a location, resolving it only if it was not resolved yet.
+
+        Args:
+            name: The name of the location.
+
+        Returns:
+            The location or None if the resolver found none.
+        """
+        if name in self._locations:
+            return self._locations[name]
+
+        with self._lock:
+            if name not in self._locations:
+                location = self._registrations[name][0](self)
+                self.resolutions += 1
+                logger.debug(f"Install location of {name} determined to be: {location}")
+                self._stamps[name] = self._get_stamp(name=name, location=location)
+                self._locations[name] = location
+            return self._locations[name]
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        Drop a resolved location, or all of them, so they are resolved again on next access.
+
+        Args:
+            name: The name of the location to drop. Defaults to None, meaning all.
+        """
+        with self._lock:
+            if name is None:
+                self._locations.clear()
+                self._stamps.clear()
+            else:
+                self._locations.pop(name, None)
+                self._stamps.pop(name, None)
+
+    def _get_stamp(self, name: str, location: str | None) -> dict:
+        """
+        Get what a resolved location depends on, to tell if a saved location can still be used.
+
+        Args:
+            name: The name of the location.
+            location: The resolved location.
+
+        Returns:
+            The configured override, the raw values of the registry entries the location is resolved from
+            and the modification time of the location, None if it does not exist.
+        """
+        app = TESSERACT_OCR if name == TESSERACT_OCR_EXECUTABLE else name
+        try:
+            modified_at = os.stat(location).st_mtime_ns if location else None
+        except OSError:
+            modified_at = None
+        registry_reader = get_registry_reader()
+        return {
+            "override": _get_override_install_location(app),
+            "registry": [registry_reader.read(*entry) for entry in self._registrations[name][2]],
+            "modified_at": modified_at,
+        }
+
+
+INSTALL_LOCATIONS = InstallLocationCache()
+INSTALL_LOCATIONS.register(
+    LEAGUE_CLIENT, _resolve_league_client_location, registry_entries=(LEAGUE_CLIENT_REGISTRY_ENTRY,)
+)
+INSTALL_LOCATIONS.register(RIOT_CLIENT, _resolve_riot_client_location, registry_entries=(RIOT_CLIENT_REGISTRY_ENTRY,))
+INSTALL_LOCATIONS.register(
+    TESSERACT_OCR, _resolve_tesseract_ocr_location, registry_entries=(TESSERACT_OCR_REGISTRY_ENTRY,)
+)
+INSTALL_LOCATIONS.register(
+    TESSERACT_OCR_EXECUTABLE, _resolve_tesseract_ocr_executable_location, depends_on=(TESSERACT_OCR,)
+)
@@ -0,0 +1,58 @@
+"""Start-up, saving and statistics of the process-wide helpers, so the entrypoint only has to call into here."""
+import os
+from typing import Callable
+
+from tft_bot.helpers.capture_helpers import BUFFER_POOL
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.glyph_helpers import GLYPH_ATLAS
+from tft_bot.helpers.gold_provider import GOLD_PROVIDER
+from tft_bot.helpers.install_locations import INSTALL_LOCATIONS
+from tft_bot.helpers.ocr_helpers import OCR_SERVICE
+from tft_bot.helpers.roi_index import ROI_INDEX
+from tft_bot.helpers.screen_helpers import FRAME_CHANGE_DETECTOR
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+
+
+def initialize_helpers(
+    storage_path: str, gold_reader: Callable[[], int | None], invalidate_gold: Callable[[], None]
+) -> None:
+    """
+    Load everything the helpers keep between runs and wire them up, before the game loop starts.
+
+    Args:
+        storage_path: The directory the bot stores its configuration, logs and caches in.
+        gold_reader: A function returning the gold from the live client, like GameClientIntegration.get_gold.
+        invalidate_gold: A function marking the data gold_reader reads as stale.
+    """
+    # Decode every template once, so the game loop never has to read them from disk.
+    TEMPLATE_REGISTRY.load_all()
+    # Templates rescaled to window sizes other than the ones they were captured at are kept here between runs.
+    TEMPLATE_REGISTRY.cache_directory = os.path.join(storage_path, "templates")
+    ROI_INDEX.load(os.path.join(storage_path, "roi_index.json"))
+    # Install locations are resolved once here, so the game loop never has to read the registry.
+    INSTALL_LOCATIONS.load(os.path.join(storage_path, "install_locations.json"))
+    # Glyphs of digits the captures do not show are learned while playing and kept between runs.
+    GLYPH_ATLAS.load(os.path.join(storage_path, "glyph_atlas.json"))
+    # Gold comes from the live client data, the gold display on screen is only read as a cross-check or fallback.
+    GOLD_PROVIDER.set_api_reader(gold_reader, invalidate=invalidate_gold)
+
+
+def save_helpers() -> None:
+    """
+    Save what the helpers learned during this run, called after every match and on exit.
+    """
+    ROI_INDEX.save()
+    GLYPH_ATLAS.save()
+
+
+def log_helper_statistics() -> None:
+    """
+    Log the usage counters of every helper at debug level.
+    """
+    TEMPLATE_REGISTRY.log_statistics()
+    FRAME_SNAPSHOT.log_statistics()
+    BUFFER_POOL.log_statistics()
+    ROI_INDEX.log_statistics()
+    FRAME_CHANGE_DETECTOR.log_statistics()
+    OCR_SERVICE.log_statistics()
+    GOLD_PROVIDER.log_statistics()
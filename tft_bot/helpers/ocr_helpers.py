@@ -0,0 +1,243 @@
+"""
+An OCR service keeping initialized Tesseract engines per configuration in-process,
+instead of writing a temporary image and spawning tesseract.exe for every read.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field
+import hashlib
+import os
+import threading
+import time
+
+from loguru import logger
+import numpy
+from pytesseract import pytesseract
+
+try:
+    import tesserocr
+except ImportError:
+    # Without the bundled wheel every read falls back to pytesseract, which spawns tesseract.exe.
+    tesserocr = None
+
+
+@dataclass(frozen=True)
+class OcrConfig:
+    """
+    A dataclass holding the Tesseract settings of a kind of read.
+    """
+
+    whitelist: str
+    page_segmentation_mode: int = 7
+
+    def to_tesseract_arguments(self) -> str:
+        """
+        Converts the config to tesseract.exe command line arguments, for pytesseract.
+
+        Returns:
+            The arguments as a single string.
+        """
+        return (
+            f"--oem 3 --psm {self.page_segmentation_mode} "
+            f'-c tessedit_char_whitelist={self.whitelist} -c page_separator=""'
+        )
+
+
+DIGITS = OcrConfig(whitelist="0123456789")
+LETTERS = OcrConfig(whitelist="abcdefghjklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+@dataclass
+class OcrStatistics:
+    """
+    A dataclass holding counters about how often the cache was hit and how long each engine took to read.
+    """
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    reads: dict[str, int] = field(default_factory=lambda: {"tesserocr": 0, "pytesseract": 0})
+    read_time: dict[str, float] = field(default_factory=lambda: {"tesserocr": 0.0, "pytesseract": 0.0})
+
+
+class OcrService:
+    """
+    Reads text from gray-scaled pixels, with persistent tesserocr engines per config.
+    An engine is checked out for the duration of a read, so reads on several threads run in parallel,
+    each with an engine of its own.
+    Falls back to pytesseract if tesserocr is not installed or an engine could not be initialized.
+    Results are cached by a hash of the pixels and the config, so a HUD that did not change is not read again.
+    """
+
+    def __init__(self, in_process: bool = True, cache_size: int = 256):
+        """
+        Args:
+            in_process: Whether to read with tesserocr engines if it is installed. Defaults to True.
+            cache_size: The amount of results to keep, least recently used ones are dropped first.
+              0 disables the cache. Defaults to 256.
+        """
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[bytes, tuple[int, ...], OcrConfig], str] = OrderedDict()
+        self._tesseract_location: str | None = None
+        # The idle engines of every config. Releasing them swaps in a new dictionary, so engines checked out
+        # before a release are ended instead of returned.
+        self._apis: dict[OcrConfig, list["tesserocr.PyTessBaseAPI"]] = {}
+        self._in_process_failed = tesserocr is None or not in_process
+        self._lock = threading.Lock()
+        self.statistics = OcrStatistics()
+
+    def set_tesseract_location(self, tesseract_location: str) -> None:
+        """
+        Set where tesseract.exe is. Its tessdata directory is used by the in-process engines as well.
+        Changing it drops the cached results, as another installation may read the same pixels differently.
+
+        Args:
+            tesseract_location: The path to tesseract.exe.
+        """
+        if tesseract_location == self._tesseract_location:
+            return
+
+        self.close()
+        with self._lock:
+            self._cache.clear()
+        self._tesseract_location = tesseract_location
+        pytesseract.tesseract_cmd = tesseract_location
+
+    def read(self, pixels: numpy.ndarray, config: OcrConfig) -> str:
+        """
+        Read text from gray-scaled pixels.
+
+        Args:
+            pixels: The gray-scaled pixels to read from, dark text on a bright background works best.
+            config: The Tesseract settings to read with.
+
+        Returns:
+            The text that was read, stripped of surrounding whitespace.
+        """
+        pixels = numpy.ascontiguousarray(pixels)
+        cache_key = (hashlib.blake2b(pixels.data, digest_size=16).digest(), pixels.shape, config)
+        with self._lock:
+            text = self._cache.get(cache_key)
+            if text is not None:
+                self._cache.move_to_end(cache_key)
+                self.statistics.cache_hits += 1
+                return text
+            self.statistics.cache_misses += 1
+
+        text = self._read_uncached(pixels=pixels, config=config)
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[cache_key] = text
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return text
+
+    def _read_uncached(self, pixels: numpy.ndarray, config: OcrConfig) -> str:
+        """
+        Read text from gray-scaled pixels with the OCR engine, without looking at the cache.
+
+        Args:
+            pixels: The contiguous gray-scaled pixels to read from.
+            config: The Tesseract settings to read with.
+
+        Returns:
+            The text that was read, stripped of surrounding whitespace.
+        """
+        start = time.perf_counter()
+        api, apis = self._check_out_api(config)
+        if api is not None:
+            try:
+                api.SetImageBytes(pixels.tobytes(), pixels.shape[1], pixels.shape[0], 1, pixels.shape[1])
+                text = api.GetUTF8Text()
+            finally:
+                self._return_api(config=config, api=api, apis=apis)
+            engine = "tesserocr"
+        else:
+            # Every pytesseract read spawns its own tesseract.exe, so it does not need the lock either.
+            text = pytesseract.image_to_string(pixels, config=config.to_tesseract_arguments())
+            engine = "pytesseract"
+
+        with self._lock:
+            self.statistics.reads[engine] += 1
+            self.statistics.read_time[engine] += time.perf_counter() - start
+        return text.strip()
+
+    def _check_out_api(
+        self, config: OcrConfig
+    ) -> tuple["tesserocr.PyTessBaseAPI | None", dict[OcrConfig, list["tesserocr.PyTessBaseAPI"]]]:
+        """
+        Take an idle in-process engine of a config for a read, initializing a new one if there is none.
+        Only taking the engine holds the lock, the read itself does not.
+
+        Args:
+            config: The Tesseract settings of the engine.
+
+        Returns:
+            The engine or None if reads should fall back to pytesseract, and the idle engines it was checked out of.
+        """
+        with self._lock:
+            apis = self._apis
+            if self._in_process_failed:
+                return None, apis
+
+            idle_apis = apis.get(config)
+            if idle_apis:
+                return idle_apis.pop(), apis
+
+            tesseract_location = self._tesseract_location
+
+        api_arguments = {"lang": "eng", "psm": config.page_segmentation_mode, "oem": tesserocr.OEM.DEFAULT}
+        if tesseract_location is not None:
+            # The wheel does not bundle any language data, so we use the one of the Tesseract-OCR installation.
+            api_arguments["path"] = os.path.join(os.path.dirname(tesseract_location), "tessdata")
+        try:
+            api = tesserocr.PyTessBaseAPI(**api_arguments)
+        except RuntimeError as exc:
+            logger.opt(exception=exc).warning("Could not initialize in-process OCR, falling back to tesseract.exe")
+            with self._lock:
+                self._in_process_failed = True
+            return None, apis
+
+        api.SetVariable("tessedit_char_whitelist", config.whitelist)
+        return api, apis
+
+    def _return_api(
+        self, config: OcrConfig, api: "tesserocr.PyTessBaseAPI", apis: dict[OcrConfig, list["tesserocr.PyTessBaseAPI"]]
+    ) -> None:
+        """
+        Give an engine back after a read, or end it if the engines were released while it was checked out.
+
+        Args:
+            config: The Tesseract settings of the engine.
+            api: The engine.
+            apis: The idle engines the engine was checked out of.
+        """
+        with self._lock:
+            if apis is self._apis:
+                apis.setdefault(config, []).append(api)
+                return
+
+        api.End()
+
+    def close(self) -> None:
+        """
+        Release every in-process engine. Engines that are checked out are ended once their read is done.
+        """
+        with self._lock:
+            apis = self._apis
+            self._apis = {}
+        for idle_apis in apis.values():
+            for api in idle_apis:
+                api.End()
+
+    def log_statistics(self) -> None:
+        """
+        Log how many reads each engine did, how long they took on average and how often the cache was hit.
+        """
+        logger.debug(f"OCR cache: {self.statistics.cache_hits} hits, {self.statistics.cache_misses} misses")
+        for engine, reads in self.statistics.reads.items():
+            if reads:
+                read_time = self.statistics.read_time[engine]
+                logger.debug(f"OCR with {engine}: {reads} reads, {read_time / reads * 1000:.1f}ms each")
+
+
+OCR_SERVICE = OcrService()
@@ -0,0 +1,220 @@
+"""An index of where each template has been found before, so later searches only need to look around there."""
+from dataclasses import asdict
+from dataclasses import dataclass
+import json
+import os
+import threading
+
+from loguru import logger
+
+
+@dataclass
+class RegionOfInterest:
+    """
+    A dataclass holding the area a template has been found in so far, relative to the window.
+    """
+
+    min_x: int
+    min_y: int
+    max_x: int
+    max_y: int
+    misses: int = 0
+    hits: int = 0
+    searches: int = 0
+
+    def include(self, min_x: int, min_y: int, max_x: int, max_y: int) -> None:
+        """
+        Grow the region so it includes another area.
+
+        Args:
+            min_x: The min x of the area to include.
+            min_y: The min y of the area to include.
+            max_x: The max x of the area to include.
+            max_y: The max y of the area to include.
+        """
+        self.min_x = min(self.min_x, min_x)
+        self.min_y = min(self.min_y, min_y)
+        self.max_x = max(self.max_x, max_x)
+        self.max_y = max(self.max_y, max_y)
+
+
+class RoiIndex:
+    """
+    Records where each template matched per window resolution and limits later searches to a padded box around it.
+    A miss in the box is confirmed with a full window search right away, as the template may have shown up somewhere
+    else, unless the box has proven itself: it was searched at least min_searches times with a hit rate of at least
+    min_hit_rate. Even then, after max_misses misses in a row the next search covers the whole window.
+    """
+
+    def __init__(self, padding: int = 16, max_misses: int = 3, min_searches: int = 20, min_hit_rate: float = 0.9):
+        """
+        Args:
+            padding: The amount of pixels to pad the recorded region by on every side. Defaults to 16.
+            max_misses: The amount of misses in a row in a proven region before falling back to a full window search.
+              Defaults to 3.
+            min_searches: The amount of searches in a region before its hit rate counts. Defaults to 20.
+            min_hit_rate: The share of searches in a region that have to be hits for its misses to be trusted.
+              Defaults to 0.9.
+        """
+        self.padding = padding
+        self.max_misses = max_misses
+        self.min_searches = min_searches
+        self.min_hit_rate = min_hit_rate
+        self._regions: dict[str, dict[str, RegionOfInterest]] = {}
+        self._lock = threading.Lock()
+        self._path: str | None = None
+        self._dirty = False
+        self.region_searches = 0
+        self.full_searches = 0
+        self.searched_pixels = 0
+
+    def load(self, path: str) -> None:
+        """
+        Load previously recorded regions and remember where to save them to.
+
+        Args:
+            path: The path of the JSON file holding the regions.
+        """
+        self._path = path
+        if not os.path.isfile(path):
+            return
+
+        try:
+            with open(path, mode="r", encoding="UTF-8") as roi_file:
+                stored_regions = json.load(roi_file)
+        except (OSError, ValueError) as exc:
+            logger.opt(exception=exc).warning(f"Could not read the region of interest index at {path}, starting over")
+            return
+
+        self._regions = {
+            resolution: {key: RegionOfInterest(**region) for key, region in regions.items()}
+            for resolution, regions in stored_regions.items()
+        }
+        logger.debug(f"Loaded regions of interest for {sum(map(len, self._regions.values()))} templates")
+
+    def save(self) -> None:
+        """
+        Save the recorded regions, if anything changed since they were loaded or last saved.
+        """
+        if self._path is None or not self._dirty:
+            return
+
+        with self._lock:
+            stored_regions = {
+                resolution: {key: asdict(region) | {"misses": 0} for key, region in regions.items()}
+                for resolution, regions in self._regions.items()
+            }
+            self._dirty = False
+
+        with open(self._path, mode="w", encoding="UTF-8") as roi_file:
+            json.dump(stored_regions, roi_file, indent=2)
+
+    def get_search_region(self, key: str, width: int, height: int) -> tuple[int, int, int, int] | None:
+        """
+        Get the region a template should be searched in.
+
+        Args:
+            key: The template key.
+            width: The width of the window.
+            height: The height of the window.
+
+        Returns:
+            The padded region relative to the window (min x, min y, max x, max y),
+            or None if the whole window should be searched.
+        """
+        with self._lock:
+            region = self._regions.get(f"{width}x{height}", {}).get(key)
+            if region is None or region.misses >= self.max_misses:
+                self.full_searches += 1
+                self.searched_pixels += width * height
+                return None
+
+            search_region = (
+                max(0, region.min_x - self.padding),
+                max(0, region.min_y - self.padding),
+                min(width, region.max_x + self.padding),
+                min(height, region.max_y + self.padding),
+            )
+            self.region_searches += 1
+            self.searched_pixels += (search_region[2] - search_region[0]) * (search_region[3] - search_region[1])
+            return search_region
+
+    def record(  # pylint: disable=too-many-arguments
+        self,
+        key: str,
+        width: int,
+        height: int,
+        found_at: tuple[int, int, int, int] | None,
+        searched_region: bool,
+    ) -> bool:
+        """
+        Record the outcome of a search.
+
+        Args:
+            key: The template key.
+            width: The width of the window.
+            height: The height of the window.
+            found_at: Where the template was found, relative to the window (min x, min y, max x, max y),
+              or None if it was not found.
+            searched_region: Whether the search was limited to the region from get_search_region.
+
+        Returns:
+            Whether the search was a miss in a region that has not proven itself, which has to be confirmed
+            by searching the whole window.
+        """
+        with self._lock:
+            regions = self._regions.setdefault(f"{width}x{height}", {})
+            region = regions.get(key)
+            if region is not None and searched_region:
+                region.searches += 1
+                if found_at is not None:
+                    region.hits += 1
+                self._dirty = True
+
+            if found_at is None:
+                if region is None:
+                    return False
+                if not searched_region:
+                    # A full window search that misses as well means the template is simply not on screen.
+                    region.misses = 0
+                    return False
+
+                region.misses += 1
+                if region.searches >= self.min_searches and region.hits >= region.searches * self.min_hit_rate:
+                    return False
+
+                self.full_searches += 1
+                self.searched_pixels += width * height
+                return True
+
+            if region is None:
+                regions[key] = RegionOfInterest(*found_at)
+                self._dirty = True
+                return False
+
+            region.misses = 0
+            if not (
+                region.min_x <= found_at[0]
+                and region.min_y <= found_at[1]
+                and found_at[2] <= region.max_x
+                and found_at[3] <= region.max_y
+            ):
+                region.include(*found_at)
+                if not searched_region:
+                    # The template showed up outside of its region, so the region has to prove itself again.
+                    region.hits = region.searches = 0
+                self._dirty = True
+            return False
+
+    def log_statistics(self) -> None:
+        """
+        Log how many searches were limited to a region and how many pixels a search covered on average.
+        """
+        searches = self.region_searches + self.full_searches
+        logger.debug(
+            f"Region of interest index: {self.region_searches} region searches, {self.full_searches} full searches, "
+            f"{self.searched_pixels / searches if searches else 0:.0f} pixels per search on average"
+        )
+
+
+ROI_INDEX = RoiIndex()
@@ -1,15 +1,25 @@
 """A collection of screen helpers for detecting when images are on screen."""
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import os
 
 import cv2
 from loguru import logger
-import mss.tools
 import numpy
-from pytesseract import pytesseract
-import win32gui
-from difflib import SequenceMatcher
 
 from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import BUFFER_POOL
+from tft_bot.helpers.capture_helpers import Frame
+from tft_bot.helpers.capture_helpers import FRAME_SNAPSHOT
+from tft_bot.helpers.fuzzy_helpers import get_fuzzy_index
+from tft_bot.helpers.ocr_helpers import DIGITS
+from tft_bot.helpers.ocr_helpers import LETTERS
+from tft_bot.helpers.ocr_helpers import OCR_SERVICE
+from tft_bot.helpers.roi_index import ROI_INDEX
+from tft_bot.helpers.template_registry import Template
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+from tft_bot.helpers.viewport import get_viewport
 
 
 @dataclass
@@ -72,6 +82,189 @@ class ImageSearchResult(Coordinates):
     height: int
 
 
+@dataclass
+class TemplateMatch(ImageSearchResult):
+    """
+    A dataclass holding the best match of a template, even if it is not good enough to count as found.
+    """
+
+    key: str
+    score: float
+
+
+_MATCH_EXECUTOR: ThreadPoolExecutor | None = None
+
+# Templates without a fixed location on screen, searched coarse-to-fine on a downscaled frame first.
+# The value is the pyramid level, 1 to match at half the size and 2 to match at a quarter of the size.
+PYRAMID_LEVELS: dict[str, int] = {
+    CONSTANTS["game"]["gamelogic"]["vote"]: 2,
+    CONSTANTS["game"]["gamelogic"]["choose_one"]: 1,
+}
+# How far below the precision a coarse match may score and still be confirmed at full resolution.
+PYRAMID_PRECISION_GUARD = 0.15
+# How many coarse candidates get confirmed at full resolution.
+PYRAMID_CANDIDATES = 3
+# Templates smaller than this at the coarse level carry too little information and are searched at full resolution.
+PYRAMID_MIN_TEMPLATE_SIZE = 6
+
+
+class FrameChangeDetector:
+    """
+    Tells whether the screen of a window meaningfully changed since the last frame that did,
+    so template matches on a static screen can return the result they had before.
+
+    Every frame is compared to a reference frame on a thumbnail, where each pixel is the mean of a block of the frame.
+    The screen only counts as changed once any block differs by at least block_threshold from the reference.
+    Changes bump the generation of the window, and memoized matches are only re-used within a generation.
+
+    A thumbnail block is too coarse to notice small changes like a digit of the HUD, so matches restricted to a region
+    instead keep the pixels of that region and are only re-used while no pixel of it differs by pixel_threshold.
+    """
+
+    def __init__(
+        self,
+        thumbnail_level: int = 5,
+        block_threshold: float = 4.0,
+        pixel_threshold: int = 32,
+        max_memo_age: float = 5.0,
+    ):
+        """
+        Args:
+            thumbnail_level: The pyramid level of the thumbnail, 5 means every block is 32x32 pixels. Defaults to 5.
+            block_threshold: The mean gray value difference of a block that counts as a change. Defaults to 4.0.
+            pixel_threshold: The gray value difference of a single pixel of a searched region that counts as a change.
+              Defaults to 32.
+            max_memo_age: The amount of seconds a memoized result may be re-used for, even if nothing changed.
+              Defaults to 5.0.
+        """
+        self.enabled = True
+        self.thumbnail_level = thumbnail_level
+        self.block_threshold = block_threshold
+        self.pixel_threshold = pixel_threshold
+        self.max_memo_age = max_memo_age
+        self._references: dict[str, tuple[tuple[int, int, int, int], numpy.ndarray]] = {}
+        self._last_frames: dict[str, Frame] = {}
+        self._generations: dict[str, int] = {}
+        self._memos: dict[tuple, tuple[int, float, list[TemplateMatch]]] = {}
+        # The bounding box of the window, the pixels of the region, when they were captured and the matches.
+        self._region_memos: dict[tuple, tuple[tuple[int, int, int, int], numpy.ndarray, float, list]] = {}
+        self.changed_frames = 0
+        self.static_frames = 0
+        self.performed_matches = 0
+        self.skipped_matches = 0
+
+    def get_generation(self, frame: Frame) -> int:
+        """
+        Get the generation of a window's screen, comparing the frame to the reference if it was not compared yet.
+
+        Args:
+            frame: The current frame of the window.
+
+        Returns:
+            A number that only changes when the screen of the window meaningfully changed.
+        """
+        window_title = frame.window_title
+        if self._last_frames.get(window_title) is frame:
+            return self._generations[window_title]
+
+        self._last_frames[window_title] = frame
+        thumbnail = frame.get_downscaled_gray(level=self.thumbnail_level)
+        reference = self._references.get(window_title)
+        if (
+            reference is not None
+            and reference[0] == frame.bounding_box
+            and cv2.absdiff(thumbnail, reference[1]).max() < self.block_threshold
+        ):
+            # The reference is kept, so slow changes still add up to a change eventually.
+            self.static_frames += 1
+            return self._generations[window_title]
+
+        self._references[window_title] = (frame.bounding_box, thumbnail)
+        self._generations[window_title] = self._generations.get(window_title, -1) + 1
+        self._memos = {key: memo for key, memo in self._memos.items() if key[0] != window_title}
+        self.changed_frames += 1
+        return self._generations[window_title]
+
+    def get_memo(self, key: tuple, frame: Frame, region: BoundingBox | None = None) -> list[TemplateMatch] | None:
+        """
+        Get the memoized result of a template match, if the screen did not change since it was stored.
+
+        Args:
+            key: The key of the match, starting with the window title.
+            frame: The current frame of the window.
+            region: The region of the frame the match is restricted to, relative to the frame. Defaults to None,
+              meaning the whole frame.
+
+        Returns:
+            The memoized matches or None if they have to be computed again.
+        """
+        if not self.enabled:
+            return None
+
+        if region is not None:
+            region_memo = self._region_memos.get(key)
+            if (
+                region_memo is None
+                or region_memo[0] != frame.bounding_box
+                or frame.captured_at - region_memo[2] > self.max_memo_age
+            ):
+                return None
+
+            pixels = frame.get_gray()[region.min_y : region.max_y, region.min_x : region.max_x]
+            if (
+                pixels.shape != region_memo[1].shape
+                or cv2.absdiff(pixels, region_memo[1]).max() >= self.pixel_threshold
+            ):
+                return None
+
+            return region_memo[3]
+
+        memo = self._memos.get(key)
+        if (
+            memo is None
+            or memo[0] != self.get_generation(frame=frame)
+            or frame.captured_at - memo[1] > self.max_memo_age
+        ):
+            return None
+
+        return memo[2]
+
+    def store_memo(
+        self, key: tuple, frame: Frame, matches: list[TemplateMatch], region: BoundingBox | None = None
+    ) -> None:
+        """
+        Memoize the result of a template match for the current generation of the window's screen,
+        or for the current pixels of the region it is restricted to.
+
+        Args:
+            key: The key of the match, starting with the window title.
+            frame: The frame that was matched against.
+            matches: The result of the match.
+            region: The region of the frame the match was restricted to, relative to the frame. Defaults to None,
+              meaning the whole frame.
+        """
+        if not self.enabled:
+            return
+
+        if region is not None:
+            pixels = frame.get_gray()[region.min_y : region.max_y, region.min_x : region.max_x].copy()
+            self._region_memos[key] = (frame.bounding_box, pixels, frame.captured_at, matches)
+        else:
+            self._memos[key] = (self.get_generation(frame=frame), frame.captured_at, matches)
+
+    def log_statistics(self) -> None:
+        """
+        Log how many frames were static and how many template matches were skipped because of it.
+        """
+        logger.debug(
+            f"Frame change detector: {self.changed_frames} changed frames, {self.static_frames} static frames, "
+            f"{self.performed_matches} template matches performed, {self.skipped_matches} skipped"
+        )
+
+
+FRAME_CHANGE_DETECTOR = FrameChangeDetector()
+
+
 def get_window_bounding_box(window_title: str) -> BoundingBox | None:
     """
     Gets the bounding box of a specific window.
@@ -80,12 +273,12 @@ def get_window_bounding_box(window_title: str) -> BoundingBox | None:
         A bounding box (min x, min y, max x, max y) or None if no window exists.
 
     """
-    league_game_window_handle = win32gui.FindWindowEx(0, 0, 0, window_title)
-    if not league_game_window_handle:
+    viewport = get_viewport(window_title=window_title)
+    if viewport is None:
         logger.debug(f"We tried to check {window_title} for an image, but there is no window")
         return None
 
-    return BoundingBox(*win32gui.GetWindowRect(league_game_window_handle))
+    return BoundingBox(*viewport.bounding_box)
 
 
 def check_league_game_size(log: bool = True) -> tuple | None:
@@ -96,17 +289,17 @@ def check_league_game_size(log: bool = True) -> tuple | None:
         log: If you want to use this outside of init, set this to False. It will then return a tuple of the game's size
 
     Returns:
-        If log is False, returns a tuple of the game's size in the format (width, height) 
+        If log is False, returns a tuple of the game's size in the format (width, height)
     """
     league_game_bounding_box = get_window_bounding_box(window_title="League of Legends (TM) Client")
     if not league_game_bounding_box:
         return
-        
+
     width = league_game_bounding_box.get_width()
     height = league_game_bounding_box.get_height()
 
     if log:
-        if (width != 1920 and height != 1080) or (width != 1600 and height != 900):
+        if (width, height) not in ((1920, 1080), (1600, 900)):
             logger.error(
                 f"Your game's size is {width} x {height} "
                 f"instead of 1920 x 1080 or 1600 x 900! This WILL cause issues!"
@@ -128,31 +321,101 @@ def calculate_window_click_offset(window_title: str, position_x: int, position_y
     Returns:
         Absolute coordinates to click to.
     """
-    window_bounding_box = get_window_bounding_box(window_title=window_title)
-    if not window_bounding_box:
+    viewport = get_viewport(window_title=window_title)
+    if viewport is None:
+        return None
+
+    absolute_x, absolute_y = viewport.to_absolute((position_x, position_y))
+    return Coordinates(position_x=int(absolute_x), position_y=int(absolute_y))
+
+
+def calculate_window_click_offsets(window_title: str, positions: list[tuple[int, int]]) -> list[Coordinates] | None:
+    """
+    Calculate absolute screen coordinates for several relative pixel positions in a specific window at once.
+
+    Args:
+        window_title: The title of the window to click in.
+        positions: The relative x and y coordinates to click to.
+
+    Returns:
+        Absolute coordinates to click to, in the order of the given positions.
+    """
+    viewport = get_viewport(window_title=window_title)
+    if viewport is None:
         return None
-    
-    if window_title == CONSTANTS["window_titles"]["game"]:
-        resize = True
-        original_x = 1920
-        original_y = 1080
-    elif window_title == CONSTANTS["window_titles"]["client"]:
-        resize = True
-        original_x = 1280
-        original_y = 720
-
-    if resize:
-        resize_x = window_bounding_box.get_width() / original_x
-        resize_y = window_bounding_box.get_height() / original_y
-        position_x = int(position_x * resize_x)
-        position_y = int(position_y * resize_y)
-
-
-    return Coordinates(
-        position_x=window_bounding_box.min_x + position_x, position_y=window_bounding_box.min_y + position_y
+
+    return [
+        Coordinates(position_x=int(absolute_x), position_y=int(absolute_y))
+        for absolute_x, absolute_y in viewport.to_absolute(numpy.array(positions).reshape(-1, 2))
+    ]
+
+
+def get_frame(window_title: str) -> Frame | None:
+    """
+    Get the shared frame of a specific window, capturing it if there is no fresh one.
+
+    Args:
+        window_title: The title of the window we should look at.
+
+    Returns:
+        The frame or None if no window exists.
+    """
+    viewport = get_viewport(window_title=window_title)
+    if viewport is None:
+        logger.debug(f"We tried to check {window_title} for an image, but there is no window")
+        return None
+
+    return FRAME_SNAPSHOT.get(
+        window_title=window_title, bounding_box=viewport.bounding_box, scale=(viewport.scale_x, viewport.scale_y)
     )
 
 
+def get_search_region(frame: Frame, offsets: BoundingBox | tuple[int, int, int, int] | None = None) -> BoundingBox:
+    """
+    Calculate the region of a frame that should be searched, relative to the frame and clipped to it.
+
+    Args:
+        frame: The frame that is going to be searched.
+        offsets: A bounding box to off-set the window region by, in 1920x1080 (game) or 1280x720 (client) pixels.
+          Defaults to None, which searches the whole frame.
+
+    Returns:
+        The bounding box to search in, relative to the frame.
+    """
+    width = frame.get_width()
+    height = frame.get_height()
+    if not offsets:
+        return BoundingBox(0, 0, width, height)
+
+    if isinstance(offsets, BoundingBox):
+        offsets = offsets.to_tuple()
+
+    resize_x, resize_y = frame.scale
+    return BoundingBox(
+        min_x=max(0, int(offsets[0] * resize_x)),
+        min_y=max(0, int(offsets[1] * resize_y)),
+        max_x=min(width, width + int(offsets[2] * resize_x)),
+        max_y=min(height, height + int(offsets[3] * resize_y)),
+    )
+
+
+def get_game_region(frame: Frame, region: tuple[int, int, int, int]) -> numpy.ndarray:
+    """
+    Get a region of the gray-scaled game frame, given in 1920x1080 pixels and scaled to the actual window size.
+
+    Args:
+        frame: The frame of the game window.
+        region: The region to get, as min x, min y, max x, max y.
+
+    Returns:
+        A read-only view of the gray-scaled pixels in the region.
+    """
+    resize_x, resize_y = frame.scale
+    return frame.get_gray()[
+        int(region[1] * resize_y) : int(region[3] * resize_y), int(region[0] * resize_x) : int(region[2] * resize_x)
+    ]
+
+
 def get_on_screen_in_client(
     path: str, precision: float = 0.8, offsets: BoundingBox | None = None
 ) -> ImageSearchResult | None:
@@ -160,7 +423,7 @@ def get_on_screen_in_client(
     Check if a given image is detected on screen, but only check the league client window.
 
     Args:
-        path: The relative or absolute path to the image to be found.
+        path: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
         precision: The precision to be used when matching the image. Defaults to 0.8.
         offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
           Defaults to None.
@@ -180,9 +443,10 @@ def get_on_screen_in_game(
     Check if a given image is detected on screen, but only check the league game window.
 
     Args:
-    path: The relative or absolute path to the image to be found.
+    path: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
     precision: The precision to be used when matching the image. Defaults to 0.8.
-    offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region. Defaults to None.
+    offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+      Defaults to None.
 
     Returns:
     The position of the image and it's width and height or None if it wasn't found
@@ -200,65 +464,498 @@ def get_on_screen(
 
     Args:
     window_title: The title of the window we should look at.
-    path: The relative or absolute path to the image to be found.
+    path: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
     precision: The precision to be used when matching the image. Defaults to 0.8.
-    offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region. Defaults to None.
+    offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+      Defaults to None.
 
     Returns:
     The position of the image and it's width and height or None if it wasn't found
     """
-    window_bounding_box = get_window_bounding_box(window_title=window_title)
-    if not window_bounding_box:
+    search_result = get_first_on_screen(window_title=window_title, paths=[path], precision=precision, offsets=offsets)
+    if search_result is None:
         return None
 
-    image_to_find = cv2.imread(path, 0)
-    if image_to_find is None:
-        logger.warning(f"The image {path} does not exist on the system or we do not have permission to read it")
+    return ImageSearchResult(
+        position_x=search_result.position_x,
+        position_y=search_result.position_y,
+        height=search_result.height,
+        width=search_result.width,
+    )
+
+
+# How much two hits of the same template may overlap, as intersection over union, before the worse one is dropped.
+NMS_OVERLAP_THRESHOLD = 0.3
+
+
+def suppress_non_maxima(  # pylint: disable=too-many-arguments
+    scores: numpy.ndarray,
+    width: int,
+    height: int,
+    precision: float,
+    overlap_threshold: float = NMS_OVERLAP_THRESHOLD,
+    max_results: int | None = None,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Extract every hit from a template match response map, dropping hits that overlap a better one.
+
+    Args:
+        scores: The response map of cv2.matchTemplate.
+        width: The width of the template.
+        height: The height of the template.
+        precision: The score a location needs to count as a hit.
+        overlap_threshold: The intersection over union above which the worse of two hits is dropped.
+          Defaults to NMS_OVERLAP_THRESHOLD.
+        max_results: The amount of hits to return at most. Defaults to None, meaning all.
+
+    Returns:
+        The x and y positions of the hits as an array of shape (N, 2) and their scores, best first.
+    """
+    # Searching the flattened map is several times faster than numpy.nonzero on the 2D one.
+    peak_y, peak_x = numpy.divmod(numpy.flatnonzero(scores >= precision), scores.shape[1])
+    peak_scores = scores[peak_y, peak_x]
+    # Only local maxima can survive the suppression, so the neighbours of the few hits above the precision are
+    # compared instead of filtering the whole response map.
+    is_peak = numpy.ones(peak_scores.shape, dtype=bool)
+    for offset_y, offset_x in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbour_y = numpy.clip(peak_y + offset_y, 0, scores.shape[0] - 1)
+        neighbour_x = numpy.clip(peak_x + offset_x, 0, scores.shape[1] - 1)
+        is_peak &= peak_scores >= scores[neighbour_y, neighbour_x]
+    peak_x, peak_y, peak_scores = peak_x[is_peak], peak_y[is_peak], peak_scores[is_peak]
+    order = numpy.argsort(-peak_scores, kind="stable")
+    peak_x, peak_y, peak_scores = peak_x[order], peak_y[order], peak_scores[order]
+
+    area = width * height
+    kept = []
+    remaining = numpy.arange(len(peak_scores))
+    while remaining.size and (max_results is None or len(kept) < max_results):
+        best, remaining = remaining[0], remaining[1:]
+        kept.append(best)
+        # Every hit has the size of the template, so the overlap only depends on the distance between them.
+        overlap_x = numpy.maximum(0, width - numpy.abs(peak_x[remaining] - peak_x[best]))
+        overlap_y = numpy.maximum(0, height - numpy.abs(peak_y[remaining] - peak_y[best]))
+        intersection = overlap_x * overlap_y
+        remaining = remaining[intersection / (2 * area - intersection) <= overlap_threshold]
+
+    return numpy.column_stack((peak_x[kept], peak_y[kept])), peak_scores[kept]
+
+
+def find_all_on_screen(
+    window_title: str,
+    path: str,
+    precision: float = 0.8,
+    offsets: BoundingBox | None = None,
+    max_results: int | None = None,
+) -> list[TemplateMatch]:
+    """
+    Find every occurrence of an image in a specific window's area, in a single match.
+
+    Args:
+        window_title: The title of the window we should look at.
+        path: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
+        precision: The precision an occurrence needs to count as found. Defaults to 0.8.
+        offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+          Defaults to None.
+        max_results: The amount of occurrences to return at most. Defaults to None, meaning all.
+
+    Returns:
+        Every occurrence that was found, best first. Overlapping occurrences are reduced to the best of them.
+    """
+    frame = get_frame(window_title=window_title)
+    if frame is None:
+        return []
+
+    if isinstance(offsets, BoundingBox):
+        offsets = offsets.to_tuple()
+    memo_key = (window_title, "all", path, precision, offsets, max_results)
+    region = get_search_region(frame=frame, offsets=offsets)
+    memo_region = region if offsets else None
+    matches = FRAME_CHANGE_DETECTOR.get_memo(key=memo_key, frame=frame, region=memo_region)
+    if matches is not None:
+        FRAME_CHANGE_DETECTOR.skipped_matches += 1
+        return matches
+
+    template = TEMPLATE_REGISTRY.get_for_resolution(key=path, width=frame.get_width(), height=frame.get_height())
+    if template is None or region.get_width() < template.width or region.get_height() < template.height:
+        return []
+
+    gray_scaled_pixels = frame.get_gray()[region.min_y : region.max_y, region.min_x : region.max_x]
+    scores = cv2.matchTemplate(gray_scaled_pixels, template.image, cv2.TM_CCOEFF_NORMED)
+    positions, hit_scores = suppress_non_maxima(
+        scores=scores, width=template.width, height=template.height, precision=precision, max_results=max_results
+    )
+
+    matches = [
+        TemplateMatch(
+            position_x=int(position_x) + region.min_x + frame.bounding_box[0],
+            position_y=int(position_y) + region.min_y + frame.bounding_box[1],
+            width=template.width,
+            height=template.height,
+            key=template.key,
+            score=float(score),
+        )
+        for (position_x, position_y), score in zip(positions, hit_scores)
+    ]
+    FRAME_CHANGE_DETECTOR.performed_matches += 1
+    FRAME_CHANGE_DETECTOR.store_memo(key=memo_key, frame=frame, matches=matches, region=memo_region)
+    return matches
+
+
+def find_all_on_screen_in_game(
+    path: str, precision: float = 0.8, offsets: BoundingBox | None = None, max_results: int | None = None
+) -> list[TemplateMatch]:
+    """
+    Find every occurrence of an image, but only check the league game window.
+
+    Args:
+        path: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
+        precision: The precision an occurrence needs to count as found. Defaults to 0.8.
+        offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+          Defaults to None.
+        max_results: The amount of occurrences to return at most. Defaults to None, meaning all.
+
+    Returns:
+        Every occurrence that was found, best first.
+    """
+    return find_all_on_screen(
+        window_title=CONSTANTS["window_titles"]["game"],
+        path=path,
+        precision=precision,
+        offsets=offsets,
+        max_results=max_results,
+    )
+
+
+def _get_match_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool template matches are fanned out to, creating it on first use.
+    OpenCV releases the GIL while matching, so the threads actually run in parallel.
+
+    Returns:
+        The shared thread pool.
+    """
+    global _MATCH_EXECUTOR
+    if _MATCH_EXECUTOR is None:
+        _MATCH_EXECUTOR = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="template_matcher"
+        )
+    return _MATCH_EXECUTOR
+
+
+def _match_template_pyramid(
+    frame: Frame, region: BoundingBox, template: Template, level: int, precision: float
+) -> tuple[float, tuple[int, int]] | None:
+    """
+    Match a template coarse-to-fine: first against the downscaled frame, then confirm the best candidates
+    at full resolution in small windows around them.
+
+    Args:
+        frame: The frame to search in.
+        region: The region of the frame to search in, relative to the frame.
+        template: The template to search for.
+        level: The pyramid level to do the coarse search at.
+        precision: The precision a match needs to count as a hit.
+
+    Returns:
+        The score and location relative to the region, or None if the result is ambiguous
+        and the template should be searched at full resolution instead.
+    """
+    scale = 2**level
+    downscaled_template = TEMPLATE_REGISTRY.get_downscaled(template=template, level=level)
+    downscaled_pixels = frame.get_downscaled_gray(level=level)[
+        region.min_y // scale : region.max_y // scale, region.min_x // scale : region.max_x // scale
+    ]
+    if (
+        min(downscaled_template.shape) < PYRAMID_MIN_TEMPLATE_SIZE
+        or downscaled_pixels.shape[0] < downscaled_template.shape[0]
+        or downscaled_pixels.shape[1] < downscaled_template.shape[1]
+    ):
         return None
 
-    if offsets:
-        width = window_bounding_box.get_width()
-        height = window_bounding_box.get_height()
-
-        resize_x = 1
-        resize_y = 1
-        if window_title == CONSTANTS["window_titles"]["game"]:
-            resize_x = width / 1920
-            resize_y = height / 1080
-        elif window_title == CONSTANTS["window_titles"]["client"]:
-            resize_x = width / 1280
-            resize_y = height / 720
-
-        window_bounding_box.min_x += int(offsets[0] * resize_x)
-        window_bounding_box.min_y += int(offsets[1] * resize_y)
-        window_bounding_box.max_x += int(offsets[2] * resize_x)
-        window_bounding_box.max_y += int(offsets[3] * resize_y)
-
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(window_bounding_box.to_tuple())
-
-    pixels = numpy.array(screenshot)
-    gray_scaled_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
-    search_result = cv2.matchTemplate(gray_scaled_pixels, image_to_find, cv2.TM_CCOEFF_NORMED)
-
-    del screenshot
-    del pixels
-    del gray_scaled_pixels
-
-    _, max_precision, _, max_location = cv2.minMaxLoc(search_result)
-    
-    del search_result
-    if max_precision < precision:
+    coarse_result = cv2.matchTemplate(downscaled_pixels, downscaled_template, cv2.TM_CCOEFF_NORMED)
+    _, coarse_precision, _, coarse_location = cv2.minMaxLoc(coarse_result)
+    if coarse_precision < precision - PYRAMID_PRECISION_GUARD:
+        # Not even close at the coarse level, so it is not on screen.
+        return coarse_precision, (coarse_location[0] * scale, coarse_location[1] * scale)
+
+    gray_scaled_pixels = frame.get_gray()[region.min_y : region.max_y, region.min_x : region.max_x]
+    best_match = (-1.0, (0, 0))
+    for _ in range(PYRAMID_CANDIDATES):
+        _, candidate_precision, _, candidate_location = cv2.minMaxLoc(coarse_result)
+        if candidate_precision < precision - PYRAMID_PRECISION_GUARD:
+            break
+
+        # Confirm the candidate at full resolution, allowing for the position lost by downscaling.
+        min_x = max(0, (candidate_location[0] - 1) * scale)
+        min_y = max(0, (candidate_location[1] - 1) * scale)
+        max_x = min(gray_scaled_pixels.shape[1], (candidate_location[0] + 1) * scale + template.width)
+        max_y = min(gray_scaled_pixels.shape[0], (candidate_location[1] + 1) * scale + template.height)
+        confirm_result = cv2.matchTemplate(
+            gray_scaled_pixels[min_y:max_y, min_x:max_x], template.image, cv2.TM_CCOEFF_NORMED
+        )
+        _, confirmed_precision, _, confirmed_location = cv2.minMaxLoc(confirm_result)
+        if confirmed_precision > best_match[0]:
+            best_match = (confirmed_precision, (confirmed_location[0] + min_x, confirmed_location[1] + min_y))
+        if confirmed_precision >= precision:
+            return best_match
+
+        # Suppress this candidate so the next iteration finds the next best one.
+        half_width = downscaled_template.shape[1] // 2
+        half_height = downscaled_template.shape[0] // 2
+        cv2.rectangle(
+            coarse_result,
+            (candidate_location[0] - half_width, candidate_location[1] - half_height),
+            (candidate_location[0] + half_width, candidate_location[1] + half_height),
+            -1.0,
+            thickness=-1,
+        )
+
+    if coarse_precision >= precision:
+        # The coarse search was sure, but no candidate could be confirmed, so let the full search decide.
         return None
+    return best_match
 
-    return ImageSearchResult(
-        position_x=max_location[0] + window_bounding_box.min_x,
-        position_y=max_location[1] + window_bounding_box.min_y,
-        height=image_to_find.shape[0],
-        width=image_to_find.shape[1],
+
+def _match_template_in_region(
+    frame: Frame, region: BoundingBox, template: Template, precision: float
+) -> tuple[float, tuple[int, int]]:
+    """
+    Match a single template against a region of a frame, coarse-to-fine if it is one of PYRAMID_LEVELS.
+
+    Args:
+        frame: The frame to search in.
+        region: The region of the frame to search in, relative to the frame.
+        template: The template to search for.
+        precision: The precision a match needs to count as a hit.
+
+    Returns:
+        The score of the best match and its location relative to the frame.
+        The score is -1 if the region is smaller than the template.
+    """
+    if region.get_width() < template.width or region.get_height() < template.height:
+        return -1.0, (region.min_x, region.min_y)
+
+    pyramid_match = None
+    if template.key in PYRAMID_LEVELS:
+        pyramid_match = _match_template_pyramid(
+            frame=frame, region=region, template=template, level=PYRAMID_LEVELS[template.key], precision=precision
+        )
+
+    if pyramid_match is not None:
+        max_precision, max_location = pyramid_match
+    else:
+        gray_scaled_pixels = frame.get_gray()[region.min_y : region.max_y, region.min_x : region.max_x]
+        search_result = cv2.matchTemplate(gray_scaled_pixels, template.image, cv2.TM_CCOEFF_NORMED)
+        _, max_precision, _, max_location = cv2.minMaxLoc(search_result)
+
+    return max_precision, (max_location[0] + region.min_x, max_location[1] + region.min_y)
+
+
+def _match_template(frame: Frame, region: BoundingBox, template: Template, precision: float) -> TemplateMatch:
+    """
+    Match a single template against a region of a frame.
+    If the region is the whole frame, the search is limited to where the template was found before (see ROI_INDEX),
+    and a miss there is confirmed on the whole frame unless the region has proven itself.
+
+    Args:
+        frame: The frame to search in.
+        region: The region of the frame to search in, relative to the frame.
+        template: The template to search for.
+        precision: The precision the match needs to be recorded as a hit in the region of interest index.
+
+    Returns:
+        The best match of the template, with its absolute position and score.
+    """
+    width = frame.get_width()
+    height = frame.get_height()
+    search_regions = [region]
+    use_roi_index = region.to_tuple() == (0, 0, width, height)
+    if use_roi_index:
+        roi = ROI_INDEX.get_search_region(key=template.key, width=width, height=height)
+        if roi is not None:
+            search_regions.insert(0, BoundingBox(*roi))
+
+    for search_region in search_regions:
+        max_precision, (position_x, position_y) = _match_template_in_region(
+            frame=frame, region=search_region, template=template, precision=precision
+        )
+        if not use_roi_index or max_precision < 0:
+            break
+
+        confirm_miss = ROI_INDEX.record(
+            key=template.key,
+            width=width,
+            height=height,
+            found_at=(
+                (position_x, position_y, position_x + template.width, position_y + template.height)
+                if max_precision >= precision
+                else None
+            ),
+            searched_region=search_region is not region,
+        )
+        if not confirm_miss:
+            break
+
+    return TemplateMatch(
+        position_x=position_x + frame.bounding_box[0],
+        position_y=position_y + frame.bounding_box[1],
+        width=template.width,
+        height=template.height,
+        key=template.key,
+        score=max_precision,
     )
 
 
+def match_templates(  # pylint: disable=too-many-arguments
+    window_title: str,
+    paths: list[str],
+    precision: float = 0.8,
+    offsets: BoundingBox | None = None,
+    stop_at_first_hit: bool = False,
+    parallel: bool = False,
+) -> list[TemplateMatch]:
+    """
+    Match several templates against one frame of a specific window.
+
+    Args:
+        window_title: The title of the window we should look at.
+        paths: The template keys, which are the relative or absolute paths to the images as referenced in CONSTANTS.
+        precision: The precision a match needs to count as a hit. Defaults to 0.8.
+        offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+          Defaults to None.
+        stop_at_first_hit: Whether to stop matching once any template reaches the precision. Defaults to False.
+        parallel: Whether to fan the matches out over a thread pool. The result is the same as without it,
+          even with stop_at_first_hit, where the first hit in the order of the paths wins. Defaults to False.
+
+    Returns:
+        The best match of every template that was matched, in the order of the given paths.
+        Templates that could not be read or were skipped because of an earlier hit are left out.
+        If the screen did not meaningfully change since the same match was done, its result is returned instead
+        (see FRAME_CHANGE_DETECTOR).
+    """
+    frame = get_frame(window_title=window_title)
+    if frame is None:
+        return []
+
+    if isinstance(offsets, BoundingBox):
+        offsets = offsets.to_tuple()
+    # Matching in parallel returns the same matches as matching in order, so it does not need to be part of the key.
+    memo_key = (window_title, tuple(paths), precision, offsets, stop_at_first_hit)
+    memo_region = get_search_region(frame=frame, offsets=offsets) if offsets else None
+    matches = FRAME_CHANGE_DETECTOR.get_memo(key=memo_key, frame=frame, region=memo_region)
+    if matches is not None:
+        FRAME_CHANGE_DETECTOR.skipped_matches += len(paths)
+        return matches
+
+    matches = _match_templates_in_frame(
+        frame=frame,
+        paths=paths,
+        precision=precision,
+        offsets=offsets,
+        stop_at_first_hit=stop_at_first_hit,
+        parallel=parallel,
+    )
+    FRAME_CHANGE_DETECTOR.performed_matches += len(matches)
+    FRAME_CHANGE_DETECTOR.store_memo(key=memo_key, frame=frame, matches=matches, region=memo_region)
+    return matches
+
+
+def _match_templates_in_frame(  # pylint: disable=too-many-arguments
+    frame: Frame,
+    paths: list[str],
+    precision: float,
+    offsets: tuple[int, int, int, int] | None,
+    stop_at_first_hit: bool,
+    parallel: bool,
+) -> list[TemplateMatch]:
+    """
+    Match several templates against a frame, without looking at memoized results.
+
+    Args:
+        frame: The frame to search in.
+        paths: The template keys, which are the relative or absolute paths to the images as referenced in CONSTANTS.
+        precision: The precision a match needs to count as a hit.
+        offsets: A bounding box to off-set the region by, or None to search the whole frame.
+        stop_at_first_hit: Whether to stop matching once any template reaches the precision.
+        parallel: Whether to fan the matches out over a thread pool.
+
+    Returns:
+        The best match of every template that was matched, in the order of the given paths.
+    """
+    region = get_search_region(frame=frame, offsets=offsets)
+    templates = [
+        template
+        for template in (
+            TEMPLATE_REGISTRY.get_for_resolution(key=path, width=frame.get_width(), height=frame.get_height())
+            for path in paths
+        )
+        if template is not None
+    ]
+
+    if not parallel:
+        matches = []
+        for template in templates:
+            matches.append(_match_template(frame=frame, region=region, template=template, precision=precision))
+            if stop_at_first_hit and matches[-1].score >= precision:
+                break
+        return matches
+
+    # Make sure the gray-scaled frame is converted once before the worker threads share it.
+    frame.get_gray()
+    futures = [
+        _get_match_executor().submit(_match_template, frame, region, template, precision) for template in templates
+    ]
+    if not stop_at_first_hit:
+        return [future.result() for future in futures]
+
+    # The first hit in the order of the paths wins, like in the sequential scan. So a hit only cancels the templates
+    # after it, while the ones before it are still waited for, as they may be hits themselves.
+    future_indices = {future: index for index, future in enumerate(futures)}
+    first_hit_index = len(futures)
+    for future in as_completed(futures):
+        index = future_indices[future]
+        if index < first_hit_index and future.result().score >= precision:
+            first_hit_index = index
+            for later_future in futures[index + 1 :]:
+                later_future.cancel()
+        if all(earlier_future.done() for earlier_future in futures[:first_hit_index]):
+            break
+
+    return [future.result() for future in futures[: first_hit_index + 1]]
+
+
+def get_first_on_screen(
+    window_title: str,
+    paths: list[str],
+    precision: float = 0.8,
+    offsets: BoundingBox | None = None,
+    parallel: bool = False,
+) -> TemplateMatch | None:
+    """
+    Get the first of the given images that is detected on screen, matching all of them against a single frame.
+
+    Args:
+        window_title: The title of the window we should look at.
+        paths: The template keys, which are the relative or absolute paths to the images as referenced in CONSTANTS.
+        precision: The precision to be used when matching the images. Defaults to 0.8.
+        offsets: A bounding box to off-set the region by. Useful if you only want to check a specific region.
+          Defaults to None.
+        parallel: Whether to fan the matches out over a thread pool. Defaults to False.
+
+    Returns:
+        The match of the first image that was found or None if none was found.
+    """
+    matches = match_templates(
+        window_title=window_title,
+        paths=paths,
+        precision=precision,
+        offsets=offsets,
+        stop_at_first_hit=True,
+        parallel=parallel,
+    )
+    return next((match for match in matches if match.score >= precision), None)
+
+
 @logger.catch
 def get_on_screen_multiple_any(window_title: str, paths: list[str], precision: float = 0.8) -> bool:
     """Check if any of the given images are detected on screen.
@@ -271,14 +968,19 @@ def get_on_screen_multiple_any(window_title: str, paths: list[str], precision: f
     Returns:
         True if any of the images are detected on screen, False otherwise.
     """
-    for path in paths:
-        if get_on_screen(window_title=window_title, path=path, precision=precision):
-            return True
+    return get_first_on_screen(window_title=window_title, paths=paths, precision=precision) is not None
 
-    return False
+
+# The regions the gold amount and the round are displayed in, in 1920x1080 pixels.
+GOLD_REGION = (867, 881, 924, 909)
+ROUND_REGION = (767, 10, 870, 34)
+# The offsets of the window the gold captures are searched in, and the precision a gold capture needs.
+GOLD_DISPLAY_OFFSETS = BoundingBox(780, 850, -950, -160)
+GOLD_PRECISION = 0.9
 
 
-# essentially copied from https://github.com/jfd02/TFT-OCR-BOT/blob/ea3eb15d3f96109a616eb9f3508db14347ac0339/game_functions.py#L13
+# essentially copied from
+# https://github.com/jfd02/TFT-OCR-BOT/blob/ea3eb15d3f96109a616eb9f3508db14347ac0339/game_functions.py#L13
 def get_round_with_ocr(tesseract_location) -> str | None:
     """
     Get the current round using ocr
@@ -289,49 +991,28 @@ def get_round_with_ocr(tesseract_location) -> str | None:
     Returns:
         The current round as a string or None if it can't identify anything
     """
-    league_bounding_box = get_window_bounding_box(CONSTANTS["window_titles"]["game"])
-    if not league_bounding_box:
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return 0
 
-    width = league_bounding_box.get_width()
-    height = league_bounding_box.get_height()
-    min_x = league_bounding_box.min_x
-    min_y = league_bounding_box.min_y
-
-    resize_x = width / 1920
-    resize_y = height / 1080
-
-    with mss.mss() as screenshot_taker:
-        round_bounding_box = (
-            int(min_x + (767 * resize_x)),
-            int(min_y + (10 * resize_y)),
-            int(min_x + (870 * resize_x)),
-            int(min_y + (34 * resize_y)),
-        )
-        screenshot = screenshot_taker.grab(round_bounding_box)    
-
-    pytesseract.tesseract_cmd = tesseract_location
+    gray_scaled_pixels = get_game_region(frame=frame, region=ROUND_REGION)
 
-    pixels = numpy.array(screenshot)
-    gray_scaled_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
-    _TESSERACT_CONFIG = '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789 -c page_separator=""'
-    game_round: str = pytesseract.image_to_string(~gray_scaled_pixels, config=_TESSERACT_CONFIG)
-    
-    del screenshot
-    del pixels
-    del gray_scaled_pixels
+    OCR_SERVICE.set_tesseract_location(tesseract_location)
+    game_round: str = OCR_SERVICE.read(~gray_scaled_pixels, config=DIGITS)
 
-    # i dont fucking know why i need to do this, but it wont work otherwise. is pytesseract returning some invisible symbol???
-    if game_round != '':
+    # i dont fucking know why i need to do this, but it wont work otherwise.
+    # is pytesseract returning some invisible symbol???
+    if game_round != "":
         game_round = int(game_round)
         game_round = str(game_round)
 
     if game_round in CONSTANTS["game"]["round_text"]:
         logger.debug(f"OCR recognized current round as {game_round[0]}-{game_round[1]}")
         return game_round
-    
+
     return None
 
+
 def get_gold_with_ocr() -> int:
     """
     Get the gold by taking a screenshot of the region where it is and running OCR over it.
@@ -340,33 +1021,13 @@ def get_gold_with_ocr() -> int:
     Returns:
         The amount of gold the player currently has.
     """
-    league_bounding_box = get_window_bounding_box(CONSTANTS["window_titles"]["game"])
-    if not league_bounding_box:
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return 0
 
-    width = league_bounding_box.get_width()
-    height = league_bounding_box.get_height()
-
-    resize_x = width / 1920
-    resize_y = height / 1080
-
-    gold_bounding_box = (
-        int(league_bounding_box.min_x + (867 * resize_x)),
-        int(league_bounding_box.min_y + (881 * resize_y)),
-        int(league_bounding_box.min_x + (924 * resize_x)),
-        int(league_bounding_box.min_y + (909 * resize_y)),
-    )
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(gold_bounding_box)
-
-    pixels = numpy.array(screenshot)
-    gray_scaled_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
-
-    del screenshot
-    del pixels
+    gray_scaled_pixels = get_game_region(frame=frame, region=GOLD_REGION)
 
-    _TESSERACT_CONFIG = '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789 -c page_separator=""'
-    return int(pytesseract.image_to_string(~gray_scaled_pixels, config=_TESSERACT_CONFIG) or 0)
+    return int(OCR_SERVICE.read(~gray_scaled_pixels, config=DIGITS) or 0)
 
 
 def get_gold_with_opencv(num: int) -> bool:
@@ -380,7 +1041,7 @@ def get_gold_with_opencv(num: int) -> bool:
         True if we found the amount of gold. False if not.
     """
     try:
-        if get_on_screen_in_game(CONSTANTS["game"]["gold"][f"{num}"], 0.9, BoundingBox(int(780 * (10/12)), int(850 * (10/12)), int(970 * (10/12)), int(920*  (10/12)))):
+        if get_on_screen_in_game(CONSTANTS["game"]["gold"][f"{num}"], GOLD_PRECISION, GOLD_DISPLAY_OFFSETS):
             logger.debug(f"Found {num} gold")
             return True
     except Exception as exc:
@@ -390,28 +1051,6 @@ def get_gold_with_opencv(num: int) -> bool:
     return False
 
 
-def gold_at_least(num: int) -> bool:
-    """
-    Check if the gold on screen is at least the provided amount with opencv
-
-    Args:
-        num (int): The value to check if the gold is at least.
-
-    Returns:
-        bool: True if the value is >= `num`, False otherwise.
-    """
-    logger.debug(f"Looking for at least {num} gold")
-    if get_gold_with_opencv(num):
-        return True
-
-    for i in range(num + 1):
-        if get_gold_with_opencv(i):
-            return i >= num
-
-    logger.debug("No gold value found, assuming we have more")
-    return True
-
-
 # H, S, V
 LOWER_GREEN = numpy.array([40, 150, 10])
 UPPER_GREEN = numpy.array([75, 255, 255])
@@ -419,49 +1058,75 @@ UPPER_GREEN = numpy.array([75, 255, 255])
 FIELD_SLOT_Y_POSITIONS = numpy.array([672, 596, 515, 446])
 MINIMUM_Y_OFFSET = 75
 
+# The limits of a health bar's bounding box, in frame pixels.
+HEALTH_BAR_MIN_Y = int(275 * (10 / 12))
+HEALTH_BAR_MAX_Y = int(672 * (10 / 12))
+HEALTH_BAR_MIN_WIDTH = int(55 * (10 / 12))
+HEALTH_BAR_MAX_WIDTH = int(80 * (10 / 12))
+HEALTH_BAR_MIN_HEIGHT = int(5 * (10 / 12))
+HEALTH_BAR_MAX_HEIGHT = int(20 * (10 / 12))
+# How far the erosion, dilation and blur of the mask reach, so the cropped board is processed like the whole frame.
+BOARD_MASK_MARGIN = 8
+
+_SORTED_FIELD_SLOT_Y_POSITIONS = numpy.sort(FIELD_SLOT_Y_POSITIONS)
+
 
 def get_board_positions() -> list[Coordinates]:
     """
     Get position of units on the board.
+    Only the rows health bars can be in are processed, and the health bars are filtered as arrays.
 
-    Returns: A list of coordinates holding the board position of the unit.
+    Returns: A list of coordinates holding the board position of the unit, ordered top to bottom and left to right.
     """
-    window_bounding_box = get_window_bounding_box(window_title=CONSTANTS["window_titles"]["game"])
-    if not window_bounding_box:
+    frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return []
 
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(window_bounding_box.to_tuple())
-
-    pixels = numpy.array(screenshot)
-    hsv_pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2HSV)
-
-    mask = cv2.inRange(hsv_pixels, LOWER_GREEN, UPPER_GREEN)
-    mask = cv2.erode(mask, None, iterations=2)
-    mask = cv2.dilate(mask, None, iterations=2)
-    mask = cv2.GaussianBlur(mask, (5, 5), 0)
-
-    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-    positions = []
-    for contour in contours:
-        position_x, position_y, width, height = cv2.boundingRect(contour)
-
-        if position_y < int(275 * (10/12)) or position_y > int(672 * (10/12)):
-            continue
+    # A health bar starting at the lowest allowed row may reach one row further than the highest allowed height,
+    # so it is cut off below that and cannot pass the height filter by being cropped.
+    min_y = max(0, HEALTH_BAR_MIN_Y - BOARD_MASK_MARGIN)
+    max_y = min(frame.get_height(), HEALTH_BAR_MAX_Y + HEALTH_BAR_MAX_HEIGHT + 1 + BOARD_MASK_MARGIN)
+    if max_y <= min_y:
+        return []
 
-        if width < int(55 * (10/12)) or width > int(80 * (10/12)) or height < int(5 * (10/12)) or height > int(20 * (10/12)):
-            continue
+    board_pixels = frame.pixels[min_y:max_y]
+    board_shape = (max_y - min_y, frame.get_width())
+    hsv_pixels = BUFFER_POOL.get(name="board_hsv", shape=(*board_shape, 3))
+    mask = BUFFER_POOL.get(name="board_mask", shape=board_shape)
+    mask_buffer = BUFFER_POOL.get(name="board_mask_buffer", shape=board_shape)
+    cv2.cvtColor(board_pixels, cv2.COLOR_BGR2HSV, dst=hsv_pixels)
+    cv2.inRange(hsv_pixels, LOWER_GREEN, UPPER_GREEN, dst=mask)
+    cv2.erode(mask, None, dst=mask_buffer, iterations=2)
+    cv2.dilate(mask_buffer, None, dst=mask, iterations=2)
+    cv2.GaussianBlur(mask, (5, 5), 0, dst=mask_buffer)
+
+    contours, _ = cv2.findContours(mask_buffer, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return []
 
-        position_x = int(position_x + (width / 2))
-        position_y = int(position_y + (height / 2)) + MINIMUM_Y_OFFSET
-        potential_unit_y_positions = FIELD_SLOT_Y_POSITIONS[FIELD_SLOT_Y_POSITIONS > position_y]
-        if len(potential_unit_y_positions) == 0:
-            continue
+    bounding_boxes = numpy.array([cv2.boundingRect(contour) for contour in contours])
+    position_x, position_y, width, height = bounding_boxes.T
+    position_y = position_y + min_y
+    is_health_bar = (
+        (position_y >= HEALTH_BAR_MIN_Y)
+        & (position_y <= HEALTH_BAR_MAX_Y)
+        & (width >= HEALTH_BAR_MIN_WIDTH)
+        & (width <= HEALTH_BAR_MAX_WIDTH)
+        & (height >= HEALTH_BAR_MIN_HEIGHT)
+        & (height <= HEALTH_BAR_MAX_HEIGHT)
+    )
 
-        positions.append(Coordinates(position_x=position_x, position_y=potential_unit_y_positions.min()))
+    center_x = (position_x + width / 2).astype(int)[is_health_bar]
+    center_y = (position_y + height / 2).astype(int)[is_health_bar] + MINIMUM_Y_OFFSET
+    # The slot of a unit is the closest one below its health bar.
+    slot_indices = numpy.searchsorted(_SORTED_FIELD_SLOT_Y_POSITIONS, center_y, side="right")
+    in_a_slot = slot_indices < len(_SORTED_FIELD_SLOT_Y_POSITIONS)
+    slot_y = _SORTED_FIELD_SLOT_Y_POSITIONS[slot_indices[in_a_slot]]
 
-    return positions
+    return [
+        Coordinates(position_x=int(unit_x), position_y=int(unit_y))
+        for unit_y, unit_x in sorted(zip(slot_y.tolist(), center_x[in_a_slot].tolist()))
+    ]
 
 
 # essentially copied from https://github.com/jfd02/TFT-OCR-BOT/blob/main/arena_functions.py#L121
@@ -475,50 +1140,90 @@ def valid_item(item: str) -> str | None:
     Returns:
         String of item or None
     """
-    return next(
-        (
-            valid_name
-            for valid_name in CONSTANTS["game"]["items"]
-            if valid_name in item or SequenceMatcher(a=valid_name, b=item).ratio() >= 0.7
-        ),
-        None,
+    return get_fuzzy_index(tuple(CONSTANTS["game"].get("items", ()))).match(item)
+
+
+# Half the size of the square around an item slot that is checked for an item, in 1920x1080 pixels.
+# Like the slot coordinates, it is scaled to the size of the window.
+ITEM_SLOT_RADIUS = 14
+# The standard deviation of the gray-scaled slot pixels below which a slot is clearly empty and is not hovered.
+# Every other slot is hovered to check for the tooltip of an item, since no frame tells items apart for sure.
+# Check it against recorded frames with benchmarks.item_slots, a smaller window lowers the deviation by a few percent.
+ITEM_EMPTY_DEVIATION = 12.0
+# The offsets of the region the tooltip of a hovered item is shown in.
+ITEM_TOOLTIP_OFFSETS = (0, 540, 500, 0)
+
+
+def get_item_slot_deviations(frame: Frame) -> numpy.ndarray:
+    """
+    Get how much the pixels of every item slot vary, in one frame. Empty slots only show the plain board,
+    while item icons are detailed and colorful.
+
+    Args:
+        frame: The frame of the game window.
+
+    Returns:
+        The standard deviation of the gray-scaled pixels around every slot, in the order of the item coordinates.
+    """
+    gray_pixels = frame.get_gray()
+    resize_x, resize_y = frame.scale
+    radius_x = max(1, int(ITEM_SLOT_RADIUS * resize_x))
+    radius_y = max(1, int(ITEM_SLOT_RADIUS * resize_y))
+    deviations = []
+    for position_x, position_y in CONSTANTS["game"]["coordinates"]["items"]:
+        center_x = int(position_x * resize_x)
+        center_y = int(position_y * resize_y)
+        slot_pixels = gray_pixels[
+            max(0, center_y - radius_y) : center_y + radius_y, max(0, center_x - radius_x) : center_x + radius_x
+        ]
+        deviations.append(slot_pixels.std() if slot_pixels.size else 0.0)
+    return numpy.array(deviations)
+
+
+def _is_item_tooltip_shown() -> bool:
+    """
+    Check if the tooltip of a recipe or an emblem is shown, which is the case while hovering an item.
+
+    Returns:
+        True if a tooltip of an item is shown, False otherwise.
+    """
+    return bool(
+        get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["recipe"], offsets=ITEM_TOOLTIP_OFFSETS)
+        or get_on_screen_in_game(CONSTANTS["game"]["gamelogic"]["emblem"], offsets=ITEM_TOOLTIP_OFFSETS)
     )
 
 
 def get_items() -> list:
     """
     Checks every position for items and looks if there is one present.
+    Slots that are clearly empty in a single frame are skipped, every other slot is hovered.
 
     Returns:
-        List of dictionaries, with tuple "coordinates" and string "item_name".
+        List with the coordinates of the item in the slot, or None if the slot is empty, per slot.
     """
     from tft_bot.helpers.click_helpers import move_to
 
-    league_bounding_box = get_window_bounding_box(CONSTANTS["window_titles"]["game"])
-    if not league_bounding_box:
-        return 0
+    offsets = calculate_window_click_offsets(
+        window_title=CONSTANTS["window_titles"]["game"], positions=CONSTANTS["game"]["coordinates"]["items"]
+    )
+    frame = get_frame(window_title=CONSTANTS["window_titles"]["game"])
+    if not offsets or frame is None:
+        return []
 
+    deviations = get_item_slot_deviations(frame=frame)
     item_list = []
-    for pos in CONSTANTS["game"]["coordinates"]["items"]:
-        offset = calculate_window_click_offset(
-            window_title=CONSTANTS["window_titles"]["game"], position_x=pos[0], position_y=pos[1]
-        )
-        move_to(position_x=offset.position_x, position_y=offset.position_y)
-        region = (
-            0,
-            540,
-            500,
-            0
-        )
-
-        if get_on_screen_in_game(
-            CONSTANTS["game"]["gamelogic"]["recipe"], offsets=region) or get_on_screen_in_game(
-            CONSTANTS["game"]["gamelogic"]["emblem"], offsets=region):
-            item_list.append((offset.position_x, offset.position_y))
+    hovered_slots = 0
+    for offset, deviation in zip(offsets, deviations):
+        if deviation <= ITEM_EMPTY_DEVIATION:
+            has_item = False
         else:
-            item_list.append(None)
+            move_to(position_x=offset.position_x, position_y=offset.position_y)
+            has_item = _is_item_tooltip_shown()
+            hovered_slots += 1
+
+        item_list.append((offset.position_x, offset.position_y) if has_item else None)
 
-    logger.debug(f"Found items at: {item_list}")
+    logger.debug(f"Found items at: {item_list}, hovered {hovered_slots} of {len(item_list)} slots")
     return item_list
 
 
@@ -532,13 +1237,23 @@ def valid_champion(champion: str, valid_champions: list[str]) -> str | None:
     Returns:
         String of item or None
     """
-    return next(
-        (
-            valid_name
-            for valid_name in valid_champions
-            if valid_name in champion or SequenceMatcher(a=valid_name, b=champion).ratio() >= 0.7
-        ),
-        None,
+    return get_fuzzy_index(tuple(valid_champions)).match(champion)
+
+
+def get_champion_names(wanted_traits: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Get the names of every champion with any of the wanted traits, without duplicates.
+
+    Args:
+        wanted_traits: The traits we are searching for.
+
+    Returns:
+        The champion names, in the order of the traits and of the champions per trait.
+    """
+    return tuple(
+        dict.fromkeys(
+            champion for trait in wanted_traits for champion in CONSTANTS["game"]["champions"]["trait"][trait]
+        )
     )
 
 
@@ -551,44 +1266,19 @@ def check_champion(wanted_traits: list) -> str | None:
         wanted_traits: List of traits we are searching for.
 
     Returns:
-        Name of detected champ as string or None if nothing was found. (Currently only void and sorcerer champs can be found)
+        Name of detected champ as string or None if nothing was found.
+        (Currently only void and sorcerer champs can be found)
     """
-    league_bounding_box = get_window_bounding_box(CONSTANTS["window_titles"]["game"])
-    if not league_bounding_box:
+    frame = get_frame(CONSTANTS["window_titles"]["game"])
+    if frame is None:
         return None
 
-    width = league_bounding_box.get_width()
-    height = league_bounding_box.get_height()
-    min_x = league_bounding_box.min_x
-    min_y = league_bounding_box.min_y
-
-    resize_x = width / 1920
-    resize_y = height / 1080
-
-    region = (
-        int(min_x + (1700 * resize_x)),
-        int(min_y + (325 * resize_y)),
-        int(min_x + (1860 * resize_x)),
-        int(min_y + (350 * resize_y)),
-    )
-
-    with mss.mss() as screenshot_taker:
-        screenshot = screenshot_taker.grab(region)
-        # mss.tools.to_png(screenshot.rgb, screenshot.size, output="image.png")
-
-    pixels = numpy.array(screenshot)
-    gray_scaled = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
+    gray_scaled = get_game_region(frame=frame, region=(1700, 325, 1860, 350))
 
     from ..config import get_tesseract_location
     from ..helpers import system_helpers
 
-    pytesseract.tesseract_cmd = get_tesseract_location(system_helpers=system_helpers)
-    valid_champions = []
-    for trait in wanted_traits:
-        for champion in CONSTANTS["game"]["champions"]["trait"][trait]:
-            if champion not in valid_champions:
-                valid_champions.append(champion)
+    OCR_SERVICE.set_tesseract_location(get_tesseract_location(system_helpers=system_helpers))
 
-    _TESSERACT_CONFIG = '--oem 3 --psm 7 -c tessedit_char_whitelist=abcdefghjklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ -c page_separator=""'
-    detected_champ = pytesseract.image_to_string(~gray_scaled, config=_TESSERACT_CONFIG).lower()
-    return valid_champion(detected_champ, valid_champions)
+    detected_champ = OCR_SERVICE.read(~gray_scaled, config=LETTERS).lower()
+    return valid_champion(detected_champ, get_champion_names(tuple(wanted_traits)))
@@ -0,0 +1,155 @@
+"""Reads the shop, which of the wanted traits and champions every shop card shows, from a single capture."""
+from dataclasses import dataclass
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import get_capture_backend
+from tft_bot.helpers.ocr_helpers import LETTERS
+from tft_bot.helpers.ocr_helpers import OCR_SERVICE
+from tft_bot.helpers.screen_helpers import get_champion_names
+from tft_bot.helpers.screen_helpers import get_frame
+from tft_bot.helpers.screen_helpers import get_game_region
+from tft_bot.helpers.screen_helpers import ImageSearchResult
+from tft_bot.helpers.screen_helpers import valid_champion
+from tft_bot.helpers.template_registry import GAME_NATIVE_RESOLUTION
+from tft_bot.helpers.template_registry import TEMPLATE_REGISTRY
+from tft_bot.helpers.viewport import get_viewport
+
+# The regions of the five shop cards and of all of them together, in 1920x1080 pixels.
+SHOP_CARD_REGIONS = tuple((481 + index * 201, 927, 673 + index * 201, 1072) for index in range(5))
+SHOP_REGION = (SHOP_CARD_REGIONS[0][0], SHOP_CARD_REGIONS[0][1], SHOP_CARD_REGIONS[-1][2], SHOP_CARD_REGIONS[-1][3])
+# The region of the champion name on a shop card, relative to the card, in 1920x1080 pixels.
+SHOP_CARD_NAME_OFFSETS = (10, 115, 140, 140)
+
+
+@dataclass(frozen=True)
+class ShopSlot:
+    """
+    A dataclass holding what was detected on a single shop card.
+    """
+
+    index: int
+    traits: tuple[str, ...]
+    card: ImageSearchResult
+    champion: str | None = None
+
+    def get_trait(self) -> str | None:
+        """
+        Get the trait the card was picked for, the first of its wanted traits.
+
+        Returns:
+            The trait or None if the card has none of the wanted traits.
+        """
+        return self.traits[0] if self.traits else None
+
+
+def _grab_shop(shop_only: bool) -> tuple[numpy.ndarray, tuple[int, int], tuple[float, float]] | None:
+    """
+    Get the gray-scaled pixels of the shop, either from the shared frame or by capturing only the shop.
+
+    Args:
+        shop_only: Whether to capture only the shop instead of using the shared frame of the whole window.
+
+    Returns:
+        The pixels, their absolute top left position and the scale of the window, or None if there is no game window.
+    """
+    window_title = CONSTANTS["window_titles"]["game"]
+    viewport = get_viewport(window_title=window_title)
+    if viewport is None:
+        return None
+
+    min_x, min_y = viewport.to_absolute((SHOP_REGION[0], SHOP_REGION[1]))
+    if shop_only:
+        max_x, max_y = viewport.to_absolute((SHOP_REGION[2], SHOP_REGION[3]))
+        pixels = cv2.cvtColor(get_capture_backend().grab((min_x, min_y, max_x, max_y)), cv2.COLOR_BGRA2GRAY)
+    else:
+        frame = get_frame(window_title=window_title)
+        if frame is None:
+            return None
+        pixels = get_game_region(frame=frame, region=SHOP_REGION)
+
+    return pixels, (int(min_x), int(min_y)), (viewport.scale_x, viewport.scale_y)
+
+
+def analyze_shop(
+    wanted_traits: list[str], precision: float = 0.8, read_champions: bool = False, shop_only: bool = False
+) -> list[ShopSlot]:
+    """
+    Detect which of the wanted traits every shop card has, matching each trait icon once against the whole shop.
+
+    Args:
+        wanted_traits: The traits we are searching for, in the order they are preferred in.
+        precision: The precision an icon needs to count as found on a card. Defaults to 0.8.
+        read_champions: Whether to read the champion name of the cards with a wanted trait as well. Defaults to False.
+        shop_only: Whether to capture only the shop instead of using the shared frame, e.g. to check the shop
+          again right after buying. Defaults to False.
+
+    Returns:
+        A slot per shop card, from left to right, or an empty list if there is no game window.
+    """
+    grabbed_shop = _grab_shop(shop_only=shop_only)
+    if grabbed_shop is None:
+        return []
+
+    shop_pixels, (shop_x, shop_y), (scale_x, scale_y) = grabbed_shop
+    window_width = round(GAME_NATIVE_RESOLUTION[0] * scale_x)
+    window_height = round(GAME_NATIVE_RESOLUTION[1] * scale_y)
+    shop_min_x = int(SHOP_REGION[0] * scale_x)
+    card_bounds = [
+        (int(card_region[0] * scale_x) - shop_min_x, int(card_region[2] * scale_x) - shop_min_x)
+        for card_region in SHOP_CARD_REGIONS
+    ]
+
+    card_traits: list[list[str]] = [[] for _ in SHOP_CARD_REGIONS]
+    for trait in wanted_traits:
+        template = TEMPLATE_REGISTRY.get_for_resolution(
+            key=CONSTANTS["game"]["trait"][trait], width=window_width, height=window_height
+        )
+        if template is None or shop_pixels.shape[0] < template.height or shop_pixels.shape[1] < template.width:
+            continue
+
+        # The best score per column, so every card only needs the maximum over its own columns.
+        column_scores = cv2.matchTemplate(shop_pixels, template.image, cv2.TM_CCOEFF_NORMED).max(axis=0)
+        for index, (card_min_x, card_max_x) in enumerate(card_bounds):
+            card_scores = column_scores[card_min_x : max(card_min_x, card_max_x - template.width + 1)]
+            if card_scores.size and card_scores.max() >= precision:
+                card_traits[index].append(trait)
+
+    if read_champions and any(card_traits):
+        from ..config import get_tesseract_location
+        from ..helpers import system_helpers
+
+        OCR_SERVICE.set_tesseract_location(get_tesseract_location(system_helpers=system_helpers))
+        valid_champions = get_champion_names(tuple(wanted_traits))
+
+    shop_slots = []
+    for index, ((card_min_x, card_max_x), traits) in enumerate(zip(card_bounds, card_traits)):
+        champion = None
+        if read_champions and traits:
+            name_min_x = card_min_x + int(SHOP_CARD_NAME_OFFSETS[0] * scale_x)
+            name_max_x = card_min_x + int(SHOP_CARD_NAME_OFFSETS[2] * scale_x)
+            name_pixels = shop_pixels[
+                int(SHOP_CARD_NAME_OFFSETS[1] * scale_y) : int(SHOP_CARD_NAME_OFFSETS[3] * scale_y),
+                name_min_x:name_max_x,
+            ]
+            champion = valid_champion(OCR_SERVICE.read(~name_pixels, config=LETTERS).lower(), valid_champions)
+
+        shop_slots.append(
+            ShopSlot(
+                index=index,
+                traits=tuple(traits),
+                card=ImageSearchResult(
+                    position_x=shop_x + card_min_x,
+                    position_y=shop_y,
+                    width=card_max_x - card_min_x,
+                    height=shop_pixels.shape[0],
+                ),
+                champion=champion,
+            )
+        )
+
+    logger.debug(f"Shop traits: {[shop_slot.traits for shop_slot in shop_slots]}")
+    return shop_slots
@@ -1,7 +1,6 @@
 """A collection of system-level helpers"""
 import os
 import pathlib
-import re
 import socket
 import winreg
 
@@ -11,7 +10,11 @@ import win32com.client
 import win32gui
 import win32process
 
-from tft_bot import config
+from tft_bot.helpers.install_locations import INSTALL_LOCATIONS
+from tft_bot.helpers.install_locations import LEAGUE_CLIENT
+from tft_bot.helpers.install_locations import RIOT_CLIENT
+from tft_bot.helpers.install_locations import TESSERACT_OCR
+from tft_bot.helpers.install_locations import TESSERACT_OCR_EXECUTABLE
 
 try:
     import ctypes
@@ -122,124 +125,42 @@ def expand_environment_variables(var: str) -> str:
     return os.path.expandvars(var)
 
 
-def read_registry(hkey_type: int, path: str, value: str) -> str | None:
-    """
-    Read the registry at a specific hkey type and path.
-
-    Args:
-        hkey_type: The HKEY to read at, see winreg.HKEY_*
-        path: The path to read at.
-        value: The specific value to read from the path
-
-    Returns:
-        The value as a str if found, otherwise None.
-    """
-    try:
-        access_registry = winreg.ConnectRegistry(None, hkey_type)
-        access_key = winreg.OpenKey(
-            access_registry,
-            path,
-            0,
-            winreg.KEY_READ,
-        )
-        [path, _] = winreg.QueryValueEx(access_key, value)
-    except Exception as exc:
-        logger.opt(exception=exc).error(f"Could not read registry at {path}\\{value}.")
-        return None
-
-    return path
-
-
 def determine_league_install_location() -> str:
-    """Determine the location League was installed.
+    """Determine the location League was installed. It is only resolved once, see INSTALL_LOCATIONS.
 
     Returns:
         str: If successful, the determined install location. If unsuccessful, the default install location.
     """
-    # Assign default just in case it failed to be found
-    league_path = r"C:\Riot Games\League of Legends"
-    override_path = config.get_override_install_location("league_client")
-
-    if override_path is not None:
-        logger.warning(f"Override path supplied, using '{override_path}' as League install directory.")
-        league_path = override_path
-    else:
-        registry_entry = read_registry(
-            hkey_type=winreg.HKEY_CURRENT_USER,
-            path=r"Software\Microsoft\Windows\CurrentVersion\Uninstall\Riot Game league_of_legends.live",
-            value="InstallLocation",
-        )
-        if registry_entry:
-            league_path = registry_entry
-
-    league_path = str(pathlib.PureWindowsPath(league_path))
-
-    logger.debug(f"League path determined to be: {league_path}")
-
-    return league_path
+    return INSTALL_LOCATIONS.get(LEAGUE_CLIENT)
 
 
 def determine_riot_client_install_location() -> str:
-    """Determine the location League was installed.
+    """Determine the location the Riot Client was installed. It is only resolved once, see INSTALL_LOCATIONS.
 
     Returns:
         str: If successful, the determined install location. If unsuccessful, the default install location.
     """
-    # Assign default just in case it failed to be found
-    riot_path = r"C:\Riot Games\Riot Client"
-    override_path = config.get_override_install_location("riot_client")
-
-    if override_path is not None:
-        logger.warning(f"Override path supplied, using '{override_path}' as League install directory.")
-        riot_path = override_path
-    else:
-        registry_entry = read_registry(
-            hkey_type=winreg.HKEY_CURRENT_USER,
-            path=r"Software\Microsoft\Windows\CurrentVersion\Uninstall\Riot Game league_of_legends.live",
-            value="UninstallString",
-        )
-        # The only way we can parse the install location of client services is from the league uninstallation
-        # registry entry, so we parse it to ensure we strip the uninstall args
-        if registry_entry and r"Riot Client\RiotClientServices.exe" in registry_entry:
-            try:
-                search_result = re.search(r".*Riot Client\\RiotClientServices.exe", registry_entry)
-                riot_path = search_result.group()[1:]
-                riot_path = re.search(r".*\\Riot Client", riot_path).group()
-            except Exception:
-                pass
-
-    riot_path = str(pathlib.PureWindowsPath(riot_path))
-
-    logger.debug(f"Riot client path determined to be: {riot_path}")
-
-    return riot_path
+    return INSTALL_LOCATIONS.get(RIOT_CLIENT)
 
 
 def determine_tesseract_ocr_install_location() -> str:
     """
-    Determine the location Tesseract-OCR was installed at.
+    Determine the location Tesseract-OCR was installed at. It is only resolved once, see INSTALL_LOCATIONS.
 
     Returns:
         If successful, the determined install location. If unsuccessful, the default install location.
     """
-    tesseract_ocr_path = r"C:\Program Files\Tesseract-OCR"
-    override_path = config.get_tesseract_override_install_location()
+    return INSTALL_LOCATIONS.get(TESSERACT_OCR)
 
-    if override_path is not None:
-        logger.warning(f"Override path supplied, using '{override_path}' as Tesseract-OCR install directory.")
-        tesseract_ocr_path = override_path
-    else:
-        registry_entry = read_registry(
-            hkey_type=winreg.HKEY_LOCAL_MACHINE, path=r"SOFTWARE\Tesseract-OCR", value="InstallDir"
-        )
-        if registry_entry:
-            tesseract_ocr_path = registry_entry
 
-        tesseract_ocr_path = str(pathlib.PureWindowsPath(tesseract_ocr_path))
-
-    logger.debug(f"Tesseract-OCR location determined to be: {tesseract_ocr_path}")
+def determine_tesseract_ocr_executable_location() -> str | None:
+    """
+    Determine where tesseract.exe is. It is only resolved once, see INSTALL_LOCATIONS.
 
-    return tesseract_ocr_path
+    Returns:
+        The path to tesseract.exe or None if it does not exist.
+    """
+    return INSTALL_LOCATIONS.get(TESSERACT_OCR_EXECUTABLE)
 
 
 def determine_deceive_install_location() -> str | None:
@@ -0,0 +1,303 @@
+"""A registry holding every template image we search for, decoded once instead of on every screen check."""
+from dataclasses import dataclass
+from dataclasses import field
+import os
+import time
+from typing import Any, Iterator
+
+import cv2
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+
+# The window sizes the templates were captured at, unless overridden in TEMPLATE_NATIVE_RESOLUTIONS.
+GAME_NATIVE_RESOLUTION = (1920, 1080)
+CLIENT_NATIVE_RESOLUTION = (1280, 720)
+# Templates that were captured at a different window size than the rest of their window's templates.
+TEMPLATE_NATIVE_RESOLUTIONS: dict[str, tuple[int, int]] = {
+    CONSTANTS["game"]["trait"][trait]: (1600, 900) for trait in ("bruiser", "dazzler", "guardian", "mosher", "sentinel")
+}
+# Scale factors closer to 1 than this are treated as the native resolution and use the original template.
+SCALE_TOLERANCE = 0.01
+
+
+@dataclass(frozen=True)
+class Template:
+    """
+    A dataclass holding a decoded gray-scale template image and metadata we would otherwise recompute per search.
+    """
+
+    key: str
+    image: numpy.ndarray
+    width: int
+    height: int
+    norm: float
+
+
+@dataclass
+class TemplateRegistryStatistics:
+    """
+    A dataclass holding counters about how the registry has been used.
+    """
+
+    loaded: int = 0
+    failed: int = 0
+    load_time: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    failed_keys: set[str] = field(default_factory=set)
+
+    def get_hit_rate(self) -> float:
+        """
+        Get the share of lookups that were served without touching the disk.
+
+        Returns:
+            The hit rate as a float between 0 and 1, or 0 if there were no lookups yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def iter_template_paths(constants: dict[str, Any]) -> Iterator[str]:
+    """
+    Walk a (nested) constants dictionary and yield every image path referenced in it.
+
+    Args:
+        constants: The dictionary to walk, usually CONSTANTS or a sub-dictionary of it.
+
+    Returns:
+        An iterator over every string value ending in .png.
+    """
+    for value in constants.values():
+        if isinstance(value, dict):
+            yield from iter_template_paths(value)
+        elif isinstance(value, str) and value.endswith(".png"):
+            yield value
+
+
+_CLIENT_TEMPLATE_PATHS = frozenset(iter_template_paths(CONSTANTS["client"]))
+
+
+def get_native_resolution(key: str) -> tuple[int, int]:
+    """
+    Get the window size a template was captured at.
+
+    Args:
+        key: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
+
+    Returns:
+        The width and height of the window the template was captured in.
+    """
+    if key in TEMPLATE_NATIVE_RESOLUTIONS:
+        return TEMPLATE_NATIVE_RESOLUTIONS[key]
+
+    return CLIENT_NATIVE_RESOLUTION if key in _CLIENT_TEMPLATE_PATHS else GAME_NATIVE_RESOLUTION
+
+
+class TemplateRegistry:
+    """
+    Holds every template image, keyed by the path it is referenced by in CONSTANTS.
+    Images are decoded to gray-scale once, so the game loop never reads them from disk again.
+    Variants rescaled to other window sizes are built the first time they are needed and cached on disk,
+    if a cache directory is set.
+    """
+
+    def __init__(self, cache_directory: str | None = None):
+        """
+        Args:
+            cache_directory: The directory to cache rescaled templates in, one sub-directory per window size.
+              Defaults to None, which only keeps them in memory.
+        """
+        self.cache_directory = cache_directory
+        self._templates: dict[str, Template] = {}
+        self._scaled: dict[tuple[str, int, int], Template] = {}
+        self._downscaled: dict[tuple[str, int, int, int], numpy.ndarray] = {}
+        self._resolutions: set[tuple[int, int]] = set()
+        self.statistics = TemplateRegistryStatistics()
+
+    def load_all(self, constants: dict[str, Any] | None = None) -> int:
+        """
+        Decode every template referenced in the given constants.
+
+        Args:
+            constants: The constants to search for image paths. Defaults to None, which searches CONSTANTS.
+
+        Returns:
+            The amount of templates that are loaded after this call.
+        """
+        if constants is None:
+            constants = CONSTANTS
+
+        for path in iter_template_paths(constants):
+            if path not in self._templates:
+                self._load(path)
+
+        logger.debug(
+            f"Loaded {self.statistics.loaded} templates in {self.statistics.load_time * 1000:.1f}ms, "
+            f"{self.statistics.failed} could not be read"
+        )
+        return len(self._templates)
+
+    def get(self, key: str) -> Template | None:
+        """
+        Get a template by its key. Templates that were not pre-loaded are loaded on demand and counted as a miss.
+
+        Args:
+            key: The relative or absolute path to the image, as referenced in CONSTANTS.
+
+        Returns:
+            The template or None if the image could not be read.
+        """
+        template = self._templates.get(key)
+        if template is not None:
+            self.statistics.hits += 1
+            return template
+
+        self.statistics.misses += 1
+        if key in self.statistics.failed_keys:
+            return None
+
+        return self._load(key)
+
+    def get_for_resolution(self, key: str, width: int, height: int) -> Template | None:
+        """
+        Get a template rescaled to a window size, so it matches the pixels of a window that is not at the size
+        the template was captured at.
+
+        Args:
+            key: The template key, which is the relative or absolute path to the image as referenced in CONSTANTS.
+            width: The width of the window the template is searched in.
+            height: The height of the window the template is searched in.
+
+        Returns:
+            The rescaled template, the original template if the window is at its native size,
+            or None if the image could not be read.
+        """
+        template = self.get(key)
+        if template is None:
+            return None
+
+        native_width, native_height = get_native_resolution(key)
+        scale_x = width / native_width
+        scale_y = height / native_height
+        if abs(scale_x - 1) < SCALE_TOLERANCE and abs(scale_y - 1) < SCALE_TOLERANCE:
+            return template
+
+        scaled_template = self._scaled.get((key, width, height))
+        if scaled_template is None:
+            if (width, height) not in self._resolutions:
+                self._resolutions.add((width, height))
+                logger.info(f"Building templates for a window size of {width}x{height}")
+            scaled_template = self._build_scaled(template, width, height, scale=(scale_x, scale_y))
+            self._scaled[(key, width, height)] = scaled_template
+        return scaled_template
+
+    def _build_scaled(self, template: Template, width: int, height: int, scale: tuple[float, float]) -> Template:
+        """
+        Rescale a template for a window size, or read it from the disk cache if it was rescaled before.
+
+        Args:
+            template: The template at its native resolution.
+            width: The width of the window the template is searched in.
+            height: The height of the window the template is searched in.
+            scale: The factors to scale the template by on the x and y axis.
+
+        Returns:
+            The rescaled template.
+        """
+        cache_path = None
+        image = None
+        if self.cache_directory is not None:
+            relative_key = os.path.splitdrive(template.key)[1].lstrip("\\/")
+            cache_path = os.path.join(self.cache_directory, f"{width}x{height}", relative_key)
+            if os.path.isfile(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(template.key):
+                image = cv2.imread(cache_path, cv2.IMREAD_GRAYSCALE)
+
+        if image is None:
+            image = cv2.resize(
+                template.image,
+                (max(1, round(template.width * scale[0])), max(1, round(template.height * scale[1]))),
+                interpolation=cv2.INTER_AREA if scale[0] * scale[1] < 1 else cv2.INTER_CUBIC,
+            )
+            if cache_path is not None:
+                try:
+                    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                    cv2.imwrite(cache_path, image)
+                except (OSError, cv2.error) as exc:
+                    logger.opt(exception=exc).debug(f"Could not cache the rescaled template at {cache_path}")
+
+        return Template(
+            key=template.key,
+            image=image,
+            width=image.shape[1],
+            height=image.shape[0],
+            norm=float(numpy.linalg.norm(image.astype(numpy.float32))),
+        )
+
+    def get_downscaled(self, template: Template, level: int) -> numpy.ndarray:
+        """
+        Get a template image downscaled by 2 to the power of level, for coarse pyramid matching.
+
+        Args:
+            template: The template to downscale, either at its native resolution or rescaled to a window size.
+            level: The pyramid level, 1 for half the size, 2 for a quarter and so on.
+
+        Returns:
+            The downscaled gray-scale image, computed once per template and level.
+        """
+        cache_key = (template.key, template.width, template.height, level)
+        downscaled = self._downscaled.get(cache_key)
+        if downscaled is None:
+            scale = 2**level
+            downscaled = cv2.resize(
+                template.image,
+                (max(1, template.width // scale), max(1, template.height // scale)),
+                interpolation=cv2.INTER_AREA,
+            )
+            self._downscaled[cache_key] = downscaled
+        return downscaled
+
+    def _load(self, key: str) -> Template | None:
+        """
+        Read and decode a single image from disk and store it in the registry.
+
+        Args:
+            key: The relative or absolute path to the image.
+
+        Returns:
+            The template or None if the image could not be read.
+        """
+        start = time.perf_counter()
+        image = cv2.imread(key, cv2.IMREAD_GRAYSCALE)
+        self.statistics.load_time += time.perf_counter() - start
+
+        if image is None:
+            logger.warning(f"The image {key} does not exist on the system or we do not have permission to read it")
+            self.statistics.failed += 1
+            self.statistics.failed_keys.add(key)
+            return None
+
+        template = Template(
+            key=key,
+            image=image,
+            width=image.shape[1],
+            height=image.shape[0],
+            norm=float(numpy.linalg.norm(image.astype(numpy.float32))),
+        )
+        self._templates[key] = template
+        self.statistics.loaded += 1
+        return template
+
+    def log_statistics(self) -> None:
+        """
+        Log the current usage counters at debug level.
+        """
+        logger.debug(
+            f"Template registry: {self.statistics.loaded} loaded in {self.statistics.load_time * 1000:.1f}ms, "
+            f"{self.statistics.hits} hits, {self.statistics.misses} misses "
+            f"({self.statistics.get_hit_rate() * 100:.1f}% hit rate)"
+        )
+
+
+TEMPLATE_REGISTRY = TemplateRegistry()
@@ -0,0 +1,224 @@
+"""A cached view of where a window is on screen and how its pixels relate to the coordinates we work with."""
+import math
+import time
+
+from loguru import logger
+import numpy
+
+from tft_bot.constants import CONSTANTS
+from tft_bot.helpers.capture_helpers import CaptureBackend
+from tft_bot.helpers.capture_helpers import get_capture_backend
+from tft_bot.helpers.template_registry import CLIENT_NATIVE_RESOLUTION
+from tft_bot.helpers.template_registry import GAME_NATIVE_RESOLUTION
+
+# The window sizes every hardcoded coordinate and region is given in, per window title.
+# Windows without an entry are not scaled.
+WINDOW_NATIVE_RESOLUTIONS: dict[str, tuple[int, int]] = {
+    CONSTANTS["window_titles"]["game"]: GAME_NATIVE_RESOLUTION,
+    CONSTANTS["window_titles"]["client"]: CLIENT_NATIVE_RESOLUTION,
+}
+# The amount of seconds a located window is trusted before it is located again.
+VIEWPORT_TTL = 1.0
+
+
+class Viewport:
+    """
+    Caches where a window is and the factors to scale coordinates from its native resolution to its actual size.
+    The window is only located again once the cached geometry is older than the TTL, or after invalidate is called.
+    """
+
+    def __init__(self, window_title: str, ttl: float = VIEWPORT_TTL):
+        """
+        Args:
+            window_title: The title of the window.
+            ttl: The amount of seconds the located geometry is trusted for. Defaults to VIEWPORT_TTL.
+        """
+        self.window_title = window_title
+        self.ttl = ttl
+        self.bounding_box: tuple[int, int, int, int] | None = None
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.refreshes = 0
+        self.geometry_changes = 0
+        self._origin = numpy.zeros(2)
+        self._scale = numpy.ones(2)
+        self._refreshed_at = -math.inf
+        self._backend: CaptureBackend | None = None
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Locate the window again if the cached geometry is stale, the capture backend changed or it is forced to.
+
+        Args:
+            force: Whether to locate the window even if the cached geometry is still fresh. Defaults to False.
+
+        Returns:
+            True if the window exists, False otherwise.
+        """
+        backend = get_capture_backend()
+        if not force and backend is self._backend and time.perf_counter() - self._refreshed_at < self.ttl:
+            return self.bounding_box is not None
+
+        bounding_box = self._locate(backend)
+        self._backend = backend
+        self._refreshed_at = time.perf_counter()
+        self.refreshes += 1
+        if bounding_box != self.bounding_box:
+            self._set_geometry(bounding_box)
+        return self.bounding_box is not None
+
+    def invalidate(self) -> None:
+        """
+        Mark the cached geometry as stale, so the next access locates the window again.
+        """
+        self._refreshed_at = -math.inf
+
+    def _locate(self, backend: CaptureBackend) -> tuple[int, int, int, int] | None:
+        """
+        Locate the window.
+
+        Args:
+            backend: The capture backend that is currently active.
+
+        Returns:
+            The absolute bounding box of the window (min x, min y, max x, max y) or None if it does not exist.
+        """
+        bounding_box = backend.locate_window(self.window_title)
+        return tuple(bounding_box) if bounding_box else None
+
+    def _set_geometry(self, bounding_box: tuple[int, int, int, int] | None) -> None:
+        """
+        Store a new geometry and precompute the scale factors for it.
+
+        Args:
+            bounding_box: The new absolute bounding box of the window or None if it does not exist anymore.
+        """
+        if self.bounding_box is not None:
+            logger.debug(f"The geometry of {self.window_title} changed from {self.bounding_box} to {bounding_box}")
+        self.bounding_box = bounding_box
+        self.geometry_changes += 1
+        if bounding_box is None:
+            return
+
+        native_resolution = WINDOW_NATIVE_RESOLUTIONS.get(self.window_title)
+        if native_resolution is not None:
+            self.scale_x = (bounding_box[2] - bounding_box[0]) / native_resolution[0]
+            self.scale_y = (bounding_box[3] - bounding_box[1]) / native_resolution[1]
+        self._origin = numpy.array(bounding_box[:2])
+        self._scale = numpy.array((self.scale_x, self.scale_y))
+
+    def get_width(self) -> int:
+        """
+        Get the width of the window.
+
+        Returns:
+            The width in pixels, 0 if the window does not exist.
+        """
+        return self.bounding_box[2] - self.bounding_box[0] if self.bounding_box else 0
+
+    def get_height(self) -> int:
+        """
+        Get the height of the window.
+
+        Returns:
+            The height in pixels, 0 if the window does not exist.
+        """
+        return self.bounding_box[3] - self.bounding_box[1] if self.bounding_box else 0
+
+    def to_window(self, points: numpy.ndarray | list | tuple) -> numpy.ndarray:
+        """
+        Scale points from the native resolution of the window to its actual size.
+
+        Args:
+            points: A single x, y pair or an array of shape (N, 2) of them, in native coordinates.
+
+        Returns:
+            The points relative to the window, in the shape they were given in.
+        """
+        return (numpy.asarray(points) * self._scale).astype(int)
+
+    def to_absolute(self, points: numpy.ndarray | list | tuple) -> numpy.ndarray:
+        """
+        Transform points from the native resolution of the window to absolute screen coordinates.
+
+        Args:
+            points: A single x, y pair or an array of shape (N, 2) of them, in native coordinates.
+
+        Returns:
+            The absolute screen coordinates, in the shape they were given in.
+        """
+        return self.to_window(points) + self._origin.astype(int)
+
+    def scale_region(self, region: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
+        """
+        Scale a region from the native resolution of the window to its actual size.
+
+        Args:
+            region: The region as min x, min y, max x, max y, in native coordinates.
+
+        Returns:
+            The region relative to the window.
+        """
+        return (
+            int(region[0] * self.scale_x),
+            int(region[1] * self.scale_y),
+            int(region[2] * self.scale_x),
+            int(region[3] * self.scale_y),
+        )
+
+
+class HeadlessViewport(Viewport):
+    """
+    A viewport with a fixed geometry that never locates a window, to run detectors and clicks without a screen.
+    """
+
+    def __init__(self, window_title: str, bounding_box: tuple[int, int, int, int] | None):
+        """
+        Args:
+            window_title: The title of the window.
+            bounding_box: The absolute bounding box the window should have, or None if it should not exist.
+        """
+        super().__init__(window_title=window_title, ttl=math.inf)
+        self._fixed_bounding_box = bounding_box
+
+    def _locate(self, backend: CaptureBackend) -> tuple[int, int, int, int] | None:
+        return self._fixed_bounding_box
+
+
+_VIEWPORTS: dict[str, Viewport] = {}
+
+
+def get_viewport(window_title: str) -> Viewport | None:
+    """
+    Get the viewport of a window, locating it again only if the cached one is stale.
+
+    Args:
+        window_title: The title of the window.
+
+    Returns:
+        The viewport or None if the window does not exist.
+    """
+    viewport = _VIEWPORTS.get(window_title)
+    if viewport is None:
+        viewport = Viewport(window_title=window_title)
+        _VIEWPORTS[window_title] = viewport
+
+    return viewport if viewport.refresh() else None
+
+
+def set_viewport(viewport: Viewport) -> None:
+    """
+    Replace the viewport of a window, e.g. with a HeadlessViewport.
+
+    Args:
+        viewport: The viewport to use for its window from now on.
+    """
+    _VIEWPORTS[viewport.window_title] = viewport
+
+
+def invalidate_viewports() -> None:
+    """
+    Mark the geometry of every window as stale, so it is located again on next access.
+    """
+    for viewport in _VIEWPORTS.values():
+        viewport.invalidate()
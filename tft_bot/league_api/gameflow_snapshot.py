@@ -0,0 +1,104 @@
+"""
+A snapshot of the League client states the orchestrator checks on every pass, so back to back checks of the same
+state are answered with one request.
+"""
+import time
+from typing import Callable
+
+from loguru import logger
+
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import LcuEventStream
+from tft_bot.league_api.lcu_events import LOBBY_URI
+from tft_bot.league_api.lcu_events import READY_CHECK_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
+
+AVAILABILITY_URI = "/lol-gameflow/v1/availability"
+LOGIN_SESSION_URI = "/lol-login/v1/session"
+SNAPSHOT_URIS = (
+    GAMEFLOW_SESSION_URI,
+    LOBBY_URI,
+    SEARCH_STATE_URI,
+    READY_CHECK_URI,
+    AVAILABILITY_URI,
+    LOGIN_SESSION_URI,
+)
+
+
+class GameflowSnapshot:
+    """
+    Answers every state check from one fetch per endpoint within the TTL.
+    States pushed by the event stream are always preferred, since they are never stale.
+    """
+
+    def __init__(self, fetch: Callable[[str], dict | None], event_stream: LcuEventStream, ttl: float = 1.0):
+        """
+        Args:
+            fetch: Fetches the state of an endpoint over HTTP, None if it has no resource or there was an error.
+            event_stream: The event stream holding pushed states.
+            ttl: The amount of seconds a fetched state is used for. Defaults to 1.0.
+        """
+        self._fetch = fetch
+        self._event_stream = event_stream
+        self.ttl = ttl
+        self._states: dict[str, tuple[dict | None, float]] = {}
+        self.requests: dict[str, int] = {}
+        self.hits = 0
+        self.pushed_hits = 0
+
+    def get(self, uri: str) -> dict | None:
+        """
+        Get the state of an endpoint, fetching it only if nothing was pushed and the snapshot of it expired.
+
+        Args:
+            uri: The endpoint.
+
+        Returns:
+            The state or None if the endpoint has no resource right now or there was an error.
+        """
+        known, state = self._event_stream.get_state(uri)
+        if known:
+            self.pushed_hits += 1
+            return state
+
+        snapshot = self._states.get(uri)
+        if snapshot is not None and time.perf_counter() - snapshot[1] < self.ttl:
+            self.hits += 1
+            return snapshot[0]
+
+        state = self._fetch(uri)
+        self.requests[uri] = self.requests.get(uri, 0) + 1
+        self._states[uri] = (state, time.perf_counter())
+        return state
+
+    def invalidate(self, *uris: str) -> None:
+        """
+        Drop the snapshot of endpoints, so they are fetched again on next access. Call it after changing them.
+
+        Args:
+            *uris: The endpoints to drop. Defaults to none, meaning all.
+        """
+        if not uris:
+            self._states.clear()
+            return
+
+        for uri in uris:
+            self._states.pop(uri, None)
+
+    def get_request_count(self) -> int:
+        """
+        Get how many requests were made for all endpoints.
+
+        Returns:
+            The amount of requests.
+        """
+        return sum(self.requests.values())
+
+    def log_statistics(self) -> None:
+        """
+        Log how many requests were made and how many checks were answered without one.
+        """
+        logger.debug(
+            f"Gameflow snapshot: {self.get_request_count()} requests, {self.hits} snapshot hits, "
+            f"{self.pushed_hits} pushed state hits"
+        )
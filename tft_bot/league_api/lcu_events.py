@@ -0,0 +1,219 @@
+"""
+A subscription to the WAMP websocket of the League client, so state changes are pushed to us instead of polled.
+"""
+import base64
+import json
+import threading
+import time
+
+from loguru import logger
+
+try:
+    import websocket
+except ImportError:
+    # Without websocket-client every state is polled over HTTP, like it always was.
+    websocket = None
+
+GAMEFLOW_SESSION_URI = "/lol-gameflow/v1/session"
+LOBBY_URI = "/lol-lobby/v2/lobby"
+SEARCH_STATE_URI = "/lol-lobby/v2/lobby/matchmaking/search-state"
+READY_CHECK_URI = "/lol-matchmaking/v1/ready-check"
+SUBSCRIBED_URIS = (GAMEFLOW_SESSION_URI, LOBBY_URI, SEARCH_STATE_URI, READY_CHECK_URI)
+
+# WAMP 1.0 message types the League client speaks.
+WAMP_SUBSCRIBE = 5
+WAMP_EVENT = 8
+
+
+def get_event_name(uri: str) -> str:
+    """
+    Get the name of the event the League client pushes changes of an endpoint with.
+
+    Args:
+        uri: The endpoint, like "/lol-gameflow/v1/session".
+
+    Returns:
+        The event name, like "OnJsonApiEvent_lol-gameflow_v1_session".
+    """
+    return "OnJsonApiEvent" + uri.replace("/", "_")
+
+
+class LcuEventStream:
+    """
+    Keeps the latest pushed state of every subscribed endpoint, received on a background thread.
+    Endpoints nothing was pushed for yet are unknown, so they are fetched over HTTP until their first event.
+    """
+
+    def __init__(self, uris: tuple[str, ...] = SUBSCRIBED_URIS):
+        """
+        Args:
+            uris: The endpoints to subscribe to. Defaults to SUBSCRIBED_URIS.
+        """
+        self.uris = uris
+        self._connection: "websocket.WebSocket | None" = None
+        self._thread: threading.Thread | None = None
+        self._condition = threading.Condition()
+        self._states: dict[str, dict | None] = {}
+        self._generations: dict[str, int] = {}
+        self.events = 0
+
+    def connect(self, url: str, auth: tuple[str, str], certificate: str | bool = True) -> bool:
+        """
+        Open the websocket of a League client and subscribe to the events of every endpoint.
+
+        Args:
+            url: The HTTP URL of the League client API, like "https://127.0.0.1:1234".
+            auth: The user name and password of the API.
+            certificate: The certificate to verify the client with, or a bool like requests takes it. Defaults to True.
+
+        Returns:
+            True if we are subscribed, False if states have to be polled.
+        """
+        self.close()
+        if websocket is None:
+            logger.debug("websocket-client is not installed, polling the League client instead")
+            return False
+
+        websocket_url = "ws" + url.removeprefix("http")
+        credentials = base64.b64encode(f"{auth[0]}:{auth[1]}".encode()).decode()
+        ssl_options = {"check_hostname": False}
+        if isinstance(certificate, str):
+            ssl_options["ca_certs"] = certificate
+        elif not certificate:
+            ssl_options["cert_reqs"] = 0
+        try:
+            connection = websocket.create_connection(
+                websocket_url, header=[f"Authorization: Basic {credentials}"], sslopt=ssl_options, timeout=5
+            )
+            for uri in self.uris:
+                connection.send(json.dumps([WAMP_SUBSCRIBE, get_event_name(uri)]))
+        except (websocket.WebSocketException, OSError) as exc:
+            logger.opt(exception=exc).warning("Could not subscribe to League client events, polling instead")
+            return False
+
+        with self._condition:
+            self._connection = connection
+            self._states.clear()
+        self._thread = threading.Thread(
+            target=self._receive_events, args=(connection,), name="lcu_event_stream", daemon=True
+        )
+        self._thread.start()
+        logger.debug(f"Subscribed to League client events of {', '.join(self.uris)}")
+        return True
+
+    def _receive_events(self, connection: "websocket.WebSocket") -> None:
+        """
+        Receive events until the websocket closes, then fall back to polling.
+
+        Args:
+            connection: The websocket to receive from.
+        """
+        while self._connection is connection:
+            try:
+                message = connection.recv()
+                if message:
+                    self._handle_message(message)
+            except websocket.WebSocketTimeoutException:
+                continue
+            except (websocket.WebSocketException, OSError):
+                break
+            except Exception as exc:
+                # A dead event thread would keep serving the last pushed states as if they were current.
+                logger.opt(exception=exc).warning("Could not handle a League client event")
+                break
+
+        with self._condition:
+            if self._connection is connection:
+                logger.warning("The League client event stream closed, polling instead")
+                self._connection = None
+                self._states.clear()
+            self._condition.notify_all()
+
+    def _handle_message(self, message: str) -> None:
+        """
+        Store the state an event carries.
+
+        Args:
+            message: The raw WAMP message.
+        """
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            return
+        if not isinstance(payload, list) or len(payload) < 3 or payload[0] != WAMP_EVENT:
+            return
+
+        event = payload[2]
+        if not isinstance(event, dict):
+            return
+
+        uri = event.get("uri")
+        if uri not in self.uris:
+            return
+
+        data = None if event.get("eventType") == "Delete" else event.get("data")
+        with self._condition:
+            self._states[uri] = data
+            self._generations[uri] = self._generations.get(uri, 0) + 1
+            self.events += 1
+            self._condition.notify_all()
+
+    def is_connected(self) -> bool:
+        """
+        Check if we are subscribed to the events.
+
+        Returns:
+            True if the websocket is open, False if not.
+        """
+        return self._connection is not None
+
+    def get_state(self, uri: str) -> tuple[bool, dict | None]:
+        """
+        Get the latest pushed state of an endpoint.
+
+        Args:
+            uri: The endpoint.
+
+        Returns:
+            Whether a state was pushed, and the state, None if the endpoint has no resource right now.
+        """
+        with self._condition:
+            if self._connection is None or uri not in self._states:
+                return False, None
+            return True, self._states[uri]
+
+    def wait_for_change(self, timeout: float, uris: tuple[str, ...] | None = None) -> bool:
+        """
+        Wait until an event changes the state of an endpoint. Without a subscription this just sleeps.
+
+        Args:
+            timeout: The amount of seconds to wait at most.
+            uris: The endpoints to wait for. Defaults to None, meaning any subscribed one.
+
+        Returns:
+            True if a state changed, False if the timeout passed or there is no subscription.
+        """
+        uris = uris or self.uris
+        with self._condition:
+            if self._connection is not None:
+                generations = [self._generations.get(uri, 0) for uri in uris]
+                changed = self._condition.wait_for(
+                    lambda: self._connection is None or [self._generations.get(uri, 0) for uri in uris] != generations,
+                    timeout=timeout,
+                )
+                return changed and self._connection is not None
+
+        time.sleep(timeout)
+        return False
+
+    def close(self) -> None:
+        """
+        Close the websocket, so states are polled again.
+        """
+        with self._condition:
+            connection = self._connection
+            self._connection = None
+            self._states.clear()
+            self._condition.notify_all()
+        if connection is not None:
+            connection.close()
@@ -10,6 +10,15 @@ import requests
 from requests import HTTPError
 
 from tft_bot import config
+from tft_bot.league_api.gameflow_snapshot import AVAILABILITY_URI
+from tft_bot.league_api.gameflow_snapshot import GameflowSnapshot
+from tft_bot.league_api.gameflow_snapshot import LOGIN_SESSION_URI
+from tft_bot.league_api.lcu_events import GAMEFLOW_SESSION_URI
+from tft_bot.league_api.lcu_events import LcuEventStream
+from tft_bot.league_api.lcu_events import LOBBY_URI
+from tft_bot.league_api.lcu_events import READY_CHECK_URI
+from tft_bot.league_api.lcu_events import SEARCH_STATE_URI
+from tft_bot.league_api.live_client_snapshot import LiveClientSnapshot
 
 # Potentially make this configurable in the future
 # to let the user select their preferred tft mode.
@@ -86,6 +95,8 @@ class LCUIntegration:
     Integrates the bot with League Client Update (LCU) API.
     Note that the API is allowed to use, but not officially supported by Rito.
     The endpoints we use are stable-ish, and we do not expect them to change soonTM.
+    The lobby, queue and gameflow states are pushed over the LCU websocket when possible, else they are polled.
+    Polled states are kept in a snapshot for a short TTL, so back to back checks share one request.
     """
 
     def __init__(self):
@@ -98,8 +109,60 @@ class LCUIntegration:
         )
         self._session.verify = "tft_bot/resources/riotgames_root_certificate.pem"
         self._url = None
+        self._event_stream = LcuEventStream()
+        self.gameflow = GameflowSnapshot(fetch=self._fetch_state, event_stream=self._event_stream)
         self.install_directory = None
 
+    def set_connection(self, url: str, auth_token: str) -> None:
+        """
+        Point the integration at a LCU API, closing the event subscription and dropping the snapshot
+        of the previous one.
+
+        Args:
+            url: The URL of the API, like "https://127.0.0.1:1234".
+            auth_token: The remoting auth token of the API.
+        """
+        self._event_stream.close()
+        self.gameflow.invalidate()
+        self.gameflow.ttl = config.get_client_state_ttl()
+        self._url = url
+        self._session.auth = ("riot", auth_token)
+
+    def subscribe_to_events(self) -> bool:
+        """
+        Subscribe to the lobby, queue and gameflow events of the LCU. Should only be called after connecting.
+
+        Returns:
+            True if states are pushed from now on, False if they are polled.
+        """
+        return self._event_stream.connect(url=self._url, auth=self._session.auth, certificate=self._session.verify)
+
+    def wait_for_event(self, timeout: float, uris: tuple[str, ...] | None = None) -> bool:
+        """
+        Wait until the LCU pushes a state change. Without an event subscription this just sleeps for the timeout.
+
+        Args:
+            timeout: The amount of seconds to wait at most.
+            uris: The endpoints to wait for a change of. Defaults to None, meaning any subscribed one.
+
+        Returns:
+            True if a state changed, False if the timeout passed.
+        """
+        return self._event_stream.wait_for_change(timeout=timeout, uris=uris)
+
+    def _fetch_state(self, uri: str) -> dict | None:
+        """
+        Fetch the state of an endpoint over HTTP.
+
+        Args:
+            uri: The endpoint.
+
+        Returns:
+            The state or None if the endpoint has no resource right now or there was an error.
+        """
+        response = _http_error_wrapper(self._session.get, url=f"{self._url}{uri}")
+        return response.json() if response is not None else None
+
     def connect_to_lcu(self, wait_for_availability: bool = False) -> bool:
         """
         Connect to the LCU client. Searches for the process and creates a session.
@@ -129,8 +192,10 @@ class LCUIntegration:
         logger.debug("LCUx process found")
         process_arguments = _get_lcu_commandline_arguments(lcu_process)
         self.install_directory = process_arguments["install-directory"]
-        self._url = f"https://127.0.0.1:{process_arguments['app-port']}"
-        self._session.auth = ("riot", process_arguments["remoting-auth-token"])
+        self.set_connection(
+            url=f"https://127.0.0.1:{process_arguments['app-port']}",
+            auth_token=process_arguments["remoting-auth-token"],
+        )
 
         connect_timeout = config.get_timeout(config.Timeout.CLIENT_CONNECT, 60)
         logger.info(f"League client found, trying to connect to it (~{connect_timeout}s timeout)")
@@ -151,6 +216,8 @@ class LCUIntegration:
                 timeout += 1
 
         logger.info("Successfully connected to the League client")
+        if not self.subscribe_to_events():
+            logger.info("Polling the League client for lobby, queue and game changes")
 
         if wait_for_availability:
             try:
@@ -188,12 +255,12 @@ class LCUIntegration:
             True if we are in a lobby of the type we want, False if not.
 
         """
-        get_lobby_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-lobby/v2/lobby")
+        lobby = self.gameflow.get(LOBBY_URI)
 
-        if not get_lobby_response:
+        if not lobby:
             return False
 
-        return get_lobby_response.json()["gameConfig"]["queueId"] == TFT_NORMAL_GAME_QUEUE_ID
+        return lobby["gameConfig"]["queueId"] == TFT_NORMAL_GAME_QUEUE_ID
 
     def create_lobby(self) -> bool:
         """
@@ -207,6 +274,7 @@ class LCUIntegration:
         create_lobby_response = _http_error_wrapper(
             self._session.post, url=f"{self._url}/lol-lobby/v2/lobby", json={"queueId": TFT_NORMAL_GAME_QUEUE_ID}
         )
+        self.gameflow.invalidate(LOBBY_URI, SEARCH_STATE_URI)
 
         return create_lobby_response is not None and create_lobby_response.status_code == 200
 
@@ -216,6 +284,7 @@ class LCUIntegration:
         """
         logger.info("Closing the lobby because it seems we got stuck")
         _http_error_wrapper(self._session.delete, url=f"{self._url}/lol-lobby/v2/lobby")
+        self.gameflow.invalidate(LOBBY_URI, SEARCH_STATE_URI)
 
     def start_queue(self) -> bool:
         """
@@ -229,6 +298,7 @@ class LCUIntegration:
         start_queue_response = _http_error_wrapper(
             self._session.post, url=f"{self._url}/lol-lobby/v2/lobby/matchmaking/search"
         )
+        self.gameflow.invalidate(SEARCH_STATE_URI)
         return start_queue_response is not None and start_queue_response.status_code == 204
 
     def in_queue(self) -> bool:
@@ -240,19 +310,12 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we are already in a queue")
-        get_queue_response = _http_error_wrapper(
-            self._session.get, url=f"{self._url}/lol-lobby/v2/lobby/matchmaking/search-state"
-        )
+        search_state = self.gameflow.get(SEARCH_STATE_URI)
 
-        return (
-            get_queue_response is not None
-            and get_queue_response.status_code is not None
-            and get_queue_response.json()["searchState"]
-            in {
-                "Searching",
-                "Found",
-            }
-        )
+        return search_state is not None and search_state["searchState"] in {
+            "Searching",
+            "Found",
+        }
 
     def found_queue(self) -> bool:
         """
@@ -263,11 +326,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we have found a match")
-        get_queue_response = _http_error_wrapper(
-            self._session.get, url=f"{self._url}/lol-lobby/v2/lobby/matchmaking/search-state"
-        )
+        search_state = self.gameflow.get(SEARCH_STATE_URI)
 
-        return get_queue_response is not None and get_queue_response.json()["searchState"] == "Found"
+        return search_state is not None and search_state["searchState"] == "Found"
 
     def queue_accepted(self) -> bool:
         """
@@ -278,9 +339,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we already accepted the queue")
-        ready_check_state = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-matchmaking/v1/ready-check")
+        ready_check_state = self.gameflow.get(READY_CHECK_URI)
 
-        return ready_check_state is not None and ready_check_state.json()["playerResponse"] == "Accepted"
+        return ready_check_state is not None and ready_check_state["playerResponse"] == "Accepted"
 
     def accept_queue(self) -> None:
         """
@@ -288,6 +349,7 @@ class LCUIntegration:
         """
         logger.info("Match ready, accepting the queue")
         _http_error_wrapper(self._session.post, url=f"{self._url}/lol-matchmaking/v1/ready-check/accept")
+        self.gameflow.invalidate(READY_CHECK_URI)
 
     def in_game(self) -> bool:
         """
@@ -298,9 +360,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we are in a game")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-gameflow/v1/session")
+        session = self.gameflow.get(GAMEFLOW_SESSION_URI)
 
-        return session_response is not None and session_response.json()["phase"] in {
+        return session is not None and session["phase"] in {
             "ChampSelect",
             "GameStart",
             "InProgress",
@@ -316,9 +378,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if we should reconnect")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-gameflow/v1/session")
+        session = self.gameflow.get(GAMEFLOW_SESSION_URI)
 
-        return session_response is not None and session_response.json()["phase"] == "Reconnect"
+        return session is not None and session["phase"] == "Reconnect"
 
     def reconnect(self) -> None:
         """
@@ -326,6 +388,7 @@ class LCUIntegration:
         """
         logger.debug("Reconnecting to game")
         _http_error_wrapper(self._session.post, url=f"{self._url}/lol-gameflow/v1/reconnect")
+        self.gameflow.invalidate(GAMEFLOW_SESSION_URI)
 
     def session_expired(self) -> bool:
         """
@@ -336,9 +399,9 @@ class LCUIntegration:
 
         """
         logger.debug("Checking if our login session is expired")
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-login/v1/session")
+        login_session = self.gameflow.get(LOGIN_SESSION_URI)
 
-        return session_response.json()["error"] if session_response is not None else None
+        return login_session["error"] if login_session is not None else None
 
     def client_connected(self) -> bool:
         """
@@ -349,14 +412,8 @@ class LCUIntegration:
         """
         logger.debug("Checking if the client is connected")
         try:
-            availability_response = _http_error_wrapper(
-                self._session.get, url=f"{self._url}/lol-gameflow/v1/availability"
-            )
-            if (
-                availability_response is not None
-                and availability_response.status_code == 200
-                and availability_response.json()["isAvailable"]
-            ):
+            availability = self.gameflow.get(AVAILABILITY_URI)
+            if availability is not None and availability["isAvailable"]:
                 return True
         except (requests.exceptions.RequestException, requests.exceptions.ConnectionError):
             logger.warning("Can't determine client was available")
@@ -371,9 +428,9 @@ class LCUIntegration:
             The PUUID as a string or None if there was an issue getting it.
 
         """
-        session_response = _http_error_wrapper(self._session.get, url=f"{self._url}/lol-login/v1/session")
+        login_session = self.gameflow.get(LOGIN_SESSION_URI)
 
-        return None if not session_response else session_response.json()["puuid"]
+        return None if not login_session else login_session["puuid"]
 
     # obsolete
     # def get_win_rate(self, number_of_games: int) -> str:
@@ -410,7 +467,6 @@ class LCUIntegration:
     #         if player["placement"] <= 4:
     #             wins += 1
 
-
     #     return f"{(wins / games_played) * 100:.2f}"
 
     def get_last_game_outcome(self) -> bool:
@@ -434,12 +490,12 @@ class LCUIntegration:
             return "ERROR"
 
         games = matches_response.json()["games"]
-        
+
         for game in games:
             player = [player for player in game["json"]["participants"] if player["puuid"] == player_uid][0]
             if player["placement"] <= 4:
                 return True
-        
+
         return False
 
     def get_win_rate(self, WIN: int, LOSS: int) -> tuple | str:
@@ -449,13 +505,13 @@ class LCUIntegration:
         Args:
         WIN: The amount of games we won
         LOSS: The amount of games we lost
-    
+
         Returns:
         tuple:
         [0] string with human-readable percentage of our winrate
         [1] int of total games won
         [2] int of total games lost
-        
+
         or string "ERROR" if the API didn't work
         """
         outcome = self.get_last_game_outcome()
@@ -470,15 +526,21 @@ class LCUIntegration:
 
         return (f"{(WIN / (WIN + LOSS)) * 100:.2f}", WIN, LOSS)
 
+
 class GameClientIntegration:
     """
     Class to integrate with the official Rito Game Client API.
     Sadly the TFT endpoint is re-using the normal League data format.
     At the moment the only useful data returned are the player health and the player level.
+    Every check is answered from the per-iteration snapshot in live_data.
     """
 
-    def __init__(self):
-        self._url = "https://127.0.0.1:2999"
+    def __init__(self, url: str = "https://127.0.0.1:2999"):
+        """
+        Args:
+            url: The URL of the API. Defaults to the one of the game client.
+        """
+        self._url = url
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -487,6 +549,20 @@ class GameClientIntegration:
             }
         )
         self._session.verify = "tft_bot/resources/riotgames_root_certificate.pem"
+        self.live_data = LiveClientSnapshot(fetch=self._fetch)
+
+    def _fetch(self, uri: str) -> dict | None:
+        """
+        Fetch an endpoint of the API.
+
+        Args:
+            uri: The endpoint, including any query.
+
+        Returns:
+            The response data or None if there was an error.
+        """
+        response = _http_error_wrapper(self._session.get, url=f"{self._url}{uri}")
+        return response.json() if response is not None else None
 
     def wait_for_game_window(
         self, lcu_integration: LCUIntegration, timeout: int, connection_error_counter: int = 0
@@ -533,8 +609,7 @@ class GameClientIntegration:
         """
         logger.debug("Checking if the game has loaded")
 
-        event_data_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/eventdata")
-        return event_data_response is not None and len(event_data_response.json()["Events"]) > 0
+        return len(self.live_data.get_events()) > 0
 
     def is_dead(self) -> bool:
         """
@@ -546,12 +621,12 @@ class GameClientIntegration:
         """
         logger.debug("Checking if we have more than 0 HP")
 
-        active_player_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/activeplayer")
-        if not active_player_response:
+        active_player = self.live_data.get_active_player()
+        if not active_player:
             logger.debug("There was an error in the response, assuming that we are dead")
             return True
 
-        return active_player_response.json()["championStats"]["currentHealth"] <= 0.0
+        return active_player["championStats"]["currentHealth"] <= 0.0
 
     def get_level(self) -> int:
         """
@@ -561,9 +636,22 @@ class GameClientIntegration:
             The level of the active player.
         """
 
-        active_player_response = _http_error_wrapper(self._session.get, url=f"{self._url}/liveclientdata/activeplayer")
-        if not active_player_response:
+        active_player = self.live_data.get_active_player()
+        if not active_player:
             logger.debug("There was an error in the response, assuming that we are level 0")
             return 0
 
-        return active_player_response.json().get("level", 0)
+        return active_player.get("level", 0)
+
+    def get_gold(self) -> int | None:
+        """
+        Get the gold the player currently has.
+
+        Returns:
+            The gold of the active player or None if the API does not expose it.
+        """
+        active_player = self.live_data.get_active_player()
+        if not active_player or active_player.get("currentGold") is None:
+            return None
+
+        return int(active_player["currentGold"])
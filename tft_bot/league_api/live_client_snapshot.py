@@ -0,0 +1,113 @@
+"""
+A snapshot of the live client data of the running game, so every check of a game loop iteration shares one request.
+"""
+import time
+from typing import Callable
+
+from loguru import logger
+
+ALL_GAME_DATA_URI = "/liveclientdata/allgamedata"
+EVENT_DATA_URI = "/liveclientdata/eventdata"
+
+
+class LiveClientSnapshot:
+    """
+    Hands out one shared copy of /liveclientdata/allgamedata until it gets stale.
+    The copy is stale once it is older than max_age or after invalidate, which is called at the start of each
+    game loop iteration. Events are accumulated by their EventID, so each one is only transferred once.
+    """
+
+    def __init__(self, fetch: Callable[[str], dict | None], max_age: float = 1.0):
+        """
+        Args:
+            fetch: Fetches an endpoint of the live client, None if there was an error.
+            max_age: The amount of seconds the game data may be re-used for. Defaults to 1.0.
+        """
+        self._fetch = fetch
+        self.max_age = max_age
+        self._game_data: dict | None = None
+        self._fetched_at: float | None = None
+        self.events: list[dict] = []
+        self.fetches = 0
+        self.event_fetches = 0
+        self.reuses = 0
+
+    def get_game_data(self) -> dict | None:
+        """
+        Get the current game data, fetching it if there is no fresh copy.
+
+        Returns:
+            The game data or None if the live client did not answer.
+        """
+        if self._fetched_at is not None and time.perf_counter() - self._fetched_at < self.max_age:
+            self.reuses += 1
+            return self._game_data
+
+        self._game_data = self._fetch(ALL_GAME_DATA_URI)
+        self._fetched_at = time.perf_counter()
+        self.fetches += 1
+        if self._game_data is not None:
+            self._add_events(self._game_data.get("events", {}).get("Events", []))
+        return self._game_data
+
+    def get_active_player(self) -> dict | None:
+        """
+        Get the data of the active player from the current game data.
+
+        Returns:
+            The active player or None if the live client did not answer.
+        """
+        game_data = self.get_game_data()
+        return game_data.get("activePlayer") if game_data is not None else None
+
+    def get_events(self) -> list[dict]:
+        """
+        Get every event of the game so far. Without fresh game data, only the events after the last one seen are
+        fetched.
+
+        Returns:
+            The events, ordered by their EventID.
+        """
+        if self._fetched_at is not None and time.perf_counter() - self._fetched_at < self.max_age:
+            self.reuses += 1
+            return self.events
+
+        next_event_id = self.events[-1]["EventID"] + 1 if self.events else 0
+        event_data = self._fetch(f"{EVENT_DATA_URI}?eventID={next_event_id}")
+        self.event_fetches += 1
+        if event_data is not None:
+            self._add_events(event_data.get("Events", []))
+        return self.events
+
+    def _add_events(self, events: list[dict]) -> None:
+        """
+        Add the events that were not seen yet.
+
+        Args:
+            events: The events the live client returned, ordered by their EventID.
+        """
+        last_event_id = self.events[-1]["EventID"] if self.events else -1
+        self.events.extend(event for event in events if event.get("EventID", -1) > last_event_id)
+
+    def invalidate(self) -> None:
+        """
+        Mark the game data as stale, so the next check fetches it again.
+        """
+        self._fetched_at = None
+
+    def reset(self) -> None:
+        """
+        Forget the game data and events, called when a new game starts.
+        """
+        self.invalidate()
+        self._game_data = None
+        self.events.clear()
+
+    def log_statistics(self) -> None:
+        """
+        Log how many times the game data and events were fetched and how often they were shared instead.
+        """
+        logger.debug(
+            f"Live client snapshot: {self.fetches} game data fetches, {self.event_fetches} event fetches, "
+            f"{self.reuses} re-uses"
+        )